@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline image bundles for sites with little or no bandwidth.
+
+A bundle is a directory holding the compressed output of `docker save` and a
+nova-bundle.json manifest with the image identity, its platform and the
+SHA-256 of the compressed file. Bundles built for another platform (e.g.,
+an amd64 image on a Raspberry Pi) are never picked up or imported. Export
+streams `docker save` through the compressor, and import streams the
+decompressed tar straight into `docker load` without an intermediate file.
+The checksum is verified before `docker load` receives end-of-input; on a
+mismatch the load is killed so nothing is committed.
+
+zstd is used when the optional `zstandard` package is installed, gzip
+otherwise.
+
+Usage:
+    python bundles.py export-bundle /Volumes/USB [--compression gzip|zstd]
+    python bundles.py import-bundle /Volumes/USB
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import string
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from config import (
+    APP_VERSION,
+    DOCKER_IMAGE_FULL,
+    BUNDLE_DIR,
+    BUNDLE_MANIFEST_NAME,
+    BUNDLE_CHUNK_SIZE,
+    BUNDLE_PROGRESS_INTERVAL,
+    DOCKER_INFO_TIMEOUT,
+    NOVA_DIR,
+)
+from docker_ops import (
+    command_env,
+    run_command,
+    get_compose_image_ref,
+    get_host_platform,
+    get_local_image_digest,
+    load_launcher_prefs,
+    save_launcher_prefs,
+    select_platform_manifest,
+    start_container,
+)
+from utils import _subprocess_flags, format_bytes
+
+ProgressCallback = Callable[[int, Optional[int], float], None]
+
+
+class _HashingWriter:
+    """File-like wrapper that hashes and counts everything written through it."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.count = 0
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.count += len(data)
+        return self.raw.write(data)
+
+    def flush(self) -> None:
+        self.raw.flush()
+
+
+class _HashingReader:
+    """File-like wrapper that hashes and counts everything read through it."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.sha256.update(data)
+        self.count += len(data)
+        return data
+
+    def readable(self) -> bool:
+        return True
+
+
+class _Throttle:
+    """Rate-limit progress callbacks to BUNDLE_PROGRESS_INTERVAL."""
+
+    def __init__(self, progress: Optional[ProgressCallback]):
+        self.progress = progress
+        self.started = time.monotonic()
+        self.last = 0.0
+
+    def report(self, done: int, total: Optional[int], force: bool = False) -> None:
+        if self.progress is None:
+            return
+        now = time.monotonic()
+        if force or now - self.last >= BUNDLE_PROGRESS_INTERVAL:
+            self.last = now
+            self.progress(done, total, now - self.started)
+
+
+def _popen_docker(args: list, **kwargs) -> subprocess.Popen:
+    return subprocess.Popen(
+        args,
+        cwd=NOVA_DIR if os.path.isdir(NOVA_DIR) else None,
+        env=command_env(),
+        creationflags=_subprocess_flags(),
+        **kwargs,
+    )
+
+
+def format_throughput(done: int, elapsed: float) -> str:
+    """Format transferred bytes and rate for display (e.g., "1.2 GB at 48.0 MB/s")."""
+    rate = done / elapsed if elapsed > 0 else 0
+    return f"{format_bytes(done)} at {format_bytes(rate)}/s"
+
+
+def read_bundle_manifest(bundle_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a bundle manifest.
+
+    Args:
+        bundle_dir: Directory containing nova-bundle.json
+
+    Returns:
+        Manifest dict, or None if missing, unreadable or its image file is absent
+    """
+    try:
+        with open(os.path.join(bundle_dir, BUNDLE_MANIFEST_NAME), "r") as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, PermissionError, OSError):
+        return None
+    if not os.path.isfile(os.path.join(bundle_dir, manifest.get("file", ""))):
+        return None
+    return manifest
+
+
+def bundle_matches_host(manifest: Dict[str, Any], host: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Check whether a bundle's image runs on the managed daemon.
+
+    Args:
+        manifest: Bundle manifest (see read_bundle_manifest)
+        host: Platform to check against (defaults to get_host_platform())
+
+    Returns:
+        True if the recorded platform matches, with the same variant rules
+        as image indexes; False for bundles that record no platform
+    """
+    platform_info = manifest.get("platform")
+    if not isinstance(platform_info, dict):
+        return False
+    entry = {"digest": manifest.get("image_id") or "bundle", "platform": platform_info}
+    return select_platform_manifest({"manifests": [entry]}, host or get_host_platform()) is not None
+
+
+def export_bundle(
+    dest_dir: str,
+    compression: str = "auto",
+    progress: Optional[ProgressCallback] = None,
+) -> Tuple[bool, str]:
+    """
+    Export the local Nova image as a compressed bundle.
+
+    Args:
+        dest_dir: Directory to write the bundle into (e.g., a USB stick)
+        compression: "zstd", "gzip" or "auto" (zstd when available)
+        progress: Optional callback receiving (bytes_read, total_or_None, elapsed)
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    if compression == "auto":
+        compression = "zstd" if zstandard is not None else "gzip"
+    if compression == "zstd" and zstandard is None:
+        return False, "zstd compression requires the 'zstandard' package"
+
+    stdout, _, rc = run_command(
+        ["docker", "image", "inspect", DOCKER_IMAGE_FULL,
+         "--format", "{{.Id}}|{{.Os}}|{{.Architecture}}|{{.Variant}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    image_id, image_os, image_arch, image_variant = (stdout.split("|") + [""] * 4)[:4]
+    if rc != 0 or not image_id:
+        return False, f"Image not found locally: {DOCKER_IMAGE_FULL}"
+
+    extension = "zst" if compression == "zstd" else "gz"
+    filename = f"nova-dso-tracker-{image_id.replace('sha256:', '')[:12]}.tar.{extension}"
+    target = os.path.join(dest_dir, filename)
+    partial = target + ".partial"
+
+    try:
+        os.makedirs(dest_dir, exist_ok=True)
+        throttle = _Throttle(progress)
+        proc = _popen_docker(
+            ["docker", "save", DOCKER_IMAGE_FULL],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        uncompressed = 0
+        with open(partial, "wb") as raw:
+            hashed = _HashingWriter(raw)
+            if compression == "zstd":
+                compressor = zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(
+                    hashed, closefd=False)
+            else:
+                compressor = gzip.GzipFile(fileobj=hashed, mode="wb", compresslevel=6)
+            with compressor:
+                for chunk in iter(lambda: proc.stdout.read(BUNDLE_CHUNK_SIZE), b""):
+                    compressor.write(chunk)
+                    uncompressed += len(chunk)
+                    throttle.report(uncompressed, None)
+        stderr = proc.stderr.read().decode(errors="replace").strip()
+        if proc.wait() != 0:
+            os.remove(partial)
+            return False, stderr or "docker save failed"
+        throttle.report(uncompressed, uncompressed, force=True)
+
+        os.replace(partial, target)
+        manifest = {
+            "image": DOCKER_IMAGE_FULL,
+            "image_id": image_id,
+            "platform": {"os": image_os, "architecture": image_arch, "variant": image_variant},
+            "repo_digest": get_local_image_digest(),
+            "file": filename,
+            "compression": compression,
+            "sha256": hashed.sha256.hexdigest(),
+            "compressed_bytes": hashed.count,
+            "uncompressed_bytes": uncompressed,
+            "created": time.time(),
+            "launcher_version": APP_VERSION,
+        }
+        with open(os.path.join(dest_dir, BUNDLE_MANIFEST_NAME), "w") as f:
+            json.dump(manifest, f, indent=2)
+    except (PermissionError, OSError) as e:
+        if os.path.exists(partial):
+            os.remove(partial)
+        return False, f"Export failed: {e}"
+
+    return True, (f"Exported {format_bytes(uncompressed)} image as "
+                  f"{format_bytes(hashed.count)} {compression} bundle")
+
+
+def import_bundle(
+    bundle_dir: str,
+    progress: Optional[ProgressCallback] = None,
+) -> Tuple[bool, str]:
+    """
+    Stream-decompress a bundle into `docker load`, verifying its checksum.
+
+    Args:
+        bundle_dir: Directory containing nova-bundle.json
+        progress: Optional callback receiving (bytes_read, total_bytes, elapsed)
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    manifest = read_bundle_manifest(bundle_dir)
+    if manifest is None:
+        return False, f"No valid bundle found in {bundle_dir}"
+    if manifest.get("compression") == "zstd" and zstandard is None:
+        return False, "This bundle is zstd-compressed; install the 'zstandard' package"
+    if not bundle_matches_host(manifest):
+        host = get_host_platform()
+        bundle_platform = manifest.get("platform") or {}
+        return False, (f"This bundle holds a {bundle_platform.get('os', '?')}/"
+                       f"{bundle_platform.get('architecture', '?')} image, but Docker here runs "
+                       f"{host['os']}/{host['architecture']} images; export one on a matching machine")
+
+    path = os.path.join(bundle_dir, manifest["file"])
+    total = os.path.getsize(path)
+    throttle = _Throttle(progress)
+
+    proc = _popen_docker(
+        ["docker", "load"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        with open(path, "rb") as raw:
+            hashed = _HashingReader(raw)
+            if manifest.get("compression") == "zstd":
+                decompressor = zstandard.ZstdDecompressor().stream_reader(hashed, closefd=False)
+            else:
+                decompressor = gzip.GzipFile(fileobj=hashed, mode="rb")
+            with decompressor:
+                for chunk in iter(lambda: decompressor.read(BUNDLE_CHUNK_SIZE), b""):
+                    proc.stdin.write(chunk)
+                    throttle.report(hashed.count, total)
+            # Hash any trailing bytes the decompressor did not consume
+            while hashed.read(BUNDLE_CHUNK_SIZE):
+                pass
+    except Exception as e:
+        # Broken pipe from docker load, or corrupt compressed data
+        proc.kill()
+        _, stderr = proc.communicate()
+        return False, stderr.decode(errors="replace").strip() or f"Import failed: {e}"
+
+    throttle.report(hashed.count, total, force=True)
+    if hashed.sha256.hexdigest() != manifest.get("sha256"):
+        # docker load has not seen end-of-input yet, so killing it discards the image
+        proc.kill()
+        proc.communicate()
+        return False, "Bundle checksum mismatch - the file is corrupt or incomplete"
+
+    # communicate() closes stdin, which lets docker load commit the image
+    stdout, stderr = proc.communicate()
+    if proc.returncode != 0:
+        return False, stderr.decode(errors="replace").strip() or "docker load failed"
+
+    # The compose file runs the mirror's reference when one is configured;
+    # without that tag an offline start would try to pull it
+    compose_ref = get_compose_image_ref()
+    if compose_ref != DOCKER_IMAGE_FULL:
+        _, stderr, rc = run_command(["docker", "tag", DOCKER_IMAGE_FULL, compose_ref],
+                                    timeout=DOCKER_INFO_TIMEOUT)
+        if rc != 0:
+            return False, stderr or f"Failed to tag {compose_ref}"
+
+    # docker save/load does not carry RepoDigests; remember it for version checks
+    if manifest.get("repo_digest"):
+        prefs = load_launcher_prefs()
+        imported = prefs.get("imported_digests", {})
+        imported[manifest["image_id"]] = manifest["repo_digest"]
+        prefs["imported_digests"] = imported
+        save_launcher_prefs(prefs)
+
+    return True, f"Imported {manifest.get('image', DOCKER_IMAGE_FULL)} from bundle"
+
+
+def _removable_roots() -> list:
+    """Mount points where a USB stick is likely to appear."""
+    if sys.platform == "darwin":
+        return glob.glob("/Volumes/*")
+    if sys.platform == "win32":
+        return [f"{letter}:\\" for letter in string.ascii_uppercase[3:]
+                if os.path.exists(f"{letter}:\\")]
+    user = os.environ.get("USER", "")
+    return (glob.glob(f"/media/{user}/*") + glob.glob(f"/run/media/{user}/*")
+            + glob.glob("/media/*") + glob.glob("/mnt/*"))
+
+
+def find_bundle() -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Look for a bundle in BUNDLE_DIR and on removable media.
+
+    Both the root of each volume and a "nova-bundle" folder on it are checked.
+    Bundles for another platform than the managed daemon's are skipped.
+
+    Returns:
+        Tuple of (bundle_dir, manifest) for the newest bundle found, or None
+    """
+    found = []
+    candidates = [BUNDLE_DIR]
+    for root in _removable_roots():
+        candidates.extend([root, os.path.join(root, "nova-bundle")])
+    host = None
+    for candidate in candidates:
+        manifest = read_bundle_manifest(candidate)
+        if manifest and manifest.get("image") == DOCKER_IMAGE_FULL:
+            host = host or get_host_platform()
+            if bundle_matches_host(manifest, host):
+                found.append((manifest.get("created", 0), candidate, manifest))
+    if not found:
+        return None
+    _, bundle_dir, manifest = max(found, key=lambda f: f[0])
+    return bundle_dir, manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nova offline image bundles")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = sub.add_parser("export-bundle", help="Export the local image to a bundle")
+    export_parser.add_argument("dest", help="Destination directory (e.g., USB stick)")
+    export_parser.add_argument("--compression", choices=["auto", "zstd", "gzip"], default="auto")
+
+    import_parser = sub.add_parser("import-bundle", help="Load a bundle and start the tracker")
+    import_parser.add_argument("source", help="Directory containing nova-bundle.json")
+    import_parser.add_argument("--no-start", action="store_true", help="Only load the image")
+
+    args = parser.parse_args()
+
+    def print_progress(done, total, elapsed):
+        pct = f" ({done * 100 // total}%)" if total else ""
+        print(f"\r{format_throughput(done, elapsed)}{pct}    ", end="", flush=True)
+
+    if args.command == "export-bundle":
+        success, msg = export_bundle(args.dest, args.compression, print_progress)
+    else:
+        success, msg = import_bundle(args.source, print_progress)
+        if success and not args.no_start:
+            print()
+            success, start_msg = start_container()
+            msg = f"{msg}\n{start_msg}"
+
+    print()
+    print(msg)
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
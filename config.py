@@ -15,15 +15,55 @@ APP_VERSION = "1.2.9-beta.1"
 DOCKER_IMAGE = "mrantonsg/nova-dso-tracker"
 DOCKER_TAG = "latest"
 DOCKER_IMAGE_FULL = f"{DOCKER_IMAGE}:{DOCKER_TAG}"
+# Holds an update downloaded in the background until the user applies it
+DOCKER_IMAGE_STAGED = f"{DOCKER_IMAGE}:staged"
 DOCKER_CONTAINER_NAME = "nova-tracker"
+CANDIDATE_CONTAINER_NAME = f"{DOCKER_CONTAINER_NAME}-candidate"
 COMPOSE_FILENAME = "docker-compose.yml"
 
 # --- Network Configuration ---
 PORT = 5001
 DASHBOARD_URL = f"http://localhost:{PORT}"
+CANDIDATE_PORT = PORT + 1     # Temporary port for the update candidate
+CANDIDATE_URL = f"http://localhost:{CANDIDATE_PORT}"
 
 # --- Docker Hub API ---
 DOCKER_HUB_API = f"https://hub.docker.com/v2/repositories/{DOCKER_IMAGE.replace('/', '%2F')}/tags/{DOCKER_TAG}"
+DOCKER_HUB_REGISTRY = "https://registry-1.docker.io"
+DOCKER_HUB_TOKEN_URL = ("https://auth.docker.io/token?service=registry.docker.io"
+                        f"&scope=repository:{DOCKER_IMAGE}:pull")
+
+# --- Registry Mirror / Pull-Through Cache ---
+# Configured per machine with the "registry_mirror" pref (e.g., "mirror.lan:5000")
+MIRROR_PROBE_TIMEOUT = 3      # Seconds to wait for the mirror's /v2/ endpoint
+MIRROR_PROBE_CACHE_TTL = 60   # Seconds a reachability result is reused
+REGISTRY_MANIFEST_ACCEPT = ", ".join([
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+])
+
+# --- Container Resource Limits ---
+# Defaults derived from the daemon's host profile; override per key with the
+# "resource_limits" pref (a null value removes that limit)
+RESOURCE_MEM_FRACTION = 0.5       # Share of host RAM the tracker may use
+RESOURCE_MIN_MEM_MB = 1024        # Never limit memory below this (if the host has it)
+RESOURCE_CPU_SHARES = 512         # Half the default weight under contention
+RESOURCE_PIDS_LIMIT = 512
+
+# --- Remote Docker Host ---
+# Selected with the "docker_host" ("ssh://user@host", "tcp://host:2376") or
+# "docker_context" prefs; see remote_host.py
+SSH_TUNNEL_START_TIMEOUT = 15     # Seconds to wait for the SSH tunnel to authenticate
+SSH_TUNNEL_RETRY_INTERVAL = 30    # Minimum delay before reopening a failed tunnel
+
+# --- Fleet View ---
+# Hosts listed in the "fleet_hosts" pref; see fleet.py
+FLEET_CONCURRENCY = 8             # Hosts probed at once
+FLEET_HOST_TIMEOUT = 20           # Seconds before a host's status probe is abandoned
+FLEET_BULK_CONCURRENCY = 3        # Hosts pulling/recreating at once during bulk actions
+FLEET_BULK_TIMEOUT = 1800         # Seconds before a host's bulk action is abandoned
 
 # --- Docker Download ---
 DOCKER_DOWNLOAD_URL = "https://www.docker.com/products/docker-desktop"
@@ -31,6 +71,14 @@ DOCKER_DOWNLOAD_URL = "https://www.docker.com/products/docker-desktop"
 # --- GitHub (Launcher Self-Update) ---
 GITHUB_REPO = "mrantonsg/nova-dso-tracker-launcher"
 GITHUB_RELEASES_API = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+# Release asset holding the launcher for each platform (see .github/workflows/build.yml);
+# matched after GitHub's renaming, which turns the spaces into dots
+LAUNCHER_ASSETS = {
+    "darwin": "Nova-DSO-Tracker-macOS.zip",
+    "win32": "Nova DSO Tracker.exe",
+    "linux": "nova-dso-tracker",
+}
+LAUNCHER_CHECKSUMS_ASSET = "SHA256SUMS"
 
 # --- Paths ---
 # Install directory: ~/nova (Universal & Safe)
@@ -38,26 +86,102 @@ NOVA_DIR = os.path.join(os.path.expanduser("~"), "nova")
 INSTANCE_DIR = os.path.join(NOVA_DIR, "instance")
 COMPOSE_FILE = os.path.join(NOVA_DIR, COMPOSE_FILENAME)
 LAUNCHER_PREFS_FILE = os.path.join(NOVA_DIR, ".launcher_prefs.json")
+SNAPSHOT_DIR = os.path.join(NOVA_DIR, "snapshots")
+CANDIDATE_INSTANCE_DIR = os.path.join(NOVA_DIR, "candidate_instance")
+DISK_USAGE_CACHE_FILE = os.path.join(NOVA_DIR, ".disk_usage_cache.json")
+BUNDLE_DIR = os.path.join(NOVA_DIR, "bundles")
+PHASE_HISTORY_FILE = os.path.join(NOVA_DIR, ".phase_history.json")
+LOG_DIR = os.path.join(NOVA_DIR, "logs")
+LOG_VIEW_SPILL_FILE = os.path.join(NOVA_DIR, ".log_view.spill")
+LAUNCHER_UPDATE_DIR = os.path.join(NOVA_DIR, "launcher_update")
+LAST_STATE_FILE = os.path.join(NOVA_DIR, ".last_state.json")
+WARMUP_HISTORY_FILE = os.path.join(NOVA_DIR, ".warmup_history.json")
 
 # --- Docker Compose Template ---
-COMPOSE_TEMPLATE = f"""services:
+# Placeholders are filled by docker_ops.create_compose_file()
+COMPOSE_TEMPLATE = """services:
   tracker:
-    image: {DOCKER_IMAGE_FULL}
-    container_name: {DOCKER_CONTAINER_NAME}
+    image: {image}
+    container_name: {container_name}
     ports:
-      - "{PORT}:{PORT}"
+      - "{port}:{port}"
     volumes:
       - ./instance:/app/instance
-    restart: unless-stopped"""
+    restart: unless-stopped
+    healthcheck:
+      test: ["CMD", "python", "-c", "import socket; socket.create_connection(('localhost', {port}), 5).close()"]
+      interval: 30s
+      timeout: 6s
+      retries: 3
+      start_period: 300s{resources}"""
+# Bump when COMPOSE_TEMPLATE changes so existing compose files are regenerated
+COMPOSE_TEMPLATE_VERSION = 3
+
+# --- Instance Snapshots ---
+SNAPSHOT_KEEP = 5             # Number of snapshots retained (newest first)
+SNAPSHOT_MAX_AGE_DAYS = 30    # Older snapshots are evicted (the newest is always kept)
+SNAPSHOT_HASH_WORKERS = 4     # Parallel hashing/copy workers
+HASH_CHUNK_SIZE = 1024 * 1024     # Read size for content hashing (bounds memory per worker)
+
+# --- Disk Usage Analyzer ---
+DISK_SCAN_WORKERS = 8         # Parallel os.scandir workers
+
+# --- Offline Image Bundles ---
+BUNDLE_MANIFEST_NAME = "nova-bundle.json"
+BUNDLE_CHUNK_SIZE = 1024 * 1024   # Streaming chunk size for save/load
+BUNDLE_PROGRESS_INTERVAL = 0.5    # Seconds between throughput reports
+
+# --- Phase Tracing ---
+PHASE_HISTORY_SAMPLES = 20    # Durations kept per host/operation/phase for ETAs
+PHASE_TRACES_KEPT = 20        # Full traces kept for Chrome-trace export
+
+# --- Launcher Log ---
+LOG_SEGMENT_BYTES = 2 * 1024 * 1024   # Active log size that triggers rotation
+LOG_TOTAL_BYTES = 20 * 1024 * 1024    # Cap for all log files together
+LOG_QUEUE_SIZE = 10000                # Records buffered for the writer thread
+LOG_VIEW_MEMORY_LINES = 5000          # Recent viewer lines kept in memory (older ones spill to disk)
+LOG_VIEW_MAX_LINES = 100000           # Viewer lines kept per session; older ones are dropped in batches
+
+# --- Container Log Analysis ---
+LOG_FOLLOW_TAIL = 200                 # Most lines of the current container run replayed when the stream connects
+LOG_FOLLOW_CHUNK = 64 * 1024          # Read size for the `docker logs -f` stream
+LOG_ANALYZER_MAX_LINE = 64 * 1024     # Longer lines are scanned in pieces
+READY_CONFIRM_WINDOW = 5              # Seconds of tight dashboard probing after a ready log line
+READY_CONFIRM_INTERVAL = 0.05         # Probe interval during that window
+
+# --- Dashboard Warm-Up ---
+# Requested once the tracker is ready after a start or update ("warmup_urls"
+# pref: paths or absolute URLs; an empty list disables it); see warmup.py
+WARMUP_PATHS = ["/"]
+WARMUP_CONCURRENCY = 2                # Requests in flight, leaving workers free for the user
+WARMUP_BUDGET = 30                    # Seconds for the whole plan; the rest is skipped
+WARMUP_REQUEST_TIMEOUT = 15           # Longest single request
+WARMUP_RUNS_KEPT = 50                 # Runs kept in the warm-up latency history
+
+# --- Launcher Self-Update ---
+LAUNCHER_DOWNLOAD_CHUNK = 64 * 1024           # Read size for release downloads
+LAUNCHER_DOWNLOAD_RATE = 1024 * 1024          # Bytes/s cap so the tracker keeps the bandwidth ("launcher_download_kbps" pref)
+LAUNCHER_DOWNLOAD_RETRIES = 5                 # Resumed attempts before giving up until the next check
+LAUNCHER_DOWNLOAD_TIMEOUT = 30                # Socket timeout for release downloads
 
 # --- Timeouts and Poll Intervals (in seconds) ---
 DOCKER_CMD_TIMEOUT = 300      # Default timeout for Docker commands
 DOCKER_INFO_TIMEOUT = 10      # Timeout for `docker info` checks
+COMMAND_STALL_TIMEOUT = 120   # Abort a long command after this long without output
+PULL_STALL_TIMEOUT = 600      # Same for pulls; non-TTY pulls only report per-layer events
+PROCESS_TERMINATE_GRACE = 5   # Seconds between terminate and kill for child processes
 CONTAINER_START_POLL_COUNT = 30   # Max polls for container to reach "Up" state
 DOCKER_START_POLL_COUNT = 60      # Max polls for Docker daemon to become ready
 WEB_READY_TIMEOUT = 2.0       # Timeout for HTTP check on dashboard
 MONITOR_INTERVAL = 3          # Seconds between state checks
+USAGE_SAMPLE_INTERVAL = 30    # Seconds between container usage samples (docker stats takes ~2s)
 UPDATE_BANNER_DISPLAY_TIME = 3    # Seconds to show "Update Applied" message
+UPDATE_CHECK_INTERVAL = 6 * 3600  # Seconds between background update checks
+UPDATE_CHECK_JITTER = 0.2         # +/- fraction of the interval, randomized
+PREPULL_RETRY_INTERVAL = 1800     # Retry delay after a failed or deferred pre-pull
+STALL_HEARTBEAT_INTERVAL = 0.1    # Tk event-loop heartbeat period
+STALL_THRESHOLD = 0.25            # Event-loop lag reported as a UI stall
+CANDIDATE_READY_TIMEOUT = 600     # Max wait for the update candidate to serve the dashboard
 
 # --- Colors (for UI theming) ---
 BG_COLOR = "#FFFFFF"
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Disk usage analysis for the Nova instance directory.
+
+Directories are scanned by a pool of os.scandir workers. Per-directory
+listings (direct file names, subdirectory names) are cached keyed by the
+directory's mtime, so a rescan only lists directories whose entries changed.
+
+A directory's mtime changes when entries are added, removed or renamed, not
+when an existing file grows in place (e.g., a SQLite database or a log), so
+the files of an unchanged directory are still stat'ed on every scan. That is
+one stat per file, without listing or walking anything.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import DISK_USAGE_CACHE_FILE, DISK_SCAN_WORKERS, NOVA_DIR
+
+
+def _load_cache() -> Dict[str, list]:
+    try:
+        if os.path.exists(DISK_USAGE_CACHE_FILE):
+            with open(DISK_USAGE_CACHE_FILE, "r") as f:
+                return json.load(f)
+    except (json.JSONDecodeError, PermissionError, OSError):
+        pass
+    return {}
+
+
+def _save_cache(cache: Dict[str, list]) -> None:
+    try:
+        os.makedirs(NOVA_DIR, exist_ok=True)
+        tmp_path = DISK_USAGE_CACHE_FILE + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, DISK_USAGE_CACHE_FILE)
+    except (PermissionError, OSError):
+        pass
+
+
+def _scan_one(path: str, cached: Optional[list]) -> Tuple[str, list, bool]:
+    """
+    Scan a single directory (non-recursive).
+
+    Returns:
+        Tuple of (path, [mtime_ns, file_bytes, file_count, subdirs, files],
+        listing_reused_from_cache)
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return path, [0, 0, 0, [], []], False
+
+    # Entries from older caches have no file names; list those again
+    if cached is not None and cached[0] == mtime_ns and len(cached) == 5:
+        # Same entries as last time, but files may have grown in place
+        file_bytes = 0
+        try:
+            for name in cached[4]:
+                file_bytes += os.lstat(os.path.join(path, name)).st_size
+        except OSError:
+            # Changed while scanning; fall back to listing the directory
+            pass
+        else:
+            return path, [mtime_ns, file_bytes, cached[2], cached[3], cached[4]], True
+
+    file_bytes = 0
+    file_count = 0
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        file_bytes += entry.stat(follow_symlinks=False).st_size
+                        file_count += 1
+                        files.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return path, [mtime_ns, file_bytes, file_count, subdirs, files], False
+
+
+def scan_directory(root: str, full_rescan: bool = False) -> Dict[str, Any]:
+    """
+    Compute the size of a directory tree using the mtime-keyed cache.
+
+    Args:
+        root: Directory to analyze
+        full_rescan: Ignore cached listings and list every directory again
+
+    Returns:
+        Dictionary with total_bytes, file_count, dir_count, children (list of
+        (name, bytes) for the immediate subdirectories, largest first),
+        rescanned, reused and elapsed (seconds)
+    """
+    started = time.monotonic()
+    root = os.path.abspath(root)
+    old_cache = {} if full_rescan else _load_cache()
+    new_cache = {}
+    rescanned = 0
+    reused = 0
+
+    if not os.path.isdir(root):
+        return {"total_bytes": 0, "file_count": 0, "dir_count": 0, "children": [],
+                "rescanned": 0, "reused": 0, "elapsed": 0.0}
+
+    with ThreadPoolExecutor(max_workers=DISK_SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_one, root, old_cache.get(root))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, entry, was_cached = future.result()
+                new_cache[path] = entry
+                if was_cached:
+                    reused += 1
+                else:
+                    rescanned += 1
+                for name in entry[3]:
+                    child = os.path.join(path, name)
+                    pending.add(pool.submit(_scan_one, child, old_cache.get(child)))
+
+    # Keep cache entries for other roots, replace everything under this one
+    merged = {k: v for k, v in old_cache.items()
+              if not (k == root or k.startswith(root + os.sep))}
+    merged.update(new_cache)
+    _save_cache(merged)
+
+    def _total(path: str) -> Tuple[int, int]:
+        # Iterative post-order to avoid recursion limits on deep trees
+        size_total = 0
+        count_total = 0
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            entry = new_cache.get(current)
+            if entry is None:
+                continue
+            size_total += entry[1]
+            count_total += entry[2]
+            stack.extend(os.path.join(current, name) for name in entry[3])
+        return size_total, count_total
+
+    total_bytes, file_count = _total(root)
+    children: List[Tuple[str, int]] = []
+    for name in new_cache[root][3]:
+        children.append((name, _total(os.path.join(root, name))[0]))
+    children.sort(key=lambda c: c[1], reverse=True)
+
+    return {
+        "total_bytes": total_bytes,
+        "file_count": file_count,
+        "dir_count": len(new_cache),
+        "children": children,
+        "rescanned": rescanned,
+        "reused": reused,
+        "elapsed": time.monotonic() - started,
+    }
@@ -8,14 +8,16 @@ and Docker Hub API interactions.
 
 import json
 import os
+import platform
 import shutil
 import ssl
 import subprocess
 import sys
+import threading
 import time
 import urllib.request
 import urllib.error
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 import certifi
 
@@ -32,18 +34,75 @@ def _subprocess_flags() -> int:
 from config import (
     DOCKER_IMAGE,
     DOCKER_IMAGE_FULL,
+    DOCKER_IMAGE_STAGED,
     DOCKER_TAG,
     DOCKER_CONTAINER_NAME,
+    CANDIDATE_CONTAINER_NAME,
+    CANDIDATE_PORT,
+    PORT,
     COMPOSE_FILE,
     COMPOSE_TEMPLATE,
+    COMPOSE_TEMPLATE_VERSION,
     DOCKER_CMD_TIMEOUT,
     DOCKER_INFO_TIMEOUT,
+    COMMAND_STALL_TIMEOUT,
+    PULL_STALL_TIMEOUT,
+    PROCESS_TERMINATE_GRACE,
+    LOG_FOLLOW_TAIL,
+    LOG_FOLLOW_CHUNK,
     DOCKER_HUB_API,
+    DOCKER_HUB_REGISTRY,
+    DOCKER_HUB_TOKEN_URL,
     LAUNCHER_PREFS_FILE,
     NOVA_DIR,
     CONTAINER_START_POLL_COUNT,
+    MIRROR_PROBE_TIMEOUT,
+    MIRROR_PROBE_CACHE_TTL,
+    REGISTRY_MANIFEST_ACCEPT,
+    RESOURCE_MEM_FRACTION,
+    RESOURCE_MIN_MEM_MB,
+    RESOURCE_CPU_SHARES,
+    RESOURCE_PIDS_LIMIT,
 )
-from utils import sanitize_for_shell
+from remote_host import apply_to_env, is_remote, remote_hostname
+from utils import check_web_ready, sanitize_for_shell
+
+
+def docker_path_env(env: Optional[dict] = None) -> dict:
+    """
+    Build an environment in which the Docker CLI can be found.
+
+    Args:
+        env: Base environment (defaults to a copy of os.environ)
+
+    Returns:
+        Environment with platform-specific Docker paths added to PATH
+    """
+    if env is None:
+        env = os.environ.copy()
+
+    # Add platform-specific paths for Docker
+    if os.name != "nt":  # Unix-like systems
+        env["PATH"] = env.get("PATH", "")
+        if sys_platform() == "darwin":
+            env["PATH"] += os.pathsep + "/usr/local/bin" + os.pathsep + "/opt/homebrew/bin"
+        elif sys_platform() == "linux":
+            env["PATH"] += os.pathsep + "/usr/local/bin" + os.pathsep + "/snap/bin"
+    return env
+
+
+def command_env(env: Optional[dict] = None) -> dict:
+    """
+    Build the environment for Docker subprocesses.
+
+    Args:
+        env: Base environment (defaults to a copy of os.environ)
+
+    Returns:
+        Environment with platform-specific Docker paths added to PATH, pointed
+        at the managed Docker host (see remote_host)
+    """
+    return apply_to_env(docker_path_env(env))
 
 
 def run_command(
@@ -64,16 +123,7 @@ def run_command(
     Returns:
         Tuple of (stdout, stderr, return_code)
     """
-    if env is None:
-        env = os.environ.copy()
-
-    # Add platform-specific paths for Docker
-    if os.name != "nt":  # Unix-like systems
-        env["PATH"] = env.get("PATH", "")
-        if sys_platform() == "darwin":
-            env["PATH"] += os.pathsep + "/usr/local/bin" + os.pathsep + "/opt/homebrew/bin"
-        elif sys_platform() == "linux":
-            env["PATH"] += os.pathsep + "/usr/local/bin" + os.pathsep + "/snap/bin"
+    env = command_env(env)
 
     try:
         result = subprocess.run(
@@ -94,6 +144,138 @@ def run_command(
         return "", str(e), -1
 
 
+# Long-running child processes, terminated on shutdown
+_managed_procs = set()
+_managed_lock = threading.Lock()
+
+
+def _terminate_process(proc: subprocess.Popen, grace: float = PROCESS_TERMINATE_GRACE) -> None:
+    """Ask a child process to exit, killing it if it ignores the request."""
+    if proc.poll() is not None:
+        return
+    try:
+        proc.terminate()
+        proc.wait(timeout=grace)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    except OSError:
+        pass
+
+
+def run_managed_command(
+    args: list,
+    cwd: Optional[str] = None,
+    stall_timeout: float = COMMAND_STALL_TIMEOUT,
+    cancel_event: Optional[threading.Event] = None,
+    on_output=None,
+    env: Optional[dict] = None,
+) -> Tuple[str, str, int]:
+    """
+    Run a long command, aborting only when it stops making progress.
+
+    Unlike run_command there is no limit on the total run time: any output
+    on stdout or stderr resets the stall timer. The process is terminated
+    when cancel_event is set or when terminate_managed_processes() is called.
+
+    Args:
+        args: List of command arguments
+        cwd: Working directory for the command
+        stall_timeout: Seconds without output before the command is aborted
+        cancel_event: Optional threading.Event that cancels the command
+        on_output: Optional callback receiving each output line
+        env: Environment variables (defaults to os.environ)
+
+    Returns:
+        Tuple of (stdout, stderr, return_code); return_code is -1 when the
+        command was cancelled or stalled
+    """
+    try:
+        proc = subprocess.Popen(
+            args,
+            cwd=cwd or NOVA_DIR,
+            env=command_env(env),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            creationflags=_subprocess_flags(),
+        )
+    except FileNotFoundError:
+        return "", f"Command not found: {args[0]}", -1
+    except Exception as e:
+        return "", str(e), -1
+
+    with _managed_lock:
+        _managed_procs.add(proc)
+
+    last_activity = [time.monotonic()]
+    stdout_lines = []
+    stderr_lines = []
+
+    def _pump(stream, lines):
+        for line in iter(stream.readline, ""):
+            last_activity[0] = time.monotonic()
+            line = line.rstrip()
+            lines.append(line)
+            if on_output and line:
+                on_output(line)
+        stream.close()
+
+    readers = [
+        threading.Thread(target=_pump, args=(proc.stdout, stdout_lines), daemon=True),
+        threading.Thread(target=_pump, args=(proc.stderr, stderr_lines), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    abort_reason = None
+    try:
+        while proc.poll() is None:
+            if cancel_event is not None and cancel_event.is_set():
+                abort_reason = "Cancelled"
+            elif time.monotonic() - last_activity[0] > stall_timeout:
+                abort_reason = f"No progress for {stall_timeout:.0f}s"
+            if abort_reason:
+                _terminate_process(proc)
+                break
+            time.sleep(0.2)
+        # Grandchildren can keep the pipes open after an abort; don't wait on them
+        for reader in readers:
+            reader.join(timeout=0.5 if abort_reason else PROCESS_TERMINATE_GRACE)
+    finally:
+        with _managed_lock:
+            _managed_procs.discard(proc)
+
+    stdout = "\n".join(stdout_lines).strip()
+    if abort_reason:
+        return stdout, abort_reason, -1
+    return stdout, "\n".join(stderr_lines).strip(), proc.returncode
+
+
+def terminate_managed_processes(grace: float = PROCESS_TERMINATE_GRACE) -> None:
+    """
+    Terminate all processes started by run_managed_command (used on shutdown).
+
+    Args:
+        grace: Total seconds to wait for them to exit before killing them
+    """
+    with _managed_lock:
+        procs = list(_managed_procs)
+    for proc in procs:
+        if proc.poll() is None:
+            try:
+                proc.terminate()
+            except OSError:
+                pass
+    deadline = time.monotonic() + grace
+    for proc in procs:
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
 def sys_platform() -> str:
     """Get the platform identifier."""
     import sys
@@ -129,8 +311,9 @@ def is_docker_running() -> Tuple[bool, str]:
     if "Server Version" in stdout:
         return True, "running"
 
-    # Distinguish "not running" from "not properly installed"
-    if rc != 0 and (
+    # Distinguish "not running" from "not properly installed"; a remote
+    # daemon that cannot be reached is never a local installation problem
+    if rc != 0 and not is_remote() and (
         "connect" not in stderr.lower()
         and "daemon" not in stderr.lower()
         and "is the docker daemon running" not in stderr.lower()
@@ -172,65 +355,572 @@ def is_container_running() -> Tuple[bool, str]:
     return False, stdout
 
 
-def create_compose_file() -> bool:
+# --- Registry Mirror ---
+
+_mirror_probe_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def get_registry_mirror() -> Optional[str]:
+    """
+    Get the configured registry mirror or pull-through cache.
+
+    Returns:
+        The mirror as "host[:port]" (scheme and trailing slash removed), or None
+    """
+    mirror = load_launcher_prefs().get("registry_mirror")
+    if not mirror:
+        return None
+    mirror = mirror.strip().rstrip("/")
+    for scheme in ("https://", "http://"):
+        if mirror.startswith(scheme):
+            mirror = mirror[len(scheme):]
+    return mirror or None
+
+
+def _mirror_base_url(mirror: str) -> str:
+    """Base URL for the mirror's registry API (http only if explicitly configured)."""
+    configured = load_launcher_prefs().get("registry_mirror", "")
+    scheme = "http" if configured.strip().startswith("http://") else "https"
+    return f"{scheme}://{mirror}"
+
+
+def get_mirror_image_ref(mirror: str) -> str:
+    """Image reference for the Nova image served by a mirror."""
+    return f"{mirror}/{DOCKER_IMAGE}:{DOCKER_TAG}"
+
+
+def is_mirror_reachable(mirror: str) -> bool:
+    """
+    Check whether a mirror answers the registry API version check.
+
+    Results are cached for MIRROR_PROBE_CACHE_TTL seconds.
+
+    Args:
+        mirror: Mirror as "host[:port]"
+
+    Returns:
+        True if GET /v2/ answers with 200 or 401 (auth required)
+    """
+    cached = _mirror_probe_cache.get(mirror)
+    if cached and time.monotonic() - cached[0] < MIRROR_PROBE_CACHE_TTL:
+        return cached[1]
+
+    reachable = False
+    try:
+        req = urllib.request.Request(
+            f"{_mirror_base_url(mirror)}/v2/",
+            headers={"User-Agent": "NovaLauncher/1.0"},
+        )
+        with urllib.request.urlopen(req, timeout=MIRROR_PROBE_TIMEOUT, context=_SSL_CONTEXT):
+            reachable = True
+    except urllib.error.HTTPError as e:
+        reachable = e.code == 401
+    except Exception:
+        reachable = False
+
+    _mirror_probe_cache[mirror] = (time.monotonic(), reachable)
+    return reachable
+
+
+def get_compose_image_ref() -> str:
+    """
+    Image reference written into docker-compose.yml.
+
+    Uses the mirror reference when one is configured; pull_image keeps that
+    tag present locally even when it had to fall back to Docker Hub.
+    """
+    mirror = get_registry_mirror()
+    return get_mirror_image_ref(mirror) if mirror else DOCKER_IMAGE_FULL
+
+
+def _registry_fetch_manifest(
+    base_url: str,
+    repository: str,
+    reference: str,
+    token: Optional[str] = None,
+    body: bool = True,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch a manifest (or just its digest) via the registry HTTP API.
+
+    HEAD requests do not count against Docker Hub pull rate limits, so
+    callers only ask for the body when they need the platform entries.
+
+    Args:
+        base_url: Registry base URL (e.g., "https://mirror.lan:5000")
+        repository: Repository name (e.g., "mrantonsg/nova-dso-tracker")
+        reference: Tag or digest
+        token: Optional bearer token
+        body: GET the manifest JSON instead of a HEAD request
+
+    Returns:
+        Tuple of (manifest JSON or None, Docker-Content-Digest or None); the
+        digest is that of the top-level manifest (index or single manifest)
+    """
+    headers = {"User-Agent": "NovaLauncher/1.0", "Accept": REGISTRY_MANIFEST_ACCEPT}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    req = urllib.request.Request(
+        f"{base_url}/v2/{repository}/manifests/{reference}",
+        headers=headers,
+        method="GET" if body else "HEAD",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=DOCKER_INFO_TIMEOUT, context=_SSL_CONTEXT) as response:
+            digest = response.headers.get("Docker-Content-Digest")
+            manifest = json.loads(response.read().decode()) if body else None
+            return manifest, digest
+    except Exception:
+        return None, None
+
+
+def _docker_hub_token() -> Optional[str]:
+    """Get an anonymous pull token for the Nova repository on Docker Hub."""
+    req = urllib.request.Request(DOCKER_HUB_TOKEN_URL, headers={"User-Agent": "NovaLauncher/1.0"})
+    try:
+        with urllib.request.urlopen(req, timeout=DOCKER_INFO_TIMEOUT, context=_SSL_CONTEXT) as response:
+            return json.loads(response.read().decode()).get("token")
+    except Exception:
+        return None
+
+
+# --- Compose File Generation ---
+
+_host_profiles: Dict[str, Tuple[int, int]] = {}
+
+
+def get_host_profile() -> Tuple[int, int]:
+    """
+    Detect the CPU count and memory available to containers.
+
+    Asks the daemon, which reports the Docker Desktop VM's resources rather
+    than the physical host's. Cached for the session once the daemon
+    answered, and kept per Docker host in the "host_profiles" pref: while
+    the daemon does not answer, its last answer is used. The launcher
+    machine's own values are only a fallback for a host never seen.
+
+    Returns:
+        Tuple of (cpu_count, memory_bytes); memory is 0 if unknown
+    """
+    host = remote_hostname() or "local"
+    if host in _host_profiles:
+        return _host_profiles[host]
+
+    stdout, stderr, rc = run_command(
+        ["docker", "info", "--format", "{{.NCPU}} {{.MemTotal}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    parts = stdout.split()
+    prefs = load_launcher_prefs()
+    remembered = prefs.get("host_profiles", {})
+    if rc == 0 and len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+        profile = (int(parts[0]), int(parts[1]))
+        _host_profiles[host] = profile
+        if remembered.get(host) != list(profile):
+            prefs["host_profiles"] = {**remembered, host: list(profile)}
+            save_launcher_prefs(prefs)
+        return profile
+
+    last = remembered.get(host)
+    if isinstance(last, list) and len(last) == 2:
+        return int(last[0]), int(last[1])
+
+    memory = 0
+    try:
+        memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        pass
+    return os.cpu_count() or 1, memory
+
+
+def get_resource_limits() -> Dict[str, Any]:
+    """
+    Compute the effective container resource limits.
+
+    Leaves one core for capture and plate-solving software on multi-core
+    hosts and caps memory at RESOURCE_MEM_FRACTION of RAM. Keys in the
+    "resource_limits" pref override the computed values; null removes a limit.
+
+    Returns:
+        Dictionary of compose keys (cpus, mem_limit, cpu_shares, pids_limit)
+    """
+    cpu_count, memory = get_host_profile()
+    limits: Dict[str, Any] = {
+        "cpus": float(cpu_count - 1) if cpu_count > 2 else round(cpu_count * 0.75, 2),
+        "cpu_shares": RESOURCE_CPU_SHARES,
+        "pids_limit": RESOURCE_PIDS_LIMIT,
+    }
+    if memory:
+        memory_mb = memory // (1024 * 1024)
+        limit_mb = max(int(memory_mb * RESOURCE_MEM_FRACTION), min(RESOURCE_MIN_MEM_MB, memory_mb))
+        limits["mem_limit"] = f"{limit_mb}m"
+
+    for key, value in load_launcher_prefs().get("resource_limits", {}).items():
+        if key not in ("cpus", "mem_limit", "cpu_shares", "pids_limit"):
+            continue
+        if value is None:
+            limits.pop(key, None)
+        else:
+            limits[key] = value
+    return limits
+
+
+def get_compose_settings() -> Dict[str, Any]:
+    """Effective settings that determine the generated compose file."""
+    return {
+        "template": COMPOSE_TEMPLATE_VERSION,
+        "image": get_compose_image_ref(),
+        "resources": get_resource_limits(),
+    }
+
+
+def get_container_health(status_str: str) -> Optional[str]:
+    """
+    Extract the healthcheck state from a `docker ps` status string.
+
+    Args:
+        status_str: Status as returned by is_container_running (e.g.,
+            "Up 2 minutes (healthy)")
+
+    Returns:
+        "healthy", "unhealthy" or "starting", or None if the container has
+        no healthcheck (e.g., a compose file generated by an older launcher)
+    """
+    if "(healthy)" in status_str:
+        return "healthy"
+    if "(unhealthy)" in status_str:
+        return "unhealthy"
+    if "(health: starting)" in status_str:
+        return "starting"
+    return None
+
+
+_health_events_proc: Optional[subprocess.Popen] = None
+
+
+def watch_health_events(callback, stop_event) -> None:
+    """
+    Follow the daemon's health_status events for the Nova container.
+
+    Blocks until stop_event is set, reconnecting if the event stream ends
+    (e.g., Docker Desktop restarted). Run it on a background thread.
+
+    Args:
+        callback: Called with "healthy", "unhealthy" or "starting"
+        stop_event: threading.Event that ends the watch
+    """
+    global _health_events_proc
+    while not stop_event.is_set():
+        try:
+            _health_events_proc = subprocess.Popen(
+                [
+                    "docker", "events",
+                    "--filter", f"container={DOCKER_CONTAINER_NAME}",
+                    "--filter", "event=health_status",
+                    "--format", "{{.Status}}",
+                ],
+                cwd=NOVA_DIR if os.path.isdir(NOVA_DIR) else None,
+                env=command_env(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                creationflags=_subprocess_flags(),
+            )
+            for line in _health_events_proc.stdout:
+                # Format is "health_status: healthy"
+                status = line.strip().rsplit(":", 1)[-1].strip()
+                if status in ("healthy", "unhealthy", "starting"):
+                    callback(status)
+            _health_events_proc.wait()
+        except (FileNotFoundError, OSError):
+            pass
+        stop_event.wait(5)
+
+
+def stop_health_events() -> None:
+    """Terminate the `docker events` process started by watch_health_events."""
+    proc = _health_events_proc
+    if proc is not None and proc.poll() is None:
+        proc.terminate()
+
+
+_container_logs_proc: Optional[subprocess.Popen] = None
+
+
+def get_container_started_at() -> Optional[str]:
+    """
+    When the Nova container's current run started, by the daemon's clock.
+
+    Returns:
+        RFC 3339 timestamp (e.g. "2024-05-01T10:00:00.123456789Z"), or None
+        if the container does not exist
+    """
+    stdout, _, rc = run_command(
+        ["docker", "inspect", "--format", "{{.State.StartedAt}}", DOCKER_CONTAINER_NAME],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    return (stdout.strip() or None) if rc == 0 else None
+
+
+def _log_timestamp_key(timestamp: str) -> Tuple[str, str]:
+    """Sort key for `docker logs --timestamps` prefixes, whose fractions vary in length."""
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return seconds, fraction.ljust(9, "0")
+
+
+def follow_container_logs(callback, stop_event, on_connect=None) -> None:
+    """
+    Stream the Nova container's output (stdout and stderr) as it is written.
+
+    Blocks until stop_event is set, reconnecting when the stream ends (the
+    container stopped or restarted). A new container run is replayed from
+    its start (at most LOG_FOLLOW_TAIL lines), so nothing from an earlier
+    run is reported as current. Reconnections to the same run resume after
+    the last line received. Both use the daemon's timestamps rather than
+    the local clock, which can differ from a remote daemon's. Run it on a
+    background thread.
+
+    Args:
+        callback: Called with complete lines of decoded text (one or more per call)
+        stop_event: threading.Event that ends the stream
+        on_connect: Optional callable invoked before a new container run is streamed
+    """
+    global _container_logs_proc
+    run_started = None
+    last_timestamp = None
+    while not stop_event.is_set():
+        # Errors from `docker logs` would be mixed into the stream; only attach to a running container
+        if not is_container_running()[0]:
+            stop_event.wait(5)
+            continue
+        started_at = get_container_started_at()
+        if started_at is None:
+            stop_event.wait(5)
+            continue
+        args = ["docker", "logs", "--follow", "--timestamps"]
+        if started_at != run_started or last_timestamp is None:
+            args += ["--since", started_at, "--tail", str(LOG_FOLLOW_TAIL)]
+        else:
+            args += ["--since", last_timestamp]
+        args.append(DOCKER_CONTAINER_NAME)
+        try:
+            _container_logs_proc = subprocess.Popen(
+                args,
+                cwd=NOVA_DIR if os.path.isdir(NOVA_DIR) else None,
+                env=command_env(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                creationflags=_subprocess_flags(),
+            )
+            if started_at != run_started:
+                run_started, last_timestamp = started_at, None
+                if on_connect is not None:
+                    on_connect()
+            pending = b""
+            while True:
+                # read1 returns whatever is available instead of waiting for a full chunk
+                data = _container_logs_proc.stdout.read1(LOG_FOLLOW_CHUNK)
+                if not data:
+                    break
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()
+                text = []
+                for raw in lines:
+                    timestamp, _, line = raw.decode("utf-8", "replace").partition(" ")
+                    # --since includes lines at that instant, which were already delivered
+                    if last_timestamp is not None and _log_timestamp_key(timestamp) <= _log_timestamp_key(last_timestamp):
+                        continue
+                    last_timestamp = timestamp
+                    text.append(line + "\n")
+                if text:
+                    callback("".join(text))
+            _container_logs_proc.wait()
+        except (FileNotFoundError, OSError, ValueError):
+            pass
+        stop_event.wait(5)
+
+
+def stop_container_logs() -> None:
+    """Terminate the `docker logs` process started by follow_container_logs."""
+    proc = _container_logs_proc
+    if proc is not None and proc.poll() is None:
+        proc.terminate()
+
+
+def create_compose_file(settings: Optional[Dict[str, Any]] = None) -> bool:
     """
     Create the docker-compose.yml file in NOVA_DIR.
 
+    Args:
+        settings: Compose settings (defaults to get_compose_settings())
+
     Returns:
         True if file was created successfully
     """
+    if settings is None:
+        settings = get_compose_settings()
+    resources = "".join(
+        f"\n    {key}: {value}" for key, value in settings["resources"].items()
+    )
     try:
         os.makedirs(NOVA_DIR, exist_ok=True)
         with open(COMPOSE_FILE, "w") as f:
-            f.write(COMPOSE_TEMPLATE)
+            f.write(COMPOSE_TEMPLATE.format(
+                image=settings["image"],
+                container_name=DOCKER_CONTAINER_NAME,
+                port=PORT,
+                resources=resources,
+            ))
         return True
     except (PermissionError, OSError):
         return False
 
 
-def pull_image(callback=None) -> Tuple[bool, str]:
+def sync_compose_file() -> Tuple[bool, bool]:
     """
-    Pull the latest Docker image.
+    Regenerate docker-compose.yml only if the effective settings changed.
 
-    Args:
-        callback: Optional callback function to receive progress updates
+    The settings used for the last generation are remembered in the prefs,
+    so an unchanged configuration never touches the file (and manual edits
+    survive until a setting actually changes).
 
     Returns:
-        Tuple of (success: bool, message: str)
+        Tuple of (success: bool, changed: bool)
+    """
+    settings = get_compose_settings()
+    prefs = load_launcher_prefs()
+    if is_nova_installed() and prefs.get("compose_settings") == settings:
+        return True, False
+
+    if not create_compose_file(settings):
+        return False, False
+    prefs = load_launcher_prefs()
+    prefs["compose_settings"] = settings
+    save_launcher_prefs(prefs)
+    return True, True
+
+
+def get_container_usage() -> Optional[Dict[str, str]]:
+    """
+    Get a one-shot resource usage sample for the Nova container.
+
+    Returns:
+        Dictionary with CPUPerc, MemUsage ("used / limit") and PIDs, or None
     """
     stdout, stderr, rc = run_command(
-        ["docker", "pull", DOCKER_IMAGE_FULL],
-        timeout=DOCKER_CMD_TIMEOUT,
+        ["docker", "stats", "--no-stream", "--format", "{{json .}}", DOCKER_CONTAINER_NAME],
+        timeout=DOCKER_INFO_TIMEOUT,
     )
+    if rc != 0 or not stdout:
+        return None
+    try:
+        return json.loads(stdout.splitlines()[0])
+    except json.JSONDecodeError:
+        return None
 
-    if rc == 0:
-        return True, "Image pulled successfully"
+
+def image_pull_plan(image_ref: Optional[str] = None) -> List[Tuple[str, List[str]]]:
+    """
+    Where to pull the Nova image from, and which tags to add afterwards.
+
+    Args:
+        image_ref: Reference the compose file runs (a mirror reference, see
+            get_mirror_image_ref), or None for the canonical DOCKER_IMAGE_FULL
+
+    Returns:
+        List of (reference to pull, references to tag it as) in the order to
+        try. With a mirror, its reference comes first and Docker Hub is the
+        fallback; either way both tags end up pointing at the pulled image.
+    """
+    if not image_ref or image_ref == DOCKER_IMAGE_FULL:
+        return [(DOCKER_IMAGE_FULL, [])]
+    return [(image_ref, [DOCKER_IMAGE_FULL]), (DOCKER_IMAGE_FULL, [image_ref])]
+
+
+def pull_image(callback=None, cancel_event=None) -> Tuple[bool, str]:
+    """
+    Pull the latest Docker image, via the registry mirror when configured.
+
+    Falls back to Docker Hub if the mirror is unreachable or the pull fails.
+    Afterwards both the canonical tag and the mirror tag (used by the compose
+    file) point at the pulled image.
+
+    The pull is aborted only when Docker reports no layer progress for
+    PULL_STALL_TIMEOUT seconds, never because the total time is long.
+
+    Args:
+        callback: Optional callback function to receive progress updates
+            (one line of `docker pull` output per call)
+        cancel_event: Optional threading.Event that cancels the pull
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    mirror = get_registry_mirror()
+    plan = image_pull_plan(get_mirror_image_ref(mirror) if mirror else None)
+    if mirror and not is_mirror_reachable(mirror):
+        plan = plan[1:]
+
+    stderr = ""
+    for pull_ref, tags in plan:
+        stdout, stderr, rc = run_managed_command(
+            ["docker", "pull", pull_ref],
+            stall_timeout=PULL_STALL_TIMEOUT,
+            cancel_event=cancel_event,
+            on_output=callback,
+        )
+        if rc == 0:
+            # Keep the compose file's image reference resolvable locally
+            for tag in tags:
+                run_command(["docker", "tag", pull_ref, tag], timeout=DOCKER_INFO_TIMEOUT)
+            if not mirror:
+                return True, "Image pulled successfully"
+            if pull_ref != DOCKER_IMAGE_FULL:
+                return True, f"Image pulled from mirror {mirror}"
+            return True, "Image pulled from Docker Hub (mirror unavailable)"
+        if cancel_event is not None and cancel_event.is_set():
+            return False, stderr
+        if mirror and pull_ref != DOCKER_IMAGE_FULL:
+            _mirror_probe_cache.pop(mirror, None)
     return False, stderr or "Failed to pull image"
 
 
-def start_container(callback=None) -> Tuple[bool, str]:
+def start_container(callback=None, cancel_event=None) -> Tuple[bool, str]:
     """
     Start the Nova container using docker compose.
 
+    Args:
+        callback: Optional callback receiving the name of each phase as it
+            begins ("compose_write", "container_create", "container_up")
+        cancel_event: Optional threading.Event that cancels the start
+
     Returns:
         Tuple of (success: bool, message: str)
     """
-    # First ensure compose file exists
-    if not is_nova_installed():
-        if not create_compose_file():
-            return False, "Failed to create docker-compose.yml"
+    # Ensure compose file exists and reflects the current settings
+    if callback:
+        callback("compose_write")
+    success, changed = sync_compose_file()
+    if not success:
+        return False, "Failed to create docker-compose.yml"
 
     # Use explicit -f flag for Windows compatibility
-    stdout, stderr, rc = run_command(
+    if callback:
+        callback("container_create")
+    stdout, stderr, rc = run_managed_command(
         ["docker", "compose", "-f", COMPOSE_FILE, "up", "-d"],
-        timeout=DOCKER_CMD_TIMEOUT,
+        cancel_event=cancel_event,
     )
 
     if rc != 0:
         return False, stderr or "Failed to start container"
 
     # Poll until container is "Up"
+    if callback:
+        callback("container_up")
     for _ in range(CONTAINER_START_POLL_COUNT):
+        if cancel_event is not None and cancel_event.is_set():
+            return False, "Cancelled"
         is_running, _ = is_container_running()
         if is_running:
             return True, "Container started successfully"
@@ -239,6 +929,35 @@ def start_container(callback=None) -> Tuple[bool, str]:
     return False, "Container did not start within expected time"
 
 
+def wait_for_healthy(timeout: float, stop_event=None, interval: float = 0.5) -> bool:
+    """
+    Wait until the Nova container reports healthy.
+
+    The healthcheck only runs every 30 seconds, so a starting container (or
+    one without a healthcheck) also counts as healthy once the dashboard
+    answers.
+
+    Args:
+        timeout: Maximum time to wait in seconds
+        stop_event: Optional threading.Event that aborts the wait
+        interval: Delay between polls in seconds
+
+    Returns:
+        True if the container became healthy within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if stop_event is not None and stop_event.is_set():
+            return False
+        is_running, status_str = is_container_running()
+        if is_running:
+            health = get_container_health(status_str)
+            if health == "healthy" or (health != "unhealthy" and check_web_ready()):
+                return True
+        time.sleep(interval)
+    return False
+
+
 def stop_container() -> Tuple[bool, str]:
     """
     Stop the Nova container using docker compose.
@@ -247,9 +966,8 @@ def stop_container() -> Tuple[bool, str]:
         Tuple of (success: bool, message: str)
     """
     # Use explicit -f flag for Windows compatibility
-    stdout, stderr, rc = run_command(
+    stdout, stderr, rc = run_managed_command(
         ["docker", "compose", "-f", COMPOSE_FILE, "stop"],
-        timeout=DOCKER_CMD_TIMEOUT,
     )
 
     if rc == 0:
@@ -257,17 +975,74 @@ def stop_container() -> Tuple[bool, str]:
     return False, stderr or "Failed to stop container"
 
 
-def recreate_container() -> Tuple[bool, str]:
+def pause_container() -> Tuple[bool, str]:
+    """
+    Suspend the Nova container through the cgroup freezer.
+
+    CPU is released immediately while memory (and the tracker's warm caches)
+    stays resident, so resuming takes milliseconds.
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    stdout, stderr, rc = run_command(
+        ["docker", "pause", DOCKER_CONTAINER_NAME],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+
+    if rc == 0:
+        return True, "Container suspended"
+    return False, stderr or "Failed to suspend container"
+
+
+def unpause_container() -> Tuple[bool, str]:
+    """
+    Resume a suspended Nova container.
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    stdout, stderr, rc = run_command(
+        ["docker", "unpause", DOCKER_CONTAINER_NAME],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+
+    if rc == 0:
+        return True, "Container resumed"
+    return False, stderr or "Failed to resume container"
+
+
+def is_container_paused(status_str: str) -> bool:
+    """
+    Check whether a `docker ps` status string describes a paused container.
+
+    Args:
+        status_str: Status as returned by is_container_running
+
+    Returns:
+        True if the container is suspended
+    """
+    return "(Paused)" in status_str
+
+
+def recreate_container(cancel_event=None) -> Tuple[bool, str]:
     """
     Force recreate the container (used after image update).
 
+    Args:
+        cancel_event: Optional threading.Event that cancels the recreate
+
     Returns:
         Tuple of (success: bool, message: str)
     """
+    success, _ = sync_compose_file()
+    if not success:
+        return False, "Failed to create docker-compose.yml"
+
     # Use explicit -f flag for Windows compatibility
-    stdout, stderr, rc = run_command(
+    stdout, stderr, rc = run_managed_command(
         ["docker", "compose", "-f", COMPOSE_FILE, "up", "-d", "--force-recreate"],
-        timeout=DOCKER_CMD_TIMEOUT,
+        cancel_event=cancel_event,
     )
 
     if rc == 0:
@@ -275,35 +1050,159 @@ def recreate_container() -> Tuple[bool, str]:
     return False, stderr or "Failed to recreate container"
 
 
-def get_local_image_digest() -> Optional[str]:
+# `docker run` flags for the compose resource keys of get_resource_limits
+_RUN_RESOURCE_FLAGS = {
+    "cpus": "--cpus",
+    "mem_limit": "--memory",
+    "cpu_shares": "--cpu-shares",
+    "pids_limit": "--pids-limit",
+}
+
+
+def start_candidate_container(instance_dir: str) -> Tuple[bool, str]:
     """
-    Get the registry digest of the locally pulled image.
+    Start the freshly pulled image as a second container on CANDIDATE_PORT.
+
+    The candidate gets its own instance data (see snapshots.seed_instance),
+    never the live directory: two SQLite writers on one database, or the new
+    image migrating it while the old one still serves, could corrupt it. It
+    runs with the same resource limits as the compose service, so the two
+    trackers together cannot take more than twice the tracker's share.
 
-    Uses .RepoDigests which contains the actual registry digest that was
-    saved when the image was pulled. This is different from .Id which is
-    the image config digest.
+    Args:
+        instance_dir: Scratch instance directory to mount
 
     Returns:
-        The registry digest (sha256 hash) or None if not found
+        Tuple of (success: bool, message: str)
+    """
+    # Remove any leftover candidate from an interrupted update
+    remove_candidate_container()
+
+    args = [
+        "docker", "run", "-d",
+        "--name", CANDIDATE_CONTAINER_NAME,
+        "-p", f"{CANDIDATE_PORT}:{PORT}",
+        "-v", f"{instance_dir}:/app/instance",
+    ]
+    for key, value in get_resource_limits().items():
+        args += [_RUN_RESOURCE_FLAGS[key], str(value)]
+    args.append(get_compose_image_ref())
+    stdout, stderr, rc = run_command(args, timeout=DOCKER_CMD_TIMEOUT)
+
+    if rc == 0:
+        return True, "Candidate container started"
+    return False, stderr or "Failed to start candidate container"
+
+
+def stop_candidate_container() -> Tuple[bool, str]:
+    """
+    Stop the update candidate gracefully, so its databases are closed cleanly.
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    stdout, stderr, rc = run_command(
+        ["docker", "stop", CANDIDATE_CONTAINER_NAME],
+        timeout=DOCKER_CMD_TIMEOUT,
+    )
+
+    if rc == 0:
+        return True, "Candidate container stopped"
+    return False, stderr or "Failed to stop candidate container"
+
+
+def remove_candidate_container() -> Tuple[bool, str]:
+    """
+    Force remove the update candidate container if it exists.
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    stdout, stderr, rc = run_command(
+        ["docker", "rm", "-f", CANDIDATE_CONTAINER_NAME],
+        timeout=DOCKER_CMD_TIMEOUT,
+    )
+
+    if rc == 0 or "No such container" in stderr:
+        return True, "Candidate container removed"
+    return False, stderr or "Failed to remove candidate container"
+
+
+def parse_repo_digests(output: str) -> list:
+    """
+    Extract this image's digests from `docker image inspect` RepoDigests JSON.
+
+    Args:
+        output: Output of --format "{{json .RepoDigests}}"
+
+    Returns:
+        List of digests ("sha256:..."), Docker Hub's first
+    """
+    if not output:
+        return []
+    try:
+        repo_digests = json.loads(output) or []
+    except json.JSONDecodeError:
+        return []
+    digests = []
+    # RepoDigests format is "repo@sha256:abc123..."
+    for entry in sorted(repo_digests, key=lambda e: not e.startswith(f"{DOCKER_IMAGE}@")):
+        repo, _, digest = entry.partition("@")
+        if digest and repo.endswith(DOCKER_IMAGE) and digest not in digests:
+            digests.append(digest)
+    return digests
+
+
+def get_local_image_digests(image_ref: str = DOCKER_IMAGE_FULL) -> list:
+    """
+    Get the registry digests of the locally pulled image.
+
+    Uses .RepoDigests, which holds the digest of the top-level manifest the
+    image was pulled by (the index digest for multi-platform images). This is
+    different from .Id, which is the image config digest. An image pulled
+    through a mirror has one entry per repository; entries for other
+    repositories are ignored.
+
+    Args:
+        image_ref: Local reference to look at (e.g., DOCKER_IMAGE_STAGED)
+
+    Returns:
+        List of digests ("sha256:..."), Docker Hub's first; empty if unknown
     """
     stdout, stderr, rc = run_command(
         [
             "docker", "image", "inspect",
-            DOCKER_IMAGE_FULL,
-            "--format", "{{index .RepoDigests 0}}",
+            image_ref,
+            "--format", "{{json .RepoDigests}}",
         ],
         timeout=DOCKER_INFO_TIMEOUT,
     )
 
-    if rc == 0 and stdout:
-        # RepoDigests format is "image@sha256:abc123..." - extract just the digest
-        if "@" in stdout:
-            return stdout.split("@")[1]
-        # Fallback: if format is unexpected, return as-is
-        if stdout.startswith("sha256:"):
-            return stdout
-        return f"sha256:{stdout}" if len(stdout) >= 12 else stdout
-    return None
+    digests = parse_repo_digests(stdout) if rc == 0 else []
+    if digests:
+        return digests
+
+    # Images loaded from an offline bundle have no RepoDigests
+    image_id, _, rc = run_command(
+        ["docker", "image", "inspect", image_ref, "--format", "{{.Id}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    if rc == 0 and image_id:
+        imported = load_launcher_prefs().get("imported_digests", {}).get(image_id)
+        if imported:
+            return [imported]
+    return []
+
+
+def get_local_image_digest() -> Optional[str]:
+    """
+    Get the registry digest of the locally pulled image.
+
+    Returns:
+        The registry digest (sha256 hash) or None if not found
+    """
+    digests = get_local_image_digests()
+    return digests[0] if digests else None
 
 
 def get_container_image_digest() -> Optional[str]:
@@ -327,81 +1226,280 @@ def get_container_image_digest() -> Optional[str]:
     return None
 
 
-def check_dockerhub_version() -> Tuple[bool, Optional[str], Optional[str]]:
+def get_image_id(image_ref: Optional[str] = None) -> Optional[str]:
     """
-    Check Docker Hub for the latest image version and compare with local.
+    Get the local image ID (config digest) a reference currently points at.
 
-    Uses docker manifest inspect to get the remote digest, which is more reliable
-    than the Docker Hub API for public images.
+    Args:
+        image_ref: Image reference (defaults to the one in docker-compose.yml)
 
     Returns:
-        Tuple of (update_available: bool, remote_digest: str|None, error: str|None)
-        - update_available: True if remote image is different from local
-        - remote_digest: The digest from Docker Hub, or None on error
-        - error: Error message if the check failed, None otherwise
+        Full image ID ("sha256:...") or None if the image is not present
     """
-    try:
-        # Method 1: Use docker manifest inspect (most reliable when Docker is running)
-        stdout, stderr, rc = run_command(
-            ["docker", "manifest", "inspect", DOCKER_IMAGE_FULL, "--verbose"],
-            timeout=DOCKER_INFO_TIMEOUT,
-        )
+    stdout, _, rc = run_command(
+        ["docker", "image", "inspect", image_ref or get_compose_image_ref(), "--format", "{{.Id}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    return stdout if rc == 0 and stdout.startswith("sha256:") else None
 
-        if rc == 0 and stdout:
-            # Parse the manifest output to get the digest
-            # The output is JSON when using --verbose
-            try:
-                data = json.loads(stdout)
-                # The structure varies, try to find the digest
-                remote_digest = None
-
-                # Try different locations in the JSON structure
-                if isinstance(data, dict):
-                    # Direct digest field
-                    remote_digest = data.get("digest") or data.get("Descriptor", {}).get("digest")
-
-                    # Try manifest list
-                    if not remote_digest and "manifests" in data:
-                        for manifest in data["manifests"]:
-                            if manifest.get("platform", {}).get("architecture") in ["amd64", "arm64"]:
-                                remote_digest = manifest.get("digest")
-                                break
-
-                    # Try schema 2 manifest
-                    if not remote_digest and "manifest" in data:
-                        remote_digest = data["manifest"].get("config", {}).get("digest")
-
-                if remote_digest:
-                    return _compare_digests(remote_digest)
-            except json.JSONDecodeError:
-                pass
 
-        # Method 2: Fall back to Docker Hub API
-        namespace, repo = DOCKER_IMAGE.split("/")
-        api_url = f"https://hub.docker.com/v2/repositories/{namespace}/{repo}/tags/{DOCKER_TAG}"
+def stage_image(digest: str, cancel_event=None) -> Tuple[bool, str]:
+    """
+    Download an update without making it the image the tracker runs.
 
-        req = urllib.request.Request(
-            api_url,
-            headers={"User-Agent": "NovaLauncher/1.0"},
+    The image is pulled by digest (via the registry mirror when configured
+    and reachable), so DOCKER_IMAGE_FULL and the compose file's reference
+    keep pointing at the current image and a restart does not pick up the
+    update. It is tagged DOCKER_IMAGE_STAGED until apply_staged_image().
+
+    Args:
+        digest: Registry digest to download ("sha256:...")
+        cancel_event: Optional threading.Event that cancels the pull
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    sources = []
+    mirror = get_registry_mirror()
+    if mirror and is_mirror_reachable(mirror):
+        sources.append((f"{mirror}/{DOCKER_IMAGE}@{digest}", f"Update downloaded from mirror {mirror}"))
+    sources.append((f"{DOCKER_IMAGE}@{digest}", "Update downloaded"))
+
+    stderr = ""
+    for pull_ref, message in sources:
+        _, stderr, rc = run_managed_command(
+            ["docker", "pull", pull_ref],
+            stall_timeout=PULL_STALL_TIMEOUT,
+            cancel_event=cancel_event,
         )
+        if rc == 0:
+            _, stderr, rc = run_command(["docker", "tag", pull_ref, DOCKER_IMAGE_STAGED],
+                                        timeout=DOCKER_INFO_TIMEOUT)
+            return (True, message) if rc == 0 else (False, stderr or "Failed to tag the update")
+        if cancel_event is not None and cancel_event.is_set():
+            return False, stderr
+    return False, stderr or "Failed to pull image"
 
-        try:
-            with urllib.request.urlopen(req, timeout=10, context=_SSL_CONTEXT) as response:
-                data = json.loads(response.read().decode())
 
-                # Get the digest from Docker Hub response
-                remote_digest = data.get("digest")
+def apply_staged_image() -> Tuple[bool, str]:
+    """
+    Make the staged update the image the tracker runs (part of the update flow).
+
+    Points DOCKER_IMAGE_FULL and the compose file's reference at the staged
+    image and drops the staging tag; recreate the container afterwards.
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    for tag in dict.fromkeys((DOCKER_IMAGE_FULL, get_compose_image_ref())):
+        _, stderr, rc = run_command(["docker", "tag", DOCKER_IMAGE_STAGED, tag], timeout=DOCKER_INFO_TIMEOUT)
+        if rc != 0:
+            return False, stderr or f"Failed to tag {tag}"
+    discard_staged_image()
+    return True, "Using the image downloaded in the background"
+
+
+def discard_staged_image() -> None:
+    """Drop the staging tag (the image itself goes when it is pruned)."""
+    run_command(["docker", "image", "rm", DOCKER_IMAGE_STAGED], timeout=DOCKER_INFO_TIMEOUT)
+
+
+def is_update_staged() -> bool:
+    """
+    Check whether an update has been downloaded but not yet applied.
 
-                if not remote_digest:
-                    # Try alternate field names
-                    images = data.get("images", [])
-                    if images and len(images) > 0:
-                        remote_digest = images[0].get("digest")
+    Returns:
+        True if DOCKER_IMAGE_STAGED exists and differs from the image the
+        compose file's reference points at
+    """
+    staged_image = get_image_id(DOCKER_IMAGE_STAGED)
+    return staged_image is not None and staged_image != get_image_id()
+
+
+_host_platform: Optional[Dict[str, str]] = None
+
+# Default variants, as recorded in image indexes
+_DEFAULT_VARIANTS = {"arm64": "v8", "arm": "v7"}
+
+
+def get_host_platform() -> Dict[str, str]:
+    """
+    Get the OS, architecture and variant images are pulled for.
 
-                if not remote_digest:
-                    return False, None, "Could not find digest in Docker Hub response"
+    Asks the daemon, since Docker Desktop runs Linux images whatever the
+    client OS is. Cached for the session.
 
-                return _compare_digests(remote_digest)
+    Returns:
+        Dict with "os", "architecture" and "variant" (may be empty)
+    """
+    global _host_platform
+    if _host_platform is not None:
+        return _host_platform
+
+    stdout, _, rc = run_command(
+        ["docker", "version", "--format", "{{.Server.Os}}/{{.Server.Arch}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    machine = platform.machine().lower()
+    if rc == 0 and "/" in stdout:
+        platform_info = parse_server_platform(stdout)
+    else:
+        arch = {"x86_64": "amd64", "amd64": "amd64", "aarch64": "arm64",
+                "arm64": "arm64"}.get(machine, "arm" if machine.startswith("arm") else machine)
+        platform_info = {"os": "linux", "architecture": arch, "variant": _DEFAULT_VARIANTS.get(arch, "")}
+
+    # The daemon does not report the ARM variant; only a local one can be detected
+    if platform_info["architecture"] == "arm" and not is_remote() and machine.startswith("armv6"):
+        platform_info["variant"] = "v6"
+
+    if rc == 0:
+        _host_platform = platform_info
+    return platform_info
+
+
+def parse_server_platform(output: str) -> Dict[str, str]:
+    """
+    Build a platform dict from `docker version` "{{.Server.Os}}/{{.Server.Arch}}" output.
+
+    Args:
+        output: e.g. "linux/arm64"
+
+    Returns:
+        Dict with "os", "architecture" and the default "variant" for it
+    """
+    host_os, _, arch = output.strip().partition("/")
+    return {"os": host_os, "architecture": arch, "variant": _DEFAULT_VARIANTS.get(arch, "")}
+
+
+def select_platform_manifest(index: Dict[str, Any], host: Dict[str, str]) -> Optional[str]:
+    """
+    Pick the manifest for a platform from an image index / manifest list.
+
+    Attestation entries (platform "unknown/unknown") never match. An entry
+    without a variant matches any variant of its architecture, but an exact
+    variant match is preferred.
+
+    Args:
+        index: Parsed image index, or any dict with a "manifests" list of
+            descriptors carrying a "platform"
+        host: Platform as returned by get_host_platform()
+
+    Returns:
+        Digest of the matching manifest, or None
+    """
+    fallback = None
+    for entry in index.get("manifests") or []:
+        entry_platform = entry.get("platform") or {}
+        if entry_platform.get("os") == "unknown":
+            continue
+        if (entry_platform.get("os") != host.get("os")
+                or entry_platform.get("architecture") != host.get("architecture")):
+            continue
+        entry_variant = entry_platform.get("variant") or _DEFAULT_VARIANTS.get(
+            entry_platform.get("architecture"), "")
+        if entry_variant == (host.get("variant") or entry_variant):
+            return entry.get("digest")
+        if not entry_platform.get("variant") and fallback is None:
+            fallback = entry.get("digest")
+    return fallback
+
+
+def _normalize_digest(digest: str) -> str:
+    return digest.replace("sha256:", "").lower()[:64]
+
+
+def _registry_source(base_url: str, token: Optional[str] = None):
+    """Manifest source backed by a registry HTTP API (see _compare_digests)."""
+    def fetch(reference: str, body: bool):
+        return _registry_fetch_manifest(base_url, DOCKER_IMAGE, reference, token, body=body)
+    return fetch
+
+
+def _manifest_inspect_source(reference: str, body: bool):
+    """
+    Manifest source backed by `docker manifest inspect --verbose`.
+
+    For an index the CLI lists the platform manifests but not the index
+    digest, so only a platform comparison is possible.
+    """
+    separator = "@" if reference.startswith("sha256:") else ":"
+    stdout, stderr, rc = run_command(
+        ["docker", "manifest", "inspect", f"{DOCKER_IMAGE}{separator}{reference}", "--verbose"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    if rc != 0 or not stdout:
+        return None, None
+    try:
+        data = json.loads(stdout)
+    except json.JSONDecodeError:
+        return None, None
+    if isinstance(data, list):
+        return {"manifests": [entry.get("Descriptor", {}) for entry in data]}, None
+    # Single-platform image: its manifest digest is the top-level digest
+    return {}, data.get("Descriptor", {}).get("digest")
+
+
+def _hub_api_source(reference: str, body: bool):
+    """
+    Manifest source backed by the Docker Hub web API (tags only).
+
+    "digest" is the index digest; "images" lists the platform manifests.
+    """
+    if reference.startswith("sha256:"):
+        return None, None
+    req = urllib.request.Request(DOCKER_HUB_API, headers={"User-Agent": "NovaLauncher/1.0"})
+    with urllib.request.urlopen(req, timeout=10, context=_SSL_CONTEXT) as response:
+        data = json.loads(response.read().decode())
+    index = {"manifests": [
+        {"digest": image.get("digest"),
+         "platform": {"os": image.get("os"), "architecture": image.get("architecture"),
+                      "variant": image.get("variant")}}
+        for image in data.get("images") or []
+    ]}
+    return index, data.get("digest")
+
+
+def check_dockerhub_version() -> Tuple[bool, Optional[str], Optional[str]]:
+    """
+    Check Docker Hub for the latest image version and compare with local.
+
+    Sources are tried in order: the registry mirror (when configured and
+    reachable), Docker Hub's registry API, `docker manifest inspect`, and the
+    Docker Hub web API. Digests are only ever compared like for like (see
+    _compare_digests).
+
+    Returns:
+        Tuple of (update_available: bool, remote_digest: str|None, error: str|None)
+        - update_available: True if remote image is different from local
+        - remote_digest: The digest from Docker Hub, or None on error
+        - error: Error message if the check failed, None otherwise
+    """
+    try:
+        # Method 0: Ask the registry mirror / pull-through cache
+        mirror = get_registry_mirror()
+        if mirror and is_mirror_reachable(mirror):
+            result = _compare_digests(_registry_source(_mirror_base_url(mirror)))
+            if result:
+                return result
+
+        # Method 1: Docker Hub's registry API (HEAD requests are not rate limited)
+        token = _docker_hub_token()
+        if token:
+            result = _compare_digests(_registry_source(DOCKER_HUB_REGISTRY, token))
+            if result:
+                return result
+
+        # Method 2: docker manifest inspect (uses the daemon's credentials)
+        result = _compare_digests(_manifest_inspect_source)
+        if result:
+            return result
+
+        # Method 3: Fall back to Docker Hub API
+        try:
+            result = _compare_digests(_hub_api_source)
+            if result:
+                return result
+            return False, None, "Could not find digest in Docker Hub response"
 
         except urllib.error.HTTPError as e:
             if e.code == 404:
@@ -414,47 +1512,245 @@ def check_dockerhub_version() -> Tuple[bool, Optional[str], Optional[str]]:
         return False, None, str(e)
 
 
-def _compare_digests(remote_digest: str) -> Tuple[bool, Optional[str], Optional[str]]:
+def registry_manifest_source():
     """
-    Compare a remote digest with the local image digest.
+    Pick the manifest source used for update checks.
+
+    Returns:
+        Callable (reference, body) -> (manifest|None, top-level digest|None):
+        the registry mirror when reachable, else Docker Hub's registry API,
+        else the Docker Hub web API
+    """
+    mirror = get_registry_mirror()
+    if mirror and is_mirror_reachable(mirror):
+        return _registry_source(_mirror_base_url(mirror))
+    token = _docker_hub_token()
+    if token:
+        return _registry_source(DOCKER_HUB_REGISTRY, token)
+    return _hub_api_source
+
+
+def compare_image_digests(
+    local_digests: list,
+    host: Dict[str, str],
+    fetch,
+) -> Tuple[bool, Optional[str], Optional[str]]:
+    """
+    Check for an update for an image on any daemon (e.g., a fleet host).
 
     Args:
-        remote_digest: The digest from Docker Hub or manifest inspect
+        local_digests: The host's RepoDigests for the image (see parse_repo_digests)
+        host: The host's platform (see parse_server_platform)
+        fetch: Manifest source from registry_manifest_source()
 
     Returns:
         Tuple of (update_available, remote_digest, error)
     """
-    local_digest = get_local_image_digest()
+    try:
+        result = _compare_digests(fetch, local_digests, host)
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        return False, None, str(e)
+    return result or (False, None, "Could not determine the remote digest")
+
+
+def _compare_digests(
+    fetch,
+    local_digests: Optional[list] = None,
+    host: Optional[Dict[str, str]] = None,
+) -> Optional[Tuple[bool, Optional[str], Optional[str]]]:
+    """
+    Decide whether the tag on a manifest source differs from the local image.
 
-    if local_digest is None:
+    The local RepoDigests hold index digests, so the tag's index digest is
+    compared first. An index digest also changes when only another platform
+    or an attestation was rebuilt; in that case the manifests selected for
+    the host platform are compared instead (remote index vs the index the
+    local image was pulled by), so such releases do not trigger an update.
+
+    Args:
+        fetch: Callable (reference, body) -> (manifest|None, top-level digest|None)
+        local_digests: Digests of the image to compare (defaults to the
+            managed daemon's image)
+        host: Platform of that daemon (defaults to get_host_platform())
+
+    Returns:
+        Tuple of (update_available, remote_digest, error), or None if this
+        source cannot answer
+    """
+    if local_digests is None:
+        local_digests = get_local_image_digests()
+    local_normalized = {_normalize_digest(d) for d in local_digests}
+
+    remote_index, remote_digest = fetch(DOCKER_TAG, False)
+    if remote_digest and _normalize_digest(remote_digest) in local_normalized:
+        return False, remote_digest, None
+
+    if not local_digests:
         # No local image, update available
+        if remote_digest:
+            return True, remote_digest, None
+        return None
+
+    if remote_index is None:
+        remote_index, body_digest = fetch(DOCKER_TAG, True)
+        remote_digest = remote_digest or body_digest
+
+    host = host or get_host_platform()
+    remote_platform = select_platform_manifest(remote_index, host) if remote_index else None
+    if remote_platform:
+        for local_digest in local_digests:
+            local_index, _ = fetch(local_digest, True)
+            local_platform = select_platform_manifest(local_index, host) if local_index else None
+            if local_platform:
+                update_available = _normalize_digest(local_platform) != _normalize_digest(remote_platform)
+                return update_available, remote_digest or remote_platform, None
+
+    if remote_digest:
         return True, remote_digest, None
+    return None
 
-    # Normalize digests for comparison
-    remote_normalized = remote_digest.replace("sha256:", "").lower()
-    local_normalized = local_digest.replace("sha256:", "").lower()
-
-    # Compare first 64 chars (full SHA256)
-    update_available = remote_normalized[:64] != local_normalized[:64]
 
-    return update_available, remote_digest, None
+def _is_nova_ref(ref: str) -> bool:
+    """Whether an image reference (tag or repo digest) is DOCKER_IMAGE, from any registry."""
+    repo = ref.partition("@")[0] if "@" in ref else ref.rpartition(":")[0]
+    return repo == DOCKER_IMAGE or repo.endswith(f"/{DOCKER_IMAGE}")
 
 
-def prune_images() -> Tuple[bool, str]:
+def prune_images(keep_previous: int = 0) -> Tuple[bool, str, int]:
     """
-    Remove unused Docker images to free disk space.
+    Remove superseded Nova images, leaving every other image on the host alone.
+
+    Candidates are images of DOCKER_IMAGE from Docker Hub or a registry
+    mirror (tagged, or kept only by a repo digest after the tag moved). The
+    current image, the image the compose file runs and the image of the
+    Nova container are always kept, as is a staged update (see
+    stage_image), plus the newest `keep_previous` others. Removing an image
+    removes all of its Nova references; an image also tagged under another
+    repository keeps that tag. Images still used by any container are
+    skipped by Docker itself.
+
+    Args:
+        keep_previous: Number of older Nova images to keep for rollback
 
     Returns:
-        Tuple of (success: bool, message: str)
+        Tuple of (success: bool, message: str, reclaimed_bytes: int)
+        reclaimed_bytes is the sum of removed image sizes; layers shared with
+        kept images are counted, so it is an upper bound.
     """
+    candidate_ids = set()
+
+    stdout, stderr, rc = run_command(
+        ["docker", "image", "ls", "--no-trunc", "--format", "{{.ID}}\t{{.Repository}}:{{.Tag}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    if rc != 0:
+        return False, stderr or "Failed to list images", 0
+    for line in stdout.splitlines():
+        image_id, _, ref = line.partition("\t")
+        if image_id and _is_nova_ref(ref):
+            candidate_ids.add(image_id)
+
+    # Superseded images lose their tag and show up as dangling
     stdout, stderr, rc = run_command(
-        ["docker", "image", "prune", "-f"],
+        ["docker", "image", "ls", "--filter", "dangling=true", "--no-trunc", "--format", "{{.ID}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    if rc == 0:
+        candidate_ids.update(line for line in stdout.splitlines() if line)
+
+    if not candidate_ids:
+        return True, "No Nova images to clean up", 0
+
+    stdout, stderr, rc = run_command(
+        ["docker", "image", "inspect", "--format",
+         "{{.Id}}\t{{.Created}}\t{{.Size}}\t{{join .RepoTags \",\"}}\t{{join .RepoDigests \",\"}}"]
+        + sorted(candidate_ids),
         timeout=DOCKER_CMD_TIMEOUT,
     )
+    if rc != 0 and not stdout:
+        return False, stderr or "Failed to inspect images", 0
+
+    keep_ids = set()
+    for args in (
+        ["docker", "image", "inspect", DOCKER_IMAGE_FULL, "--format", "{{.Id}}"],
+        ["docker", "image", "inspect", get_compose_image_ref(), "--format", "{{.Id}}"],
+        ["docker", "image", "inspect", DOCKER_IMAGE_STAGED, "--format", "{{.Id}}"],
+        ["docker", "inspect", "--format", "{{.Image}}", DOCKER_CONTAINER_NAME],
+    ):
+        out, _, code = run_command(args, timeout=DOCKER_INFO_TIMEOUT)
+        if code == 0 and out:
+            keep_ids.add(out)
+
+    superseded = []
+    for line in stdout.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 5:
+            continue
+        image_id, created, size, tags, digests = parts
+        refs = [r for r in (tags.split(",") + digests.split(",")) if r]
+        nova_refs = [r for r in refs if _is_nova_ref(r)]
+        if not nova_refs or image_id in keep_ids:
+            continue
+        superseded.append((created, image_id, int(size) if size.isdigit() else 0, nova_refs))
+
+    # Newest first; RFC 3339 timestamps sort lexically
+    superseded.sort(reverse=True)
+    to_remove = superseded[max(keep_previous, 0):]
+
+    removed = 0
+    reclaimed = 0
+    for _, image_id, size, nova_refs in to_remove:
+        # By reference rather than ID: `docker image rm <id>` refuses images
+        # referenced from several repositories (e.g. Docker Hub and a mirror).
+        # Removing a tag can also drop digests of its repository, so later
+        # references may already be gone; check the image itself afterwards
+        run_command(["docker", "image", "rm"] + nova_refs, timeout=DOCKER_CMD_TIMEOUT)
+        _, _, rc = run_command(
+            ["docker", "image", "inspect", image_id, "--format", "{{.Id}}"],
+            timeout=DOCKER_INFO_TIMEOUT,
+        )
+        if rc != 0:
+            removed += 1
+            reclaimed += size
+
+    return True, f"Removed {removed} old Nova image(s)", reclaimed
+
 
+def get_docker_disk_usage() -> Tuple[Optional[list], Optional[int]]:
+    """
+    Get Docker's own disk usage summary and the size of the Nova image.
+
+    `docker system df` is a thin wrapper over the Engine API /system/df
+    endpoint, so this works identically for local and Desktop daemons.
+
+    Returns:
+        Tuple of (rows, nova_image_bytes)
+        - rows: list of dicts with Type, TotalCount, Active, Size, Reclaimable,
+          or None on error
+        - nova_image_bytes: size of DOCKER_IMAGE_FULL in bytes, or None
+    """
+    rows = None
+    stdout, stderr, rc = run_command(
+        ["docker", "system", "df", "--format", "{{json .}}"],
+        timeout=DOCKER_CMD_TIMEOUT,
+    )
     if rc == 0:
-        return True, "Images pruned successfully"
-    return False, stderr or "Failed to prune images"
+        rows = []
+        for line in stdout.splitlines():
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+    image_bytes = None
+    stdout, stderr, rc = run_command(
+        ["docker", "image", "inspect", DOCKER_IMAGE_FULL, "--format", "{{.Size}}"],
+        timeout=DOCKER_INFO_TIMEOUT,
+    )
+    if rc == 0 and stdout.isdigit():
+        image_bytes = int(stdout)
+
+    return rows, image_bytes
 
 
 # --- Launcher Preferences ---
@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+Status and bulk actions across several tracker hosts.
+
+Hosts come from the "fleet_hosts" pref: "ssh://user@host" or "tcp://host:2376"
+URLs, or "local" for this machine's daemon. Everything runs on one asyncio
+event loop: docker commands are asyncio subprocesses, the dashboard check is
+an asyncio connection, and a semaphore caps how many hosts are worked on at
+once, so a large fleet needs neither a thread per host nor a burst of SSH
+handshakes. Each ssh:// host keeps one SSHTunnel (see remote_host) for the
+life of the Fleet, so repeated refreshes reuse its connection.
+"""
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import (
+    DOCKER_CONTAINER_NAME,
+    DOCKER_IMAGE_FULL,
+    FLEET_BULK_CONCURRENCY,
+    FLEET_BULK_TIMEOUT,
+    FLEET_CONCURRENCY,
+    FLEET_HOST_TIMEOUT,
+    PORT,
+    WEB_READY_TIMEOUT,
+)
+from docker_ops import (
+    compare_image_digests,
+    docker_path_env,
+    get_compose_image_ref,
+    get_container_health,
+    image_pull_plan,
+    is_container_paused,
+    parse_repo_digests,
+    parse_server_platform,
+    registry_manifest_source,
+)
+from remote_host import SSHTunnel
+
+LOCAL_HOST = "local"
+BULK_ACTIONS = ("start", "stop", "update")
+
+_COMPOSE_LABELS = (
+    '{{index .Config.Labels "com.docker.compose.project.working_dir"}}|'
+    '{{index .Config.Labels "com.docker.compose.project.config_files"}}'
+)
+
+
+def _subprocess_flags() -> int:
+    """Return CREATE_NO_WINDOW flag on Windows to prevent console flashing."""
+    if sys.platform == "win32":
+        return subprocess.CREATE_NO_WINDOW
+    return 0
+
+
+def host_label(host: str) -> str:
+    """Short display name for a fleet host entry."""
+    if host == LOCAL_HOST:
+        return "This computer"
+    parsed = urllib.parse.urlparse(host)
+    return parsed.hostname or host
+
+
+def _cached_source(fetch):
+    """Memoize a manifest source so every host shares one lookup per reference."""
+    cache: Dict[Tuple[str, bool], Any] = {}
+    key_locks: Dict[Tuple[str, bool], threading.Lock] = {}
+    lock = threading.Lock()
+
+    def cached(reference: str, body: bool):
+        key = (reference, body)
+        with lock:
+            key_lock = key_locks.setdefault(key, threading.Lock())
+        # Concurrent hosts asking for the same reference wait for one request
+        with key_lock:
+            if key not in cache:
+                cache[key] = fetch(reference, body)
+            return cache[key]
+
+    return cached
+
+
+class Fleet:
+    """A set of tracker hosts polled and controlled together."""
+
+    def __init__(
+        self,
+        hosts: List[str],
+        concurrency: int = FLEET_CONCURRENCY,
+        timeout: float = FLEET_HOST_TIMEOUT,
+    ):
+        """
+        Args:
+            hosts: Host entries from the "fleet_hosts" pref
+            concurrency: Maximum hosts probed at once
+            timeout: Seconds before one host's probe is abandoned
+        """
+        self.hosts = list(dict.fromkeys(h.strip() for h in hosts if h and h.strip()))
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._tunnels: Dict[str, SSHTunnel] = {}
+
+    async def _env(self, host: str) -> Tuple[Optional[dict], Optional[str]]:
+        """
+        Build the docker environment for a host, opening its tunnel if needed.
+
+        Returns:
+            Tuple of (env, error); env is None if the host is unreachable
+        """
+        env = docker_path_env()
+        if host == LOCAL_HOST:
+            return env, None
+
+        scheme = urllib.parse.urlparse(host).scheme
+        env.pop("DOCKER_CONTEXT", None)
+        if scheme == "tcp":
+            env["DOCKER_HOST"] = host
+            return env, None
+        if scheme != "ssh":
+            return None, f"Unsupported host (use ssh://, tcp:// or {LOCAL_HOST})"
+
+        tunnel = self._tunnels.get(host)
+        if tunnel is None:
+            tunnel = self._tunnels[host] = SSHTunnel(host)
+        if not tunnel.start():
+            return None, tunnel.last_error or "SSH tunnel unavailable"
+        while True:
+            ready = tunnel.poll()
+            if ready is not None:
+                break
+            await asyncio.sleep(0.1)
+        if not ready:
+            return None, tunnel.last_error or "SSH tunnel failed"
+        env["DOCKER_HOST"] = tunnel.docker_host
+        return env, None
+
+    async def _run(self, args: List[str], env: Optional[dict] = None) -> Tuple[str, str, int]:
+        """
+        Run a command without blocking the event loop.
+
+        The process is killed if the calling task is cancelled (e.g., by a
+        timeout), so abandoned hosts leave nothing running.
+
+        Returns:
+            Tuple of (stdout, stderr, return_code)
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                creationflags=_subprocess_flags(),
+            )
+        except (FileNotFoundError, OSError) as e:
+            return "", str(e), 1
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+            raise
+        return (stdout.decode("utf-8", "replace").strip(),
+                stderr.decode("utf-8", "replace").strip(),
+                proc.returncode)
+
+    async def _docker(self, env: dict, args: List[str]) -> Tuple[str, str, int]:
+        return await self._run(["docker"] + args, env)
+
+    async def _dashboard_latency(self, host: str) -> Optional[float]:
+        """
+        Time one dashboard request on a host.
+
+        Returns:
+            Round trip in milliseconds, or None if the dashboard did not answer
+        """
+        hostname = "localhost" if host == LOCAL_HOST else urllib.parse.urlparse(host).hostname
+        started = time.perf_counter()
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(hostname, PORT), WEB_READY_TIMEOUT)
+            writer.write(f"GET / HTTP/1.0\r\nHost: {hostname}:{PORT}\r\n\r\n".encode("ascii"))
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), WEB_READY_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        finally:
+            if writer is not None:
+                writer.close()
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[1].startswith((b"2", b"3")):
+            return None
+        return (time.perf_counter() - started) * 1000
+
+    async def _probe(self, host: str, fetch) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "host": host, "state": "unknown", "digest": None,
+            "update": None, "latency_ms": None, "error": None,
+        }
+        env, error = await self._env(host)
+        if env is None:
+            result["state"] = "unreachable"
+            result["error"] = error
+            return result
+
+        (status, stderr, rc), (digests_out, _, _), (platform_out, _, _), latency = await asyncio.gather(
+            self._docker(env, ["ps", "-a", "--filter", f"name=^{DOCKER_CONTAINER_NAME}$",
+                               "--format", "{{.Status}}"]),
+            self._docker(env, ["image", "inspect", DOCKER_IMAGE_FULL,
+                               "--format", "{{json .RepoDigests}}"]),
+            self._docker(env, ["version", "--format", "{{.Server.Os}}/{{.Server.Arch}}"]),
+            self._dashboard_latency(host),
+        )
+        if rc != 0:
+            result["state"] = "unreachable"
+            result["error"] = stderr or "Docker is not responding"
+            return result
+
+        status = status.splitlines()[0] if status else ""
+        if not status:
+            result["state"] = "not installed"
+        elif not status.startswith("Up"):
+            result["state"] = "stopped"
+        elif is_container_paused(status):
+            result["state"] = "paused"
+        else:
+            health = get_container_health(status)
+            if health == "unhealthy":
+                result["state"] = health
+            else:
+                # The healthcheck runs every 30 s; an answering dashboard is enough
+                result["state"] = "running" if latency is not None else "initializing"
+        result["latency_ms"] = latency
+
+        digests = parse_repo_digests(digests_out)
+        result["digest"] = digests[0] if digests else None
+        if fetch is not None and "/" in platform_out:
+            update, _, error = await asyncio.to_thread(
+                compare_image_digests, digests, parse_server_platform(platform_out), fetch)
+            result["update"] = None if error else update
+        return result
+
+    async def _probe_limited(self, host: str, semaphore: asyncio.Semaphore, fetch) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(self._probe(host, fetch), self.timeout)
+            except asyncio.TimeoutError:
+                return {"host": host, "state": "unreachable", "digest": None, "update": None,
+                        "latency_ms": None, "error": f"No answer within {self.timeout:.0f}s"}
+
+    async def poll_all(
+        self,
+        check_updates: bool = True,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Probe every host concurrently.
+
+        Args:
+            check_updates: Also compare each host's image with the registry
+                (one registry lookup per tag/platform, shared by all hosts)
+            on_result: Called with each host's result as soon as it is known
+
+        Returns:
+            One dict per host (in pref order) with host, state, digest,
+            update (True/False/None), latency_ms and error
+        """
+        # An explicit refresh retries failed hosts immediately
+        for tunnel in self._tunnels.values():
+            tunnel.reset_backoff()
+
+        fetch = None
+        if check_updates:
+            fetch = _cached_source(await asyncio.to_thread(registry_manifest_source))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def probe(host):
+            result = await self._probe_limited(host, semaphore, fetch)
+            if on_result:
+                on_result(result)
+            return result
+
+        return list(await asyncio.gather(*(probe(host) for host in self.hosts)))
+
+    async def _recreate(self, host: str, env: dict) -> Tuple[bool, str]:
+        """Recreate a host's container from its compose project to use a pulled image."""
+        labels, stderr, rc = await self._docker(
+            env, ["inspect", DOCKER_CONTAINER_NAME, "--format", _COMPOSE_LABELS])
+        working_dir, _, config_files = labels.partition("|")
+        if rc != 0 or not working_dir or not config_files:
+            return True, "Image downloaded; the tracker applies it on its next restart"
+
+        compose_args = ["docker", "compose", "--project-directory", working_dir]
+        for config_file in config_files.split(","):
+            compose_args += ["-f", config_file]
+        compose_args += ["up", "-d"]
+
+        if host == LOCAL_HOST:
+            _, stderr, rc = await self._run(compose_args, env)
+        elif urllib.parse.urlparse(host).scheme == "ssh":
+            # The compose file lives on the remote machine; run compose there
+            _, stderr, rc = await self._run(self._tunnels[host].ssh_command(compose_args))
+        else:
+            return True, "Image downloaded; the host's launcher applies it on restart"
+        if rc != 0:
+            return False, stderr or "Failed to recreate the container"
+        return True, "Updated"
+
+    async def _act(self, host: str, action: str) -> Tuple[bool, str]:
+        env, error = await self._env(host)
+        if env is None:
+            return False, error
+        if action == "start":
+            _, stderr, rc = await self._docker(env, ["start", DOCKER_CONTAINER_NAME])
+            return (True, "Started") if rc == 0 else (False, stderr or "Failed to start")
+        if action == "stop":
+            _, stderr, rc = await self._docker(env, ["stop", DOCKER_CONTAINER_NAME])
+            return (True, "Stopped") if rc == 0 else (False, stderr or "Failed to stop")
+
+        ok, message = await self._pull(env)
+        if not ok:
+            return False, message
+        return await self._recreate(host, env)
+
+    async def _pull(self, env: dict) -> Tuple[bool, str]:
+        """
+        Pull the image a host's container runs, the way pull_image does locally.
+
+        A compose file written with a registry mirror runs the mirror's
+        reference, so that is pulled (falling back to Docker Hub) and both
+        tags are pointed at the result; recreating then uses the new image.
+        """
+        image_ref, _, rc = await self._docker(
+            env, ["inspect", DOCKER_CONTAINER_NAME, "--format", "{{.Config.Image}}"])
+        if rc != 0 or not image_ref:
+            image_ref = get_compose_image_ref()
+
+        stderr = ""
+        for pull_ref, tags in image_pull_plan(image_ref):
+            _, stderr, rc = await self._docker(env, ["pull", "-q", pull_ref])
+            if rc == 0:
+                for tag in tags:
+                    _, stderr, rc = await self._docker(env, ["tag", pull_ref, tag])
+                    if rc != 0:
+                        return False, stderr or f"Failed to tag {tag}"
+                return True, f"Pulled {pull_ref}"
+        return False, stderr or "Failed to pull image"
+
+    async def bulk(
+        self,
+        action: str,
+        hosts: Optional[List[str]] = None,
+        concurrency: int = FLEET_BULK_CONCURRENCY,
+        timeout: float = FLEET_BULK_TIMEOUT,
+        on_result: Optional[Callable[[str, bool, str], None]] = None,
+    ) -> List[Tuple[str, bool, str]]:
+        """
+        Run an action on several hosts, a few at a time.
+
+        Args:
+            action: "start", "stop" or "update" (pull, then recreate from the
+                host's compose project)
+            hosts: Hosts to act on (default: all)
+            concurrency: Maximum hosts acted on at once; kept low so pulls
+                do not saturate the local uplink or a shared registry mirror
+            timeout: Seconds before one host's action is abandoned
+            on_result: Called with (host, success, message) as each host finishes
+
+        Returns:
+            List of (host, success, message) tuples
+        """
+        if action not in BULK_ACTIONS:
+            raise ValueError(f"Unknown fleet action: {action}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(host):
+            async with semaphore:
+                try:
+                    success, message = await asyncio.wait_for(self._act(host, action), timeout)
+                except asyncio.TimeoutError:
+                    success, message = False, f"No answer within {timeout:.0f}s"
+            if on_result:
+                on_result(host, success, message)
+            return host, success, message
+
+        return list(await asyncio.gather(*(run(host) for host in hosts or self.hosts)))
+
+    def close(self) -> None:
+        """Close all SSH tunnels."""
+        for tunnel in self._tunnels.values():
+            tunnel.stop()
+        self._tunnels.clear()
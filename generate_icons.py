@@ -1,20 +1,36 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Generate Windows .ico file from PNG source.
+Generate platform icon sets from the PNG source.
 
-This script converts nova_logo.png to nova_logo.ico for Windows builds.
-Run this before building the Windows executable.
+Outputs (next to this script):
+    nova_logo.ico          Windows, 16-256 px
+    nova_logo.iconset/     macOS iconset (input for `iconutil -c icns`)
+    nova_logo.icns         macOS, only from a source of at least 1024 px so a
+                           small source never replaces the hand-made icon
+    icons/hicolor/         Linux freedesktop theme PNGs
+
+Sizes larger than the source are left out of every set rather than upscaled.
+The source is scaled once to the largest remaining size; every other size is
+derived from that image in a process pool, halving with a box filter until it
+is within 2x of the target and finishing with LANCZOS. A manifest of content
+hashes (.icon_cache.json) lets repeated builds skip the work entirely when
+neither the source nor the outputs changed.
 
 Requirements:
     pip install Pillow
 
 Usage:
-    python generate_icons.py
+    python generate_icons.py [--force]
 """
 
+import argparse
+import hashlib
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 try:
     from PIL import Image
@@ -22,69 +38,219 @@ except ImportError:
     print("Error: Pillow is required. Install with: pip install Pillow")
     sys.exit(1)
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_NAME = "nova_logo.png"
+ICO_NAME = "nova_logo.ico"
+ICNS_NAME = "nova_logo.icns"
+ICONSET_DIR = "nova_logo.iconset"
+HICOLOR_DIR = os.path.join("icons", "hicolor")
+LINUX_ICON_NAME = "nova-dso-tracker"
+MANIFEST_NAME = ".icon_cache.json"
+
+# Bump when the outputs change for the same source
+GENERATOR_VERSION = 3
+
+ICO_SIZES = [16, 32, 48, 64, 128, 256]
+ICONSET_SIZES = [16, 32, 128, 256, 512]     # Each also has an @2x variant
+HICOLOR_SIZES = [16, 22, 24, 32, 48, 64, 128, 256, 512]
+
+_base_image: Optional[Image.Image] = None
+
+
+def _png_outputs(max_size: int) -> Dict[int, List[str]]:
+    """
+    PNG files to write, keyed by pixel size (paths relative to SCRIPT_DIR).
+
+    Args:
+        max_size: Largest size to emit (the source edge)
+    """
+    outputs: Dict[int, List[str]] = {}
+    for size in ICONSET_SIZES:
+        outputs.setdefault(size, []).append(os.path.join(ICONSET_DIR, f"icon_{size}x{size}.png"))
+        outputs.setdefault(size * 2, []).append(os.path.join(ICONSET_DIR, f"icon_{size}x{size}@2x.png"))
+    for size in HICOLOR_SIZES:
+        outputs.setdefault(size, []).append(
+            os.path.join(HICOLOR_DIR, f"{size}x{size}", "apps", f"{LINUX_ICON_NAME}.png"))
+    for size in ICO_SIZES:
+        outputs.setdefault(size, [])
+    return {size: paths for size, paths in outputs.items() if size <= max_size}
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _init_worker(mode: str, size: Tuple[int, int], data: bytes) -> None:
+    """Pool initializer: receive the largest output once per worker."""
+    global _base_image
+    _base_image = Image.frombytes(mode, size, data)
+
+
+def downscale(img: Image.Image, size: int) -> Image.Image:
+    """
+    Shrink a square image progressively.
+
+    Halves with a box filter while the image is at least twice the target,
+    then finishes with LANCZOS, which costs far less than one LANCZOS pass
+    from a large image at the same quality.
+
+    Args:
+        img: Square source image
+        size: Target edge length in pixels
+
+    Returns:
+        Resized image
+    """
+    while img.width >= size * 2:
+        img = img.reduce(2)
+    if img.width != size:
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+    return img
+
 
-def generate_ico(png_path: str, ico_path: str) -> bool:
+def _render_size(size: int, paths: List[str]) -> Tuple[int, bytes]:
+    """Worker: produce one size, write its PNGs and return the raw pixels."""
+    img = downscale(_base_image, size)
+    for path in paths:
+        full_path = os.path.join(SCRIPT_DIR, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        img.save(full_path, format="PNG", optimize=True)
+    return size, img.tobytes()
+
+
+def _load_manifest() -> Dict:
+    try:
+        with open(os.path.join(SCRIPT_DIR, MANIFEST_NAME), "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def is_up_to_date(source_hash: str) -> bool:
+    """
+    Check the cached manifest against the source and the files on disk.
+
+    Args:
+        source_hash: SHA-256 of the source PNG
+
+    Returns:
+        True if every recorded output still exists with its recorded hash
+    """
+    manifest = _load_manifest()
+    if manifest.get("source") != source_hash or manifest.get("version") != GENERATOR_VERSION:
+        return False
+    outputs = manifest.get("outputs") or {}
+    if not outputs:
+        return False
+    try:
+        return all(file_sha256(os.path.join(SCRIPT_DIR, path)) == digest
+                   for path, digest in outputs.items())
+    except OSError:
+        return False
+
+
+def generate_icons(png_path: str) -> bool:
     """
-    Generate a multi-resolution .ico file from a PNG.
+    Generate all icon sets from a PNG.
 
     Args:
         png_path: Path to source PNG file
-        ico_path: Path to output .ico file
 
     Returns:
         True if successful
     """
     try:
-        # Open the source image
         img = Image.open(png_path)
-
-        # Convert to RGBA if necessary
         if img.mode != "RGBA":
             img = img.convert("RGBA")
+        source_edge = min(img.size)
 
-        # Generate multiple sizes for the ico file
-        # Windows uses these sizes: 16, 32, 48, 64, 128, 256
-        sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+        outputs = _png_outputs(source_edge)
+        if not outputs:
+            print(f"Error: source is {source_edge}px, smaller than every icon size")
+            return False
+        largest = max(outputs)
+        # The only resize from the source; everything else derives from it
+        base = img.resize((largest, largest), Image.Resampling.LANCZOS)
 
-        icons = []
-        for size in sizes:
-            resized = img.resize(size, Image.Resampling.LANCZOS)
-            icons.append(resized)
+        images: Dict[int, Image.Image] = {}
+        with ProcessPoolExecutor(
+            max_workers=min(len(outputs), os.cpu_count() or 1),
+            initializer=_init_worker,
+            initargs=(base.mode, base.size, base.tobytes()),
+        ) as pool:
+            # Largest first so the slowest tasks start earliest
+            futures = [pool.submit(_render_size, size, outputs[size])
+                       for size in sorted(outputs, reverse=True)]
+            for future in futures:
+                size, data = future.result()
+                images[size] = Image.frombytes("RGBA", (size, size), data)
 
-        # Save as ico with all sizes
-        icons[0].save(
-            ico_path,
+        written = [path for paths in outputs.values() for path in paths]
+
+        # Pillow drops ICO sizes larger than the image being saved, so save
+        # from the largest and supply the others as exact frames
+        ico_sizes = sorted((size for size in ICO_SIZES if size in images), reverse=True)
+        images[ico_sizes[0]].save(
+            os.path.join(SCRIPT_DIR, ICO_NAME),
             format="ICO",
-            sizes=sizes,
-            append_images=icons[1:],
+            sizes=[(size, size) for size in ico_sizes],
+            append_images=[images[size] for size in ico_sizes[1:]],
         )
+        written.append(ICO_NAME)
+
+        icns_size = max(ICONSET_SIZES) * 2
+        if icns_size in images:
+            images[icns_size].save(
+                os.path.join(SCRIPT_DIR, ICNS_NAME),
+                format="ICNS",
+                append_images=[images[size] for size in (32, 64, 128, 256, 512)],
+            )
+            written.append(ICNS_NAME)
+        else:
+            print(f"Skipped {ICNS_NAME}: source is {source_edge}px, needs {icns_size}px")
+
+        manifest = {
+            "version": GENERATOR_VERSION,
+            "source": file_sha256(png_path),
+            "outputs": {path: file_sha256(os.path.join(SCRIPT_DIR, path)) for path in sorted(written)},
+        }
+        with open(os.path.join(SCRIPT_DIR, MANIFEST_NAME), "w") as f:
+            json.dump(manifest, f, indent=2)
 
-        print(f"Generated: {ico_path}")
+        print(f"Generated {len(written)} files ({len(outputs)} sizes)")
         return True
 
     except FileNotFoundError:
         print(f"Error: Source file not found: {png_path}")
         return False
     except Exception as e:
-        print(f"Error generating ico: {e}")
+        print(f"Error generating icons: {e}")
         return False
 
 
 def main():
-    # Get the directory containing this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
-    png_path = os.path.join(script_dir, "nova_logo.png")
-    ico_path = os.path.join(script_dir, "nova_logo.ico")
+    parser = argparse.ArgumentParser(description="Generate platform icon sets from nova_logo.png")
+    parser.add_argument("--force", action="store_true", help="regenerate even if the cache is current")
+    args = parser.parse_args()
 
+    png_path = os.path.join(SCRIPT_DIR, SOURCE_NAME)
     print(f"Source: {png_path}")
-    print(f"Target: {ico_path}")
 
     if not os.path.exists(png_path):
         print(f"Error: PNG file not found: {png_path}")
         sys.exit(1)
 
-    if generate_ico(png_path, ico_path):
+    if not args.force and is_up_to_date(file_sha256(png_path)):
+        print("Icons are up to date (source unchanged); nothing to do")
+        sys.exit(0)
+
+    if generate_icons(png_path):
         print("Success!")
         sys.exit(0)
     else:
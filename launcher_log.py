@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent launcher log.
+
+Log records are JSON lines ({"ts", "level", "source", "msg"}) appended to
+LOG_DIR/launcher.jsonl by a background writer thread, so logging never
+blocks the caller on disk I/O. When the active file exceeds LOG_SEGMENT_BYTES
+it is rotated into a gzip-compressed segment, and the oldest segments are
+deleted to keep the directory under LOG_TOTAL_BYTES.
+
+query() streams records from disk, oldest first, one line at a time, so the
+full history can be searched without loading it into memory.
+"""
+
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import LOG_DIR, LOG_QUEUE_SIZE, LOG_SEGMENT_BYTES, LOG_TOTAL_BYTES
+
+ACTIVE_LOG_NAME = "launcher.jsonl"
+SEGMENT_PREFIX = "launcher-"
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+LEVELS = ("debug", "info", "warn", "error")
+
+
+def parse_level(text: str) -> str:
+    """
+    Get the level of a log line written with the "[warn] ..." convention.
+
+    Args:
+        text: Log message
+
+    Returns:
+        One of LEVELS ("info" when the line has no level prefix)
+    """
+    if text.startswith("["):
+        tag = text[1:text.find("]")].lower() if "]" in text else ""
+        if tag in LEVELS:
+            return tag
+        if tag == "stderr":
+            return "warn"
+    return "info"
+
+
+def _segments() -> List[str]:
+    """Rotated segment paths, oldest first."""
+    try:
+        names = [n for n in os.listdir(LOG_DIR)
+                 if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)]
+    except OSError:
+        return []
+    return [os.path.join(LOG_DIR, n) for n in sorted(names)]
+
+
+class LogSink:
+    """Asynchronous JSON-lines writer with size-based rotation."""
+
+    def __init__(self, directory: str = LOG_DIR):
+        self.directory = directory
+        self.active_path = os.path.join(directory, ACTIVE_LOG_NAME)
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread.start()
+
+    def write(self, msg: str, level: Optional[str] = None, source: str = "launcher") -> None:
+        """
+        Queue a record. Never blocks; records are dropped if the writer falls
+        LOG_QUEUE_SIZE records behind.
+
+        Args:
+            msg: Message text
+            level: One of LEVELS (parsed from the message prefix if omitted)
+            source: Origin of the line ("launcher" or "container")
+        """
+        record = {"ts": time.time(), "level": level or parse_level(msg), "source": source, "msg": msg}
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush queued records and stop the writer thread."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            f = open(self.active_path, "a", encoding="utf-8")
+        except OSError:
+            return
+
+        try:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+                # Batch whatever else is waiting before touching the disk again
+                stop = False
+                while True:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is None:
+                        stop = True
+                        break
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+
+                if f.tell() >= LOG_SEGMENT_BYTES:
+                    f.close()
+                    self._rotate()
+                    f = open(self.active_path, "a", encoding="utf-8")
+                if stop:
+                    break
+        except OSError:
+            pass
+        finally:
+            f.close()
+
+    def _rotate(self) -> None:
+        """Compress the active file into a segment and enforce the size cap."""
+        now = time.time()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"{int(now * 1000) % 1000:03d}"
+        segment = os.path.join(self.directory, f"{SEGMENT_PREFIX}{stamp}{SEGMENT_SUFFIX}")
+        suffix = 1
+        while os.path.exists(segment):
+            segment = os.path.join(self.directory, f"{SEGMENT_PREFIX}{stamp}-{suffix}{SEGMENT_SUFFIX}")
+            suffix += 1
+
+        rotated = self.active_path + ".rotating"
+        try:
+            os.replace(self.active_path, rotated)
+            with open(rotated, "rb") as src, gzip.open(segment + ".partial", "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(segment + ".partial", segment)
+            os.remove(rotated)
+        except OSError:
+            return
+
+        total = os.path.getsize(self.active_path) if os.path.exists(self.active_path) else 0
+        segments = _segments()
+        sizes = []
+        for path in segments:
+            try:
+                sizes.append(os.path.getsize(path))
+            except OSError:
+                sizes.append(0)
+        total += sum(sizes)
+        for path, size in zip(segments, sizes):
+            if total <= LOG_TOTAL_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def query(
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    levels: Optional[List[str]] = None,
+    source: Optional[str] = None,
+    contains: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream log records from disk, oldest first.
+
+    Args:
+        since: Only records at or after this timestamp
+        until: Only records before this timestamp
+        levels: Only records with one of these levels
+        source: Only records from this source
+        contains: Only records whose message contains this text (case-insensitive)
+
+    Yields:
+        Record dicts with ts, level, source and msg
+    """
+    needle = contains.lower() if contains else None
+    paths = _segments() + [os.path.join(LOG_DIR, ACTIVE_LOG_NAME)]
+    for path in paths:
+        if since is not None and path.endswith(SEGMENT_SUFFIX):
+            # Segments are named after their rotation time, i.e. their last record
+            stamp = os.path.basename(path)[len(SEGMENT_PREFIX):len(SEGMENT_PREFIX) + 15]
+            try:
+                if time.mktime(time.strptime(stamp, "%Y%m%d-%H%M%S")) + 1 < since:
+                    continue
+            except ValueError:
+                pass
+        try:
+            opener = gzip.open if path.endswith(".gz") else open
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Partially written last line
+                        continue
+                    ts = record.get("ts", 0)
+                    if since is not None and ts < since:
+                        continue
+                    if until is not None and ts >= until:
+                        continue
+                    if levels and record.get("level") not in levels:
+                        continue
+                    if source and record.get("source") != source:
+                        continue
+                    if needle and needle not in record.get("msg", "").lower():
+                        continue
+                    yield record
+        except (OSError, EOFError):
+            continue
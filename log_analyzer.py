@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming analysis of the tracker container's log output.
+
+The known startup milestones (database migration, catalog download, web
+server up) and failure conditions (port already bound, disk full, crash
+traceback, ...) are compiled into a single alternation regex, so each chunk
+of `docker logs -f` output is scanned once no matter how many rules exist.
+An optional ready marker (the "ready_marker" pref) is matched as well, so
+the launcher can confirm readiness the moment the tracker says it is
+listening. The analyzer only holds the current partial line (capped at
+LOG_ANALYZER_MAX_LINE) and the latest milestone, so memory stays constant
+however much the container logs.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import LOG_ANALYZER_MAX_LINE, PORT
+
+# (name, kind, pattern, message). Milestones replace the startup status text;
+# conditions are reported once per container start. Patterns are matched
+# against lowercased text, and every top-level alternative must start with a
+# literal character (see _first_chars).
+RULES: List[Tuple[str, str, str, str]] = [
+    ("migration", "milestone",
+     r"alembic\.runtime\.migration|running upgrade|migrating database|applying migration",
+     "Upgrading database..."),
+    ("catalog", "milestone",
+     r"downloading[^\n]{0,40}catalog|fetching[^\n]{0,40}catalog|updating[^\n]{0,40}catalog"
+     r"|catalogs? (?:download|import)",
+     "Downloading catalogs..."),
+    ("workers", "milestone",
+     r"booting worker",
+     "Starting web workers..."),
+    ("serving", "milestone",
+     r"serving on https?://|listening at: https?://|running on https?://",
+     "Web server started, finishing up..."),
+    ("port_in_use", "condition",
+     r"address already in use|errno 98\b|only one usage of each socket address",
+     f"The tracker could not bind port {PORT}; another program may be using it."),
+    ("disk_full", "condition",
+     r"no space left on device|database or disk is full",
+     "The disk is full; free up space and restart the tracker."),
+    ("permission", "condition",
+     r"permission denied|permissionerror|read-only file system",
+     "The tracker cannot write to its data folder (~/nova/instance)."),
+    ("db_locked", "condition",
+     r"database is locked",
+     "The tracker database is locked by another process."),
+    ("out_of_memory", "condition",
+     r"memoryerror|out of memory|was sent sigkill",
+     "The tracker ran out of memory; raise the memory limit in Docker settings."),
+    ("network", "condition",
+     r"temporary failure in name resolution|name or service not known|max retries exceeded",
+     "The tracker could not reach the internet; catalog downloads may fail."),
+    ("crash", "condition",
+     r"traceback \(most recent call last\)",
+     "The tracker hit an unexpected error; see the container lines in the log."),
+]
+
+
+
+def _first_chars(pattern: str) -> str:
+    """First characters of a pattern's top-level alternatives."""
+    chars = {pattern[0]}
+    depth = 0
+    for i, char in enumerate(pattern):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            chars.add(pattern[i + 1])
+    return "".join(sorted(chars))
+
+
+_RULES_BY_GROUP = {f"r{i}": rule for i, rule in enumerate(RULES)}
+# The lookahead lets the regex engine skip positions that cannot start any
+# rule with a single character-class test, roughly doubling scan throughput
+_COMBINED_RE = re.compile(
+    "(?=[" + "".join(sorted(set("".join(_first_chars(rule[2]) for rule in RULES)))) + "])(?:"
+    + "|".join(f"(?P<r{i}>{rule[2]})" for i, rule in enumerate(RULES))
+    + ")"
+)
+
+
+class LogAnalyzer:
+    """Incremental matcher for container log chunks. Not thread-safe."""
+
+    def __init__(self, max_line: int = LOG_ANALYZER_MAX_LINE, ready_marker: Optional[str] = None):
+        """
+        Args:
+            max_line: Longest partial line kept between chunks
+            ready_marker: Text of the log line that means the tracker is
+                serving (case-insensitive), reported as a "ready" finding
+        """
+        self.max_line = max_line
+        self._ready_re = re.compile(re.escape(ready_marker.lower())) if ready_marker else None
+        self.status: Optional[str] = None
+        self._partial = ""
+        self._reported: set = set()
+
+    def reset(self) -> None:
+        """Forget the milestone and reported conditions (e.g., on container restart)."""
+        self.status = None
+        self._partial = ""
+        self._reported.clear()
+
+    def feed(self, chunk: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Analyze a chunk of log output.
+
+        Args:
+            chunk: Raw output; may start or end in the middle of a line
+
+        Returns:
+            Tuple of (complete_lines, findings). Each finding is a dict with
+            name, kind ("milestone", "condition" or "ready") and message.
+        """
+        data = self._partial + chunk
+        cut = data.rfind("\n") + 1
+        self._partial = data[cut:]
+        block = data[:cut]
+        if len(self._partial) > self.max_line:
+            # Overlong line without a newline; scan what we have and drop it
+            block += self._partial + "\n"
+            self._partial = ""
+        if not block:
+            return [], []
+        return block.splitlines(), self._scan(block)
+
+    def _scan(self, block: str) -> List[Dict[str, Any]]:
+        findings = []
+        # Matching lowercased text avoids the much slower IGNORECASE mode
+        text = block.lower()
+        for match in _COMBINED_RE.finditer(text):
+            name, kind, _, message = _RULES_BY_GROUP[match.lastgroup]
+            if kind == "condition":
+                if name in self._reported:
+                    continue
+                self._reported.add(name)
+            elif message == self.status:
+                continue
+            else:
+                self.status = message
+            findings.append({"name": name, "kind": kind, "message": message})
+        if self._ready_re and "ready" not in self._reported and self._ready_re.search(text):
+            self._reported.add("ready")
+            findings.append({"name": "ready", "kind": "ready", "message": "Ready marker seen"})
+        return findings
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Backing store for the virtualized log viewer.
+
+Lines are appended to a spill file under NOVA_DIR and located through an
+offset table, while the most recent LOG_VIEW_MEMORY_LINES stay in an
+in-memory ring for tail-follow rendering. Only the last LOG_VIEW_MAX_LINES
+are kept: once a quarter more have arrived, the oldest lines are dropped
+from the tables, the indexes and the spill file in one batch, so a
+long-running session uses bounded memory and disk. Line numbers keep
+counting up; first_line is the oldest one still stored. Three incremental
+indexes map to sorted line numbers:
+
+- level ("info", "warn", ...) and source ("launcher", "container")
+- an inverted index of lowercase word tokens
+
+Filtering intersects posting lists instead of scanning text, so it stays
+interactive over a million lines. Search matches whole words: every word in
+the query must appear in the line.
+"""
+
+import bisect
+import os
+import re
+import threading
+from array import array
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import LOG_VIEW_MAX_LINES, LOG_VIEW_MEMORY_LINES, LOG_VIEW_SPILL_FILE, NOVA_DIR
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]{2,}")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into the lowercase words used by the search index."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _intersect(postings: List[Sequence[int]]) -> Sequence[int]:
+    """Intersect sorted line-number lists, driving from the shortest."""
+    if not postings:
+        return []
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for other in postings[1:]:
+        if not result:
+            break
+        matched = array("I")
+        other_len = len(other)
+        pos = 0
+        for line in result:
+            pos = bisect.bisect_left(other, line, pos)
+            if pos == other_len:
+                break
+            if other[pos] == line:
+                matched.append(line)
+        result = matched
+    return result
+
+
+# Bytes moved at a time when the spill file drops its oldest lines
+_SPILL_COPY_CHUNK = 1024 * 1024
+
+
+class LogStore:
+    """Indexed store of the most recent (level, source, text) lines. Thread-safe."""
+
+    def __init__(
+        self,
+        spill_path: str = LOG_VIEW_SPILL_FILE,
+        memory_lines: int = LOG_VIEW_MEMORY_LINES,
+        max_lines: int = LOG_VIEW_MAX_LINES,
+    ):
+        self._lock = threading.Lock()
+        self._memory_lines = memory_lines
+        self._max_lines = max(max_lines, memory_lines, 1)
+        self._first = 0  # Number of the oldest stored line
+        self._ring: deque = deque(maxlen=memory_lines)
+        self._offsets = array("Q")
+        self._levels = array("B")
+        self._sources = array("B")
+        self._level_names: List[str] = []
+        self._source_names: List[str] = []
+        self._by_level: Dict[str, array] = {}
+        self._by_source: Dict[str, array] = {}
+        self._tokens: Dict[str, array] = {}
+
+        try:
+            os.makedirs(NOVA_DIR, exist_ok=True)
+            # Per-session store; the persistent history lives in launcher_log
+            self._spill = open(spill_path, "w+b")
+        except OSError:
+            self._spill = None
+        self._spill_size = 0
+
+    def __len__(self) -> int:
+        """Number of lines stored (first_line to first_line + len - 1)."""
+        return len(self._offsets)
+
+    @property
+    def first_line(self) -> int:
+        """Number of the oldest line still stored."""
+        return self._first
+
+    def _intern(self, names: List[str], value: str) -> int:
+        try:
+            return names.index(value)
+        except ValueError:
+            names.append(value)
+            return len(names) - 1
+
+    def append(self, text: str, level: str = "info", source: str = "launcher") -> int:
+        """
+        Add a line.
+
+        Args:
+            text: Line text (without trailing newline)
+            level: Line level
+            source: Origin of the line
+
+        Returns:
+            The new line's number
+        """
+        data = text.replace("\n", " ").encode("utf-8", "replace") + b"\n"
+        with self._lock:
+            if len(self._offsets) >= self._max_lines + max(self._max_lines // 4, 1):
+                self._drop_oldest(len(self._offsets) - self._max_lines + 1)
+            line = self._first + len(self._offsets)
+            self._offsets.append(self._spill_size)
+            if self._spill is not None:
+                try:
+                    self._spill.seek(self._spill_size)
+                    self._spill.write(data)
+                except OSError:
+                    pass
+            self._spill_size += len(data)
+            self._ring.append(text)
+
+            self._levels.append(self._intern(self._level_names, level))
+            self._sources.append(self._intern(self._source_names, source))
+            self._by_level.setdefault(level, array("I")).append(line)
+            self._by_source.setdefault(source, array("I")).append(line)
+            for token in set(tokenize(text)):
+                self._tokens.setdefault(token, array("I")).append(line)
+            return line
+
+    def _drop_oldest(self, count: int) -> None:
+        """Forget the oldest lines. Called with the lock held."""
+        new_first = self._first + count
+        start = self._offsets[count] if count < len(self._offsets) else self._spill_size
+        if self._spill is not None:
+            # Move the kept bytes to the front of the file, then cut the rest
+            try:
+                read_pos, write_pos = start, 0
+                while read_pos < self._spill_size:
+                    self._spill.seek(read_pos)
+                    data = self._spill.read(min(_SPILL_COPY_CHUNK, self._spill_size - read_pos))
+                    if not data:
+                        break
+                    self._spill.seek(write_pos)
+                    self._spill.write(data)
+                    read_pos += len(data)
+                    write_pos += len(data)
+                self._spill.truncate(self._spill_size - start)
+            except OSError:
+                pass
+        self._spill_size -= start
+
+        self._offsets = array("Q", (offset - start for offset in self._offsets[count:]))
+        while len(self._ring) > len(self._offsets):
+            self._ring.popleft()
+        del self._levels[:count]
+        del self._sources[:count]
+        for index in (self._by_level, self._by_source, self._tokens):
+            for key in list(index):
+                postings = index[key]
+                del postings[:bisect.bisect_left(postings, new_first)]
+                if not postings:
+                    del index[key]
+        self._first = new_first
+
+    def get(self, line: int) -> Tuple[str, str, str]:
+        """
+        Read a line.
+
+        Returns:
+            Tuple of (text, level, source); all empty if the line was dropped
+        """
+        with self._lock:
+            index = line - self._first
+            if not 0 <= index < len(self._offsets):
+                return "", "", ""
+            level = self._level_names[self._levels[index]]
+            source = self._source_names[self._sources[index]]
+            ring_start = len(self._offsets) - len(self._ring)
+            if index >= ring_start:
+                return self._ring[index - ring_start], level, source
+            if self._spill is None:
+                return "", level, source
+            start = self._offsets[index]
+            end = self._offsets[index + 1] if index + 1 < len(self._offsets) else self._spill_size
+            self._spill.seek(start)
+            data = self._spill.read(end - start)
+        return data.decode("utf-8", "replace").rstrip("\n"), level, source
+
+    def get_range(self, lines: Sequence[int]) -> List[Tuple[str, str, str]]:
+        """Read several lines (e.g., the visible rows of the viewer)."""
+        return [self.get(line) for line in lines]
+
+    def filter(
+        self,
+        levels: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        query: str = "",
+    ) -> Optional[Sequence[int]]:
+        """
+        Find the lines matching all given criteria.
+
+        Args:
+            levels: Keep lines with one of these levels
+            source: Keep lines from this source
+            query: Keep lines containing every word of this text
+
+        Returns:
+            Sorted line numbers, or None when no criteria are set (all stored lines)
+        """
+        words = set(tokenize(query))
+        if not levels and not source and not words:
+            return None
+
+        with self._lock:
+            postings = []
+            if levels:
+                if len(levels) == 1:
+                    postings.append(self._by_level.get(levels[0], array("I")))
+                else:
+                    # Concatenated sorted runs; timsort merges them in linear time
+                    merged = array("I")
+                    for level in levels:
+                        merged.extend(self._by_level.get(level, ()))
+                    postings.append(array("I", sorted(merged)))
+            if source:
+                postings.append(self._by_source.get(source, array("I")))
+            for word in words:
+                postings.append(self._tokens.get(word, array("I")))
+            # Snapshot lengths so concurrent appends don't leak into the result
+            postings = [p[:len(p)] for p in postings]
+        return _intersect(postings)
+
+    def matches(self, line: int, levels: Optional[List[str]], source: Optional[str], query: str) -> bool:
+        """Check a single (new) line against filter criteria."""
+        text, level, line_source = self.get(line)
+        if levels and level not in levels:
+            return False
+        if source and line_source != source:
+            return False
+        words = set(tokenize(query))
+        return not words or words.issubset(tokenize(text))
+
+    def close(self) -> None:
+        """Close and remove the spill file."""
+        with self._lock:
+            if self._spill is not None:
+                try:
+                    self._spill.close()
+                    os.remove(self._spill.name)
+                except OSError:
+                    pass
+                self._spill = None
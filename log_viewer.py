@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Virtualized log viewer widget.
+
+Only the rows that are visible are ever inserted into the Tk text widget;
+everything else stays in a LogStore. Scrolling, filtering and search work on
+line numbers, so the cost of a redraw does not depend on how many lines the
+session has produced. When the store drops its oldest lines, the view drops
+them too and keeps the rows on screen in place.
+"""
+
+import bisect
+import tkinter as tk
+from array import array
+from typing import List, Optional
+
+import customtkinter as ctk
+
+from log_store import LogStore, tokenize
+
+LEVEL_FILTERS = {
+    "All levels": None,
+    "Warnings": ["warn", "error"],
+    "Errors": ["error"],
+}
+SOURCE_FILTERS = {
+    "All sources": None,
+    "Launcher": "launcher",
+    "Container": "container",
+}
+
+# Delay before a search is run while the user is typing
+SEARCH_DEBOUNCE_MS = 200
+# Coalesces bursts of appended lines into one redraw
+RENDER_DELAY_MS = 50
+
+
+class LogViewer(ctk.CTkFrame):
+    """Log viewer with level/source filters, word search and tail-follow."""
+
+    def __init__(self, master, store: LogStore, accent: str = "#83b4c5", **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+        self.store = store
+        self._view: Optional[array] = None  # None shows every line
+        self._first = 0  # store.first_line as of the last render
+        self._top = 0
+        self._follow = True
+        self._levels: Optional[List[str]] = None
+        self._source: Optional[str] = None
+        self._query = ""
+        self._render_scheduled = False
+        self._search_job = None
+
+        toolbar = ctk.CTkFrame(self, fg_color="transparent")
+        toolbar.pack(fill=tk.X, pady=(0, 4))
+
+        self.search_entry = ctk.CTkEntry(toolbar, placeholder_text="Search", height=26,
+                                         font=("DM Sans", 11))
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.search_entry.bind("<KeyRelease>", lambda e: self._schedule_search())
+
+        self.source_menu = ctk.CTkOptionMenu(toolbar, values=list(SOURCE_FILTERS), width=110, height=26,
+                                             font=("DM Sans", 11), command=lambda _: self.apply_filter())
+        self.source_menu.pack(side=tk.RIGHT, padx=(5, 0))
+        self.level_menu = ctk.CTkOptionMenu(toolbar, values=list(LEVEL_FILTERS), width=100, height=26,
+                                            font=("DM Sans", 11), command=lambda _: self.apply_filter())
+        self.level_menu.pack(side=tk.RIGHT, padx=(5, 0))
+
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill=tk.BOTH, expand=True)
+
+        self.scrollbar = ctk.CTkScrollbar(body, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.text = tk.Text(
+            body,
+            height=10,
+            wrap="none",
+            font=("Courier New", 12),
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            state="disabled",
+            cursor="arrow",
+        )
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.tag_configure("warn", foreground="#b07000")
+        self.text.tag_configure("error", foreground="#a04040")
+        self.text.tag_configure("container", foreground="#5a7f8c")
+        self.text.tag_configure("match", background=accent)
+
+        for widget in (self.text, body):
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+            widget.bind("<Button-4>", lambda e: self._scroll(-3))
+            widget.bind("<Button-5>", lambda e: self._scroll(3))
+        self.text.bind("<Configure>", lambda e: self._schedule_render())
+
+    # --- Data ---
+
+    def append(self, text: str, level: str = "info", source: str = "launcher") -> None:
+        """Add a line. Safe to call from any thread."""
+        line = self.store.append(text, level, source)
+        view = self._view
+        if view is not None and (not view or line > view[-1]) and \
+                self.store.matches(line, self._levels, self._source, self._query):
+            view.append(line)
+        self._schedule_render()
+
+    def apply_filter(self) -> None:
+        """Recompute the visible lines from the filter controls."""
+        self._search_job = None
+        self._levels = LEVEL_FILTERS.get(self.level_menu.get())
+        self._source = SOURCE_FILTERS.get(self.source_menu.get())
+        self._query = self.search_entry.get().strip()
+        result = self.store.filter(self._levels, self._source, self._query)
+        self._view = None if result is None else array("I", result)
+        self._follow = True
+        self._render()
+
+    def _schedule_search(self) -> None:
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DEBOUNCE_MS, self.apply_filter)
+
+    # --- Rendering ---
+
+    def _count(self) -> int:
+        return len(self.store) if self._view is None else len(self._view)
+
+    def _visible_rows(self) -> int:
+        line_height = max(int(self.text.tk.call("font", "metrics", self.text.cget("font"), "-linespace")), 1)
+        return max(self.text.winfo_height() // line_height, 1)
+
+    def _schedule_render(self) -> None:
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            self.after(RENDER_DELAY_MS, self._render)
+
+    def _catch_up_with_dropped_lines(self) -> None:
+        """Drop lines the store no longer holds from the view and scroll position."""
+        first = self.store.first_line
+        if first == self._first:
+            return
+        dropped = first - self._first
+        self._first = first
+        view = self._view
+        if view is not None:
+            dropped = bisect.bisect_left(view, first)
+            del view[:dropped]
+        self._top = max(self._top - dropped, 0)
+
+    def _render(self) -> None:
+        self._render_scheduled = False
+        self._catch_up_with_dropped_lines()
+        first = self._first
+        count = self._count()
+        rows = self._visible_rows()
+        if self._follow:
+            self._top = max(count - rows, 0)
+        self._top = max(min(self._top, max(count - rows, 0)), 0)
+
+        end = min(self._top + rows, count)
+        view = self._view
+        line_numbers = range(first + self._top, first + end) if view is None else view[self._top:end]
+        lines = self.store.get_range(line_numbers)
+        words = set(tokenize(self._query))
+
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        for row, (text, level, source) in enumerate(lines, start=1):
+            tags = [t for t in (level, source) if t in ("warn", "error", "container")]
+            self.text.insert("end", text + ("\n" if row < len(lines) else ""), tuple(tags))
+            for word in words:
+                index = f"{row}.0"
+                while True:
+                    index = self.text.search(word, index, stopindex=f"{row}.end", nocase=True)
+                    if not index:
+                        break
+                    match_end = f"{index}+{len(word)}c"
+                    self.text.tag_add("match", index, match_end)
+                    index = match_end
+        self.text.configure(state="disabled")
+
+        if count:
+            self.scrollbar.set(self._top / count, end / count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    # --- Scrolling ---
+
+    def _scroll(self, delta: int) -> None:
+        rows = self._visible_rows()
+        self._top = max(self._top + delta, 0)
+        self._follow = self._top + rows >= self._count()
+        self._render()
+
+    def _on_mousewheel(self, event) -> str:
+        # Windows reports multiples of 120, macOS small deltas
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self._scroll(-delta * 3)
+        return "break"
+
+    def _on_scrollbar(self, action, value, unit=None) -> None:
+        rows = self._visible_rows()
+        if action == "moveto":
+            self._top = int(float(value) * self._count())
+        elif action == "scroll":
+            step = rows if unit == "pages" else 1
+            self._top += int(value) * step
+        self._top = max(self._top, 0)
+        self._follow = self._top + rows >= self._count()
+        self._render()
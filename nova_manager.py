@@ -6,13 +6,17 @@ A cross-platform GUI launcher for Nova DSO Tracker that manages Docker container
 Migrated to CustomTkinter with Nova DSO Tracker design system.
 """
 
+import asyncio
 import customtkinter as ctk
 import tkinter as tk
+from tkinter import filedialog
 import subprocess
+import shutil
 import ssl
 import threading
 import time
 import webbrowser
+import urllib.parse
 import urllib.request
 import json
 import os
@@ -50,11 +54,15 @@ from config import (
     DOCKER_IMAGE,
     DOCKER_TAG,
     DOCKER_IMAGE_FULL,
+    DOCKER_IMAGE_STAGED,
     PORT,
+    CANDIDATE_PORT,
+    CANDIDATE_READY_TIMEOUT,
     DOCKER_DOWNLOAD_URL,
     GITHUB_RELEASES_API,
     NOVA_DIR,
     INSTANCE_DIR,
+    CANDIDATE_INSTANCE_DIR,
     COMPOSE_FILE,
     COMPOSE_TEMPLATE,
     DOCKER_CMD_TIMEOUT,
@@ -62,33 +70,108 @@ from config import (
     CONTAINER_START_POLL_COUNT,
     DOCKER_START_POLL_COUNT,
     MONITOR_INTERVAL,
+    USAGE_SAMPLE_INTERVAL,
+    PREPULL_RETRY_INTERVAL,
+    LAUNCHER_DOWNLOAD_RATE,
+    READY_CONFIRM_INTERVAL,
+    READY_CONFIRM_WINDOW,
     UPDATE_BANNER_DISPLAY_TIME,
 )
 from docker_ops import (
     run_command,
     is_docker_installed,
     is_docker_running,
-    is_nova_installed,
     is_container_running,
-    create_compose_file,
+    watch_health_events,
+    stop_health_events,
+    follow_container_logs,
+    stop_container_logs,
+    terminate_managed_processes,
+    sync_compose_file,
+    get_container_usage,
+    get_resource_limits,
     pull_image,
     start_container,
+    wait_for_healthy,
     stop_container,
+    pause_container,
+    unpause_container,
     recreate_container,
+    start_candidate_container,
+    remove_candidate_container,
+    stop_candidate_container,
     prune_images,
+    get_docker_disk_usage,
     get_container_image_digest,
     get_local_image_digest,
+    get_local_image_digests,
+    is_update_staged,
+    stage_image,
+    apply_staged_image,
+    discard_staged_image,
     check_dockerhub_version,
     load_launcher_prefs,
     save_launcher_prefs,
     get_skipped_digest,
     set_skipped_digest,
 )
+from bundles import (
+    export_bundle,
+    import_bundle,
+    find_bundle,
+    format_throughput,
+)
+from disk_usage import scan_directory
+from fleet import Fleet, host_label
+from launcher_log import LogSink, parse_level
+from log_analyzer import LogAnalyzer
+from log_store import LogStore
+from log_viewer import LogViewer
+from snapshots import (
+    create_snapshot,
+    databases_unchanged,
+    list_snapshots,
+    promote_databases,
+    restore_snapshot,
+    seed_instance,
+)
+from remote_host import (
+    configure as configure_docker_host,
+    describe_host,
+    dashboard_url,
+    is_remote,
+    last_error as docker_host_error,
+    remote_data_notice,
+    remote_hostname,
+    retry as retry_docker_host,
+    shutdown as close_docker_host,
+)
+from self_update import (
+    apply_staged_update,
+    cleanup_previous_launcher,
+    get_staged_update,
+    is_frozen,
+    stage_update,
+)
+from stall_detector import StallDetector
+from state_cache import load_last_state, save_last_state
+from state_probe import probe_state
+from tracing import (
+    PhaseTrace,
+    default_host,
+    estimate,
+    estimate_until,
+    format_eta,
+    export_chrome_trace,
+)
+from update_scheduler import next_check_delay, seconds_until_window
 from utils import (
-    check_web_ready,
+    wait_for_web_ready,
+    format_bytes,
     version_newer,
     open_dashboard as open_dashboard_url,
 )
+from warmup import record_warmup, run_warmup, typical_first_ms, warmup_urls
 
 # --- Nova Design System Colors (Light Mode Only) ---
 NOVA_TEAL = "#83b4c5"
@@ -108,9 +191,6 @@ STATUS_RUNNING = "#83b4c5"
 STATUS_STOPPED = "#888888"
 STATUS_ERROR = "#a04040"
 
-# Log viewer memory limit
-MAX_LOG_LINES = 500
-
 
 class NovaManagerApp:
     def __init__(self, root):
@@ -140,26 +220,94 @@ class NovaManagerApp:
         self.is_processing = False
         self.just_installed = False
         self.stop_event = threading.Event()
+        self.cancel_event = threading.Event()
         self.log_lines = []
         self.pending_update_digest = None
-        self._update_check_done = False  # Track if Docker Hub check was performed this session
+        self._update_check_done = False  # Track if the update scheduler was started this session
+        self._update_check_lock = threading.Lock()
+        self._image_pull_lock = threading.Lock()  # One image download at a time
+        self._dismissed_digests = set()  # Updates the user skipped for this session
+        self._update_dialog = None
+        self._usage_fetch_running = False
+        self._usage_sampled_at = 0.0
+        self._status_note = ""
+        self._active_trace = None
+        self._active_eta = None
+        self._ui_state = None
+
+        # Manage a tracker on another machine when "docker_host"/"docker_context" is set
+        prefs = load_launcher_prefs()
+        configure_docker_host(prefs.get("docker_host"), prefs.get("docker_context"))
+
+        # Startup progress, problems and readiness read from the tracker's own output
+        self.log_analyzer = LogAnalyzer(ready_marker=prefs.get("ready_marker"))
+        self._container_issue = None
+        self._ready_confirming = threading.Event()
+
+        # Last shown state, saved on change and painted at the next startup
+        self._state_stale = False
+        self._last_state = {
+            "state": None,
+            "digest": None,
+            "version_label": "",
+            "host": prefs.get("docker_host") or prefs.get("docker_context") or "",
+        }
+
+        # Everything shown in the log viewer is also kept on disk
+        self.log_sink = LogSink()
+        self.log_sink.start()
 
         self.setup_ui()
 
         # Log the paths being used (helpful for debugging on Windows)
         self._append_log(f"Install directory: {NOVA_DIR}")
         self._append_log(f"Compose file path: {COMPOSE_FILE}")
+        if cleanup_previous_launcher():
+            self._append_log(f"[info] Launcher updated to v{APP_VERSION}")
+
+        # Show the last known state at once; the first check reconciles it.
+        # Daemon states are left to that check: rendering them resolves the
+        # Docker host, which can itself wait on the CLI
+        cached_state = load_last_state(self._last_state["host"])
+        if cached_state and cached_state["state"] not in ("docker_missing", "docker_stopped"):
+            self._show_cached_state(cached_state)
+
+        # Report callbacks that block the Tk event loop
+        self.stall_detector = StallDetector(self.root, self._append_log)
+        self.stall_detector.start()
 
         # Start Background Monitor
         self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
         self.monitor_thread.start()
 
+        # Follow container health transitions pushed by the daemon
+        threading.Thread(
+            target=watch_health_events,
+            args=(self._on_health_event, self.stop_event),
+            daemon=True
+        ).start()
+
+        # Stream the tracker's output into the log and the startup status
+        threading.Thread(
+            target=follow_container_logs,
+            args=(self._on_container_output, self.stop_event, self._on_container_logs_connect),
+            daemon=True
+        ).start()
+
         # Check for launcher updates in background
         threading.Thread(target=self._check_launcher_update, daemon=True).start()
 
     def _on_close(self):
         """Graceful shutdown: stop monitor thread and optionally stop the container."""
         self.stop_event.set()
+        self.cancel_event.set()
+        self.stall_detector.stop()
+        stop_health_events()
+        stop_container_logs()
+        terminate_managed_processes()
+        close_docker_host()
+        self.log_sink.close()
+        self.log_store.close()
         self.root.destroy()
 
     def setup_ui(self):
@@ -231,6 +379,15 @@ class NovaManagerApp:
         self.progress = ctk.CTkProgressBar(self.content_frame, mode="indeterminate", width=200)
         self.progress.set(0)
 
+        # Shown under the progress bar for operations that can be cancelled
+        self.btn_cancel = self._create_ghost_button(
+            self.content_frame,
+            "Cancel",
+            self.cancel_operation,
+            width=90,
+            height=30
+        )
+
         # Buttons Row
         self.btn_row = ctk.CTkFrame(self.content_frame, fg_color="transparent", border_width=0)
         self.btn_row.pack(pady=15)
@@ -253,6 +410,14 @@ class NovaManagerApp:
             height=38
         )
 
+        self.btn_suspend = self._create_ghost_button(
+            self.btn_row,
+            "Suspend",
+            self.suspend_nova,
+            width=110,
+            height=38
+        )
+
         # Version / image info label
         self.lbl_version = ctk.CTkLabel(
             self.content_frame,
@@ -261,6 +426,15 @@ class NovaManagerApp:
         )
         self.lbl_version.pack(pady=(5, 0))
 
+        # Resource usage against the compose limits (running only)
+        self.lbl_usage = ctk.CTkLabel(
+            self.content_frame,
+            text="",
+            font=("DM Sans", 11),
+            text_color="#888888"
+        )
+        self.lbl_usage.pack(pady=(0, 0))
+
         # --- Log Viewer ---
         log_frame = ctk.CTkFrame(self.root, fg_color="transparent")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(5, 5))
@@ -284,20 +458,25 @@ class NovaManagerApp:
         self.log_toggle_btn.pack(side=tk.RIGHT)
         self.log_toggle_btn.bind("<Button-1>", lambda e: self._toggle_logs())
 
-        self.log_text = ctk.CTkTextbox(
-            log_frame,
-            height=10,
-            font=("Courier New", 12),
-            state="disabled",
-            wrap="word"
-        )
+        # Only the visible rows are rendered; the session's lines live in a LogStore
+        self.log_store = LogStore()
+        self.log_viewer = LogViewer(log_frame, self.log_store, accent=NOVA_TEAL)
         # Start hidden
-        self.log_text.pack_forget()
+        self.log_viewer.pack_forget()
 
         # --- Footer ---
         footer = ctk.CTkFrame(self.root, fg_color="transparent")
         footer.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 15))
 
+        # Tools links (bottom-most row)
+        self.tools_row = ctk.CTkFrame(footer, fg_color="transparent")
+        self.tools_row.pack(side=tk.BOTTOM, pady=(6, 0))
+        self._create_link_label(self.tools_row, "Snapshots", self._show_snapshots_dialog)
+        self._create_link_label(self.tools_row, "Disk Usage", self._show_disk_usage_dialog)
+        self._create_link_label(self.tools_row, "Bundles", self._show_bundles_dialog)
+        self._create_link_label(self.tools_row, "Fleet", self._show_fleet_dialog)
+        self._create_link_label(self.tools_row, "Export Trace", self._export_trace)
+
         # Update Link
         self.lbl_update = ctk.CTkLabel(
             footer,
@@ -381,12 +560,25 @@ class NovaManagerApp:
             border_width=0
         )
 
+    def _create_link_label(self, parent, text, command):
+        """Create a small clickable text link in the footer tools row."""
+        link = ctk.CTkLabel(
+            parent,
+            text=text,
+            font=("DM Sans", 12),
+            text_color=NOVA_TEAL,
+            cursor="hand2"
+        )
+        link.pack(side=tk.LEFT, padx=8)
+        link.bind("<Button-1>", lambda e: command())
+        return link
+
     def _toggle_logs(self):
         if self.log_toggle_var.get():
             # Hiding logs — store current expanded height before collapsing
             self.root.update_idletasks()
             self._expanded_height = self.root.winfo_height()
-            self.log_text.pack_forget()
+            self.log_viewer.pack_forget()
             self.log_toggle_btn.configure(text="Show")
             self.log_toggle_var.set(False)
             # Shrink window to fit only the visible widgets
@@ -397,45 +589,46 @@ class NovaManagerApp:
             self.root.minsize(width, compact_height)
         else:
             # Showing logs — restore the expanded height
-            self.log_text.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+            self.log_viewer.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
             self.log_toggle_btn.configure(text="Hide")
             self.log_toggle_var.set(True)
             self.root.update_idletasks()
             width = self.root.winfo_width()
             self.root.geometry(f"{width}x{self._expanded_height}")
 
-    def _append_log(self, text):
-        """Thread-safe append to the log viewer with line limit."""
-        def _update():
-            self.log_text.configure(state="normal")
-            timestamp = time.strftime("%H:%M:%S")
-            self.log_text.insert("end", f"[{timestamp}] {text}\n")
-
-            # Enforce max line limit
-            line_count = int(self.log_text.index("end-1c").split(".")[0])
-            if line_count > MAX_LOG_LINES:
-                lines_to_delete = line_count - MAX_LOG_LINES
-                self.log_text.delete("1.0", f"{lines_to_delete + 1}.0")
+    def _append_log(self, text, source="launcher"):
+        """Thread-safe append to the log viewer and the on-disk log.
 
-            self.log_text.see("end")
-            self.log_text.configure(state="disabled")
-        self.root.after(0, _update)
+        Args:
+            text: Log line, optionally prefixed with a level such as "[warn]"
+            source: "launcher", or "container" for tracker output
+        """
+        level = parse_level(text)
+        self.log_sink.write(text, level=level, source=source)
+        timestamp = time.strftime("%H:%M:%S")
+        self.log_viewer.append(f"[{timestamp}] {text}", level=level, source=source)
 
     # --- UI Helpers ---
 
-    def set_loading(self, is_loading, message="Processing..."):
+    def set_loading(self, is_loading, message="Processing...", cancellable=False):
         self.is_processing = is_loading
         if is_loading:
             self.lbl_center_info.configure(text=message)
             self.progress.pack(after=self.lbl_center_info, pady=(10, 15))
             self.progress.start()
+            if cancellable:
+                self.cancel_event.clear()
+                self.btn_cancel.configure(state="normal", text="Cancel")
+                self.btn_cancel.pack(after=self.progress, pady=(0, 10))
             self.btn_main.configure(state="disabled")
             self.btn_stop.configure(state="disabled")
+            self.btn_suspend.configure(state="disabled")
             self.lbl_update.unbind("<Button-1>")
             self.lbl_update.configure(text_color="#AAAAAA", cursor="")
         else:
             self.progress.stop()
             self.progress.pack_forget()
+            self.btn_cancel.pack_forget()
             self.lbl_update.bind("<Button-1>", lambda e: self.check_update())
             self.lbl_update.configure(
                 text_color=NOVA_TEAL,
@@ -443,6 +636,16 @@ class NovaManagerApp:
             )
             self.lbl_center_info.configure(text="")
 
+    def cancel_operation(self):
+        """Cancel the running install, start or update."""
+        self.cancel_event.set()
+        self.btn_cancel.configure(state="disabled", text="Cancelling...")
+        self._append_log("[info] Cancelling...")
+
+    def _lock_cancel(self):
+        """Disable Cancel for steps that must not be interrupted (thread-safe)."""
+        self.root.after(0, lambda: self.btn_cancel.configure(state="disabled"))
+
     def run_command_legacy(self, command, timeout=DOCKER_CMD_TIMEOUT):
         """Legacy wrapper for run_command that logs output. Returns (stdout, stderr, returncode)."""
         self._append_log(f"$ {command}")
@@ -465,7 +668,7 @@ class NovaManagerApp:
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.settimeout(1)
-                result = s.connect_ex(("127.0.0.1", PORT))
+                result = s.connect_ex((remote_hostname() or "127.0.0.1", PORT))
                 if result == 0:
                     # Port is in use - check if it's our container
                     is_running, _ = is_container_running()
@@ -477,70 +680,191 @@ class NovaManagerApp:
             return True  # If check fails, proceed anyway
 
     def monitor_loop(self):
+        # Resolving the host may query docker contexts, so not in __init__
+        self._append_log(f"Docker host: {describe_host()}")
         while not self.stop_event.is_set():
             if not self.is_processing:
                 self.check_state()
             time.sleep(MONITOR_INTERVAL)
 
+    def _retry_docker_host(self):
+        retry_docker_host()
+        self._refresh_state()
+
+    def _refresh_state(self):
+        """Run check_state off the Tk thread; it shells out to Docker."""
+        threading.Thread(target=self.check_state, daemon=True).start()
+
     def check_state(self):
-        # 1. Docker installed?
-        if not is_docker_installed():
-            self.update_ui("docker_missing")
+        # Probes run concurrently; the state is decided as results arrive
+        self.update_ui(probe_state(on_result=self._on_probe_result))
+
+    def _on_probe_result(self, name, result):
+        # Start the Docker Hub update scheduler once the daemon answers,
+        # even if the state was already decided from the dashboard probe.
+        # Its first check runs right away, before the container is launched.
+        # May run on a probe pool thread
+        if name != "daemon" or not result[0]:
             return
+        with self._update_check_lock:
+            if self._update_check_done:
+                return
+            self._update_check_done = True
+        threading.Thread(target=self._update_scheduler_loop, daemon=True).start()
 
-        # 2. Docker daemon running?
-        is_running, status = is_docker_running()
-        if not is_running:
-            if status == "missing":
-                self.update_ui("docker_missing")
-            else:
-                self.update_ui("docker_stopped")
-            return
+    def _on_health_event(self, status):
+        """Apply a health transition from the daemon without waiting for the next poll."""
+        self._append_log(f"[info] Tracker health: {status}")
+        if not self.is_processing:
+            self.update_ui({"healthy": "running", "unhealthy": "unhealthy"}.get(status, "initializing"))
 
-        # 3. Check for Docker Hub updates (non-blocking, after daemon check)
-        # Only check ONCE per session, before container is launched
-        if not self._update_check_done:
-            self._update_check_done = True
-            threading.Thread(target=self._check_image_update_background, daemon=True).start()
+    def _on_container_logs_connect(self):
+        """A new container run is being followed; forget the previous run's findings."""
+        self.log_analyzer.reset()
+        self._container_issue = None
 
-        # 4. Nova installed?
-        if not is_nova_installed():
-            self.update_ui("not_installed")
-            return
+    def _on_container_output(self, chunk):
+        """Log tracker output and surface known milestones and problems.
 
-        # 5. Container running?
-        is_running, status_str = is_container_running()
+        Runs on the log-follow thread.
+        """
+        lines, findings = self.log_analyzer.feed(chunk)
+        for line in lines:
+            if line.strip():
+                self._append_log(line, source="container")
+        for finding in findings:
+            if finding["kind"] == "condition":
+                self._container_issue = finding["message"]
+                self._append_log(f"[warn] {finding['message']}")
+            elif finding["kind"] == "milestone":
+                self._append_log(f"[info] Tracker: {finding['message']}")
+            # The startup banner or the configured marker: check right away
+            # instead of waiting for the next monitor tick
+            if finding["kind"] == "ready" or finding["name"] == "serving":
+                self._confirm_ready()
+        if findings:
+            self.root.after(0, self._refresh_initializing_status)
+
+    def _confirm_ready(self):
+        """Probe the dashboard tightly for a few seconds after a ready signal in the log."""
+        if self._ready_confirming.is_set() or self._ui_state == "running":
+            return
+        self._ready_confirming.set()
 
-        if is_running:
-            if check_web_ready():
-                self.update_ui("running")
-            else:
-                self.update_ui("initializing")
-        else:
-            self.update_ui("stopped")
+        def _confirm():
+            try:
+                started = time.monotonic()
+                ready = wait_for_web_ready(dashboard_url(), timeout=READY_CONFIRM_WINDOW,
+                                           interval=READY_CONFIRM_INTERVAL, stop_event=self.stop_event)
+                if ready:
+                    self._append_log(f"[info] Dashboard answered {(time.monotonic() - started) * 1000:.0f} ms "
+                                     f"after the tracker reported it was listening")
+                    self.update_ui("running")
+            finally:
+                self._ready_confirming.clear()
+
+        threading.Thread(target=_confirm, daemon=True).start()
+
+    def _initializing_message(self, fallback):
+        """Center text for the initializing state: log progress, then the ETA."""
+        progress = self._container_issue or self.log_analyzer.status
+        eta_text = self._initializing_text()
+        if progress:
+            return f"{progress}\n{eta_text}" if eta_text else progress
+        return eta_text or fallback
+
+    def _refresh_initializing_status(self):
+        if not self.is_processing and self._ui_state == "initializing":
+            self.lbl_center_info.configure(text=self._initializing_message(self.lbl_center_info.cget("text")))
+
+    def _update_scheduler_loop(self):
+        """Check for image updates periodically, with jitter, until the launcher closes."""
+        delay = 0
+        while not self.stop_event.wait(delay):
+            delay = next_check_delay()
+            if self.is_processing:
+                # Don't compete with an install, start or update the user is waiting on
+                delay = min(delay, PREPULL_RETRY_INTERVAL)
+                continue
+            delay = self._check_image_update_background() or delay
 
     def _check_image_update_background(self):
-        """Background check for Docker Hub image updates."""
+        """Background check for Docker Hub image updates.
+
+        New images are downloaded before the user is prompted, inside the
+        "prepull_window" pref, so applying the update only recreates the
+        container. The download is only staged (see stage_image): the
+        tracker keeps running the current image, even across a restart,
+        until the user applies the update. With "prepull_updates" set to
+        false the user is prompted straight away and the pull happens on
+        Update Now, as before.
+
+        Returns:
+            Seconds until the scheduler should check again, or None for the
+            regular interval
+        """
         try:
             update_available, remote_digest, error = check_dockerhub_version()
 
             if error:
                 self._append_log(f"[info] Docker Hub check: {error}")
-                return
+                return None
+
+            if not update_available:
+                # The tracker already runs what Docker Hub serves
+                if is_update_staged():
+                    discard_staged_image()
+                return None
 
-            if update_available and remote_digest:
+            if remote_digest:
                 # Check if user has skipped this version
                 skipped = get_skipped_digest()
                 if skipped and remote_digest == skipped:
                     self._append_log("[info] Update available but user skipped this version")
-                    return
-
-                # Store the pending digest and prompt user
-                self.pending_update_digest = remote_digest
-                # Use default argument to capture value, not reference
-                self.root.after(0, lambda d=remote_digest: self._prompt_update_dialog(d))
+                    return None
+                if remote_digest in self._dismissed_digests:
+                    return None
+
+                prefs = load_launcher_prefs()
+                if not prefs.get("prepull_updates", True):
+                    self._offer_update(remote_digest)
+                    return None
+                if remote_digest in get_local_image_digests(DOCKER_IMAGE_STAGED):
+                    # Downloaded earlier but not applied yet
+                    self._offer_update(remote_digest, staged=True)
+                    return None
+
+                wait = seconds_until_window(prefs.get("prepull_window"))
+                if wait > 0:
+                    self._append_log(f"[info] Update available, download scheduled in {wait / 3600:.1f}h "
+                                     f"(prepull window {prefs.get('prepull_window')})")
+                    return wait + next_check_delay(interval=300, jitter=1.0)
+
+                if not self._image_pull_lock.acquire(blocking=False):
+                    # An update the user started is downloading
+                    return PREPULL_RETRY_INTERVAL
+                try:
+                    self._append_log("Downloading update in the background...")
+                    success, msg = stage_image(remote_digest, cancel_event=self.stop_event)
+                finally:
+                    self._image_pull_lock.release()
+                if not success:
+                    self._append_log(f"[warn] Background download failed: {msg}")
+                    return PREPULL_RETRY_INTERVAL
+                self._append_log(f"[info] {msg}, ready to install")
+                self._offer_update(remote_digest, staged=True)
         except Exception as e:
             self._append_log(f"[warn] Docker Hub check failed: {e}")
+        return None
+
+    def _offer_update(self, digest, staged=False):
+        """Prompt for an update unless the user already declined it (any thread)."""
+        if not digest or digest in self._dismissed_digests or digest == get_skipped_digest():
+            return
+        # Store the pending digest and prompt user
+        self.pending_update_digest = digest
+        # Use default argument to capture value, not reference
+        self.root.after(0, lambda d=digest: self._prompt_update_dialog(d, staged=staged))
 
     def _show_error_dialog(self, title, message):
         """Show an error dialog using CTkToplevel."""
@@ -610,19 +934,23 @@ class NovaManagerApp:
             font=("DM Sans", 14)
         ).pack(pady=10)
 
-    def _prompt_update_dialog(self, remote_digest: str, on_update_callback=None):
+    def _prompt_update_dialog(self, remote_digest: str, on_update_callback=None, staged=False):
         """Show a dialog prompting the user to update.
 
         Args:
             remote_digest: The digest of the available update
             on_update_callback: Optional callback for Update Now button. If None, uses default behavior.
+            staged: The image is already downloaded, so updating only recreates the container
         """
         # Don't prompt if we're processing something else
         if self.is_processing:
             return
+        if self._update_dialog is not None and self._update_dialog.winfo_exists():
+            return
 
         # Create a custom dialog
         dialog = ctk.CTkToplevel(self.root)
+        self._update_dialog = dialog
         dialog.title("Update Available")
         dialog.geometry("420x200")
         dialog.resizable(False, False)
@@ -639,9 +967,12 @@ class NovaManagerApp:
             font=("DM Sans", 16, "bold")
         ).pack(pady=(25, 10))
 
+        image_text = f"Image: {DOCKER_IMAGE}:{DOCKER_TAG}"
+        if staged:
+            image_text += "\nAlready downloaded, installing takes only a few seconds."
         ctk.CTkLabel(
             dialog,
-            text=f"Image: {DOCKER_IMAGE}:{DOCKER_TAG}",
+            text=image_text,
             font=("DM Sans", 13)
         ).pack(pady=(0, 25))
 
@@ -659,12 +990,16 @@ class NovaManagerApp:
         def on_skip():
             dialog.destroy()
             # Clear pending so we don't prompt again this session
+            self._dismissed_digests.add(remote_digest)
             self.pending_update_digest = None
 
         def on_skip_version():
             set_skipped_digest(remote_digest)
             self.pending_update_digest = None
             dialog.destroy()
+            if staged:
+                # Let the next prune reclaim the skipped download
+                threading.Thread(target=discard_staged_image, daemon=True).start()
 
         self._create_primary_button(btn_frame, "Update Now", on_update, width=120).pack(side=tk.LEFT, padx=5)
         self._create_ghost_button(btn_frame, "Skip", on_skip, width=80).pack(side=tk.LEFT, padx=5)
@@ -685,51 +1020,131 @@ class NovaManagerApp:
             auto_start: If True, calls check_state after update to potentially start container.
                        If False, just refreshes UI state without auto-starting.
         """
-        self.set_loading(True, "Downloading update...")
+        self.set_loading(True, "Downloading update...", cancellable=True)
 
         def _update_thread():
             self._append_log("Pulling latest image...")
+            trace = self._begin_trace("update")
 
             # Store the digest before pulling to save as skipped after success
             digest_to_skip = self.pending_update_digest
 
-            # Pull the image
-            success, msg = pull_image()
+            # Snapshot the instance data while the image downloads
+            snapshot_result = {}
+            snapshot_thread = None
+            data_notice = remote_data_notice()
+            if data_notice:
+                self._append_log(f"[info] No pre-update snapshot. {data_notice}")
+            elif load_launcher_prefs().get("snapshot_before_update", True) and os.path.isdir(INSTANCE_DIR):
+                def _snapshot():
+                    started = trace.elapsed()
+                    snapshot_result["result"] = create_snapshot(label="pre-update")
+                    if snapshot_result["result"][0]:
+                        snapshot_result["id"] = list_snapshots()[0]["id"]
+                    trace.add("snapshot", started, trace.elapsed() - started)
+                snapshot_thread = threading.Thread(target=_snapshot, daemon=True)
+                snapshot_thread.start()
+
+            # Pull the image (or import it from an offline bundle), unless the
+            # scheduler already downloaded it. A background download still in
+            # progress is waited for rather than started a second time
+            pull_locked = self._image_pull_lock.acquire(blocking=False)
+            if not pull_locked:
+                self._append_log("[info] Waiting for the background download to finish...")
+                while not pull_locked and not self.cancel_event.is_set():
+                    pull_locked = self._image_pull_lock.acquire(timeout=0.5)
+            try:
+                if not pull_locked:
+                    success, msg = False, "Cancelled"
+                elif is_update_staged() and (digest_to_skip is None
+                                             or digest_to_skip in get_local_image_digests(DOCKER_IMAGE_STAGED)):
+                    success, msg = apply_staged_image()
+                    self._append_log(f"[info] {msg}" if success else f"[warn] {msg}")
+                else:
+                    trace.begin("pull")
+                    success, msg = self._acquire_image(expected_digest=digest_to_skip)
+                    if success and is_update_staged():
+                        # Superseded by what was just pulled
+                        discard_staged_image()
+            finally:
+                if pull_locked:
+                    self._image_pull_lock.release()
+
+            if snapshot_thread is not None:
+                snapshot_thread.join()
+                snap_ok, snap_msg = snapshot_result.get("result", (False, "Snapshot did not finish"))
+                self._append_log(f"[info] {snap_msg}" if snap_ok else f"[warn] {snap_msg}")
+
             if not success:
-                self.root.after(0, lambda: self._show_error_dialog("Update Failed", f"Failed to pull image:\n{msg}"))
+                self._fail_trace(trace)
+                if self.cancel_event.is_set():
+                    self._append_log("[info] Update cancelled")
+                else:
+                    self.root.after(0, lambda: self._show_error_dialog("Update Failed", f"Failed to pull image:\n{msg}"))
                 self.root.after(0, lambda: self.set_loading(False))
                 self.pending_update_digest = None
                 return
 
-            # Save the new digest as skipped so we don't prompt again for this version
-            if digest_to_skip:
-                set_skipped_digest(digest_to_skip)
-
-            # Stop and recreate container
-            self._append_log("Recreating container...")
-            stop_container()
+            # When the tracker is live, the new image initializes on data seeded
+            # from the pre-update snapshot while the dashboard stays up, which
+            # needs the instance data on this computer
+            prefs = load_launcher_prefs()
+            container_running, _ = is_container_running()
+            downtime = None
+            prepared = container_running and not is_remote() and prefs.get("prepared_updates", True)
+            if prepared and "id" not in snapshot_result:
+                self._append_log("[info] No pre-update snapshot to prepare the new version from")
+            if prepared and "id" in snapshot_result:
+                success, msg, downtime = self._prepared_switch(trace, snapshot_result["id"])
+            else:
+                # Stop and recreate container
+                self._lock_cancel()
+                self._append_log("Recreating container...")
+                trace.begin("container_stop")
+                stop_container()
+                trace.begin("container_create")
+                success, msg = recreate_container()
+                if not success:
+                    msg = f"Failed to recreate container:\n{msg}"
 
-            success, msg = recreate_container()
             if not success:
-                self.root.after(0, lambda: self._show_error_dialog("Update Failed", f"Failed to recreate container:\n{msg}"))
+                self._fail_trace(trace)
+                if self.cancel_event.is_set():
+                    self._append_log("[info] Update cancelled, the running tracker was left untouched")
+                else:
+                    self._append_log(f"[error] Update failed: {msg}")
+                    self.root.after(0, lambda m=msg: self._show_error_dialog("Update Failed", m))
+            elif digest_to_skip:
+                # Installed: don't prompt again for this version. Not recorded
+                # before the switch, or a failed update would hide the version
+                set_skipped_digest(digest_to_skip)
 
-            # Cleanup old images
-            prune_images()
+            # Cleanup superseded Nova images without holding up the banner
+            threading.Thread(target=self._prune_old_images, daemon=True).start()
 
             # Clear pending
             self.pending_update_digest = None
 
             # Show success message for manual update
+            complete_text = "↻ Update Complete"
+            if downtime is not None:
+                complete_text = f"↻ Update Complete ({downtime:.1f}s offline)"
+            complete_color = "#4CD964"
+            if not success:
+                if self.cancel_event.is_set():
+                    complete_text, complete_color = "↻ Update Cancelled", "#FF9500"
+                else:
+                    complete_text, complete_color = "↻ Update Failed", "#D35454"
             self.root.after(0, lambda: self.lbl_update.configure(
-                text="↻ Update Complete",
-                text_color="#4CD964"
+                text=complete_text,
+                text_color=complete_color
             ))
 
             self.root.after(0, lambda: self.set_loading(False))
 
             if auto_start:
                 # Auto-start: check state which may start container
-                self.root.after(200, self.check_state)
+                self.root.after(200, self._refresh_state)
             else:
                 # Manual: just refresh UI, don't auto-start
                 self.root.after(200, self._refresh_ui_after_update)
@@ -739,21 +1154,724 @@ class NovaManagerApp:
                 self.lbl_update.configure(text="↻ Check for Updates", text_color=NOVA_TEAL)
             self.root.after(3000, reset_button)
 
+            if success:
+                self._finish_trace_when_ready(trace)
+
         threading.Thread(target=_update_thread, daemon=True).start()
 
+    def _prune_old_images(self):
+        """Remove superseded Nova images and log the reclaimed space."""
+        keep_previous = load_launcher_prefs().get("keep_previous_images", 0)
+        success, msg, reclaimed = prune_images(keep_previous=keep_previous)
+        if success:
+            self._append_log(f"[info] {msg}, reclaimed up to {format_bytes(reclaimed)}")
+        else:
+            self._append_log(f"[warn] Image cleanup failed: {msg}")
+
+    def _prepared_switch(self, trace, snapshot_id):
+        """Initialize the new image beside the live container, then switch to it.
+
+        The candidate runs on data seeded from the pre-update snapshot, so
+        the live database never has a second writer, and does its first-run
+        initialization and database migration there while the dashboard
+        keeps serving. Docker cannot re-publish the port of a running
+        container, so the switch recreates the compose service: the live
+        tracker is paused, and if its databases are still as the snapshot
+        saw them the candidate's migrated databases replace them and the new
+        container starts on those. If the tracker wrote in the meantime, the
+        new container migrates the current data itself. The dashboard is
+        offline from the pause until the new container serves; that time is
+        measured and reported.
+
+        Args:
+            trace: PhaseTrace of the update
+            snapshot_id: The pre-update snapshot
+
+        Returns:
+            Tuple of (success: bool, message: str, downtime_seconds: float|None)
+        """
+        self.root.after(0, lambda: self.lbl_center_info.configure(
+            text="Preparing the new version alongside the running tracker..."))
+        trace.begin("candidate_seed")
+        success, msg = seed_instance(snapshot_id, CANDIDATE_INSTANCE_DIR)
+        if not success:
+            return False, msg, None
+
+        self._append_log(f"Starting update candidate on port {CANDIDATE_PORT}...")
+        trace.begin("candidate_create")
+        success, msg = start_candidate_container(CANDIDATE_INSTANCE_DIR)
+        if not success:
+            remove_candidate_container()
+            shutil.rmtree(CANDIDATE_INSTANCE_DIR, ignore_errors=True)
+            return False, f"Failed to start the new version:\n{msg}", None
+
+        self._append_log("Waiting for update candidate to become ready...")
+        trace.begin("candidate_ready")
+        ready = wait_for_web_ready(
+            dashboard_url(CANDIDATE_PORT),
+            timeout=CANDIDATE_READY_TIMEOUT,
+            stop_event=self.cancel_event,
+        )
+        if self.cancel_event.is_set() or not ready:
+            remove_candidate_container()
+            shutil.rmtree(CANDIDATE_INSTANCE_DIR, ignore_errors=True)
+            if self.cancel_event.is_set():
+                return False, "Cancelled", None
+            return False, ("The new version did not become ready.\n"
+                           "The running tracker was left untouched."), None
+
+        self.root.after(0, lambda: self.lbl_center_info.configure(
+            text="Switching to the new version...\nThe dashboard is offline for a moment."))
+        self._append_log("Update candidate is ready, switching over...")
+        self._lock_cancel()
+        trace.begin("switch")
+        # Closes the candidate's databases; the live tracker still serves
+        stop_candidate_container()
+        remove_candidate_container()
+        switch_started = time.monotonic()
+        # Paused, the live tracker cannot write between the check and the stop
+        paused, _ = pause_container()
+        if paused and databases_unchanged(snapshot_id):
+            stop_container()
+            success, msg = promote_databases(CANDIDATE_INSTANCE_DIR, snapshot_id)
+            if success:
+                self._append_log(f"[info] {msg}")
+            else:
+                self._append_log(f"[warn] {msg}; the new version migrates the current data on start")
+        else:
+            if paused:
+                unpause_container()
+            self._append_log("[info] The tracker saved data while the new version initialized; "
+                             "the new version migrates the current data on start")
+            stop_container()
+        shutil.rmtree(CANDIDATE_INSTANCE_DIR, ignore_errors=True)
+
+        success, msg = recreate_container()
+        if not success:
+            return False, f"Failed to recreate container:\n{msg}", None
+
+        wait_for_web_ready(
+            dashboard_url(),
+            timeout=CANDIDATE_READY_TIMEOUT,
+            stop_event=self.stop_event,
+        )
+        downtime = time.monotonic() - switch_started
+        self._append_log(f"[info] Update switch-over downtime: {downtime:.1f}s")
+        return True, "Container recreated successfully", downtime
+
+    # --- Phase Tracing ---
+
+    def _begin_trace(self, operation):
+        """Start timing an operation and look up its historical ETA."""
+        trace = PhaseTrace(operation)
+        self._active_trace = trace
+        self._active_eta = estimate_until(operation, "first_dashboard_200")
+        return trace
+
+    def _eta_text(self, operation, phase, fallback):
+        """Describe how long a phase usually takes on this machine."""
+        seconds = estimate(operation, phase)
+        if seconds is None:
+            return fallback
+        return f"usually {format_eta(seconds)} on this machine"
+
+    def _initializing_text(self):
+        """Remaining-time hint for the initializing state, or None without history."""
+        trace = self._active_trace
+        if trace is None or trace.finished or self._active_eta is None:
+            return None
+        remaining = self._active_eta - trace.elapsed()
+        if remaining <= 0:
+            return "Starting up... (taking longer than usual)"
+        return f"Starting up... ready in {format_eta(remaining)}"
+
+    def _finish_trace_when_ready(self, trace):
+        """Time the health and first-dashboard phases, then store the trace.
+
+        Runs on the worker thread of the operation being traced.
+        """
+        trace.begin("health_ready")
+        ready = wait_for_healthy(CANDIDATE_READY_TIMEOUT, stop_event=self.stop_event)
+        if ready:
+            trace.begin("first_dashboard_200")
+            ready = wait_for_web_ready(dashboard_url(), timeout=CANDIDATE_READY_TIMEOUT,
+                                       stop_event=self.stop_event)
+        total = trace.elapsed()
+        trace.finish(success=ready)
+        if self._active_trace is trace:
+            self._active_trace = None
+        if ready:
+            self._append_log(f"[info] {trace.operation.capitalize()} ready after {total:.1f}s")
+            self._warm_up_dashboard(trace.operation)
+
+    def _warm_up_dashboard(self, operation):
+        """Request the warm-up URLs so the first dashboard visit is fast.
+
+        Runs on the worker thread of the operation that made the tracker ready.
+        """
+        urls = warmup_urls(load_launcher_prefs().get("warmup_urls"))
+        if not urls:
+            return
+        host = default_host()
+        typical = {url: typical_first_ms(host, url) for url in urls}
+        results = run_warmup(urls, stop_event=self.stop_event)
+        record_warmup(host, operation, results)
+
+        for result in results:
+            path = urllib.parse.urlparse(result["url"]).path or "/"
+            if result["first_ms"] is None:
+                self._append_log(f"[warn] Warm-up {path}: {result['error']}")
+                continue
+            text = f"[info] Warm-up {path}: {result['first_ms']:.0f} ms"
+            if result["repeat_ms"] is not None:
+                text += f", then {result['repeat_ms']:.0f} ms"
+            if typical[result["url"]] is not None:
+                text += f" (usually {typical[result['url']]:.0f} ms)"
+            self._append_log(text)
+
+    def _fail_trace(self, trace):
+        """Store a failed trace so it shows up in exports, but not in ETAs."""
+        trace.finish(success=False)
+        if self._active_trace is trace:
+            self._active_trace = None
+
+    def _export_trace(self):
+        """Save recent operation timelines as Chrome trace JSON."""
+        path = filedialog.asksaveasfilename(
+            title="Export Phase Trace",
+            defaultextension=".json",
+            initialfile="nova-trace.json",
+            filetypes=[("Chrome trace", "*.json")],
+        )
+        if not path:
+            return
+        success, msg = export_chrome_trace(path)
+        self._append_log(f"[info] {msg}" if success else f"[warn] {msg}")
+        if success:
+            self._show_info_dialog("Trace Exported",
+                                   f"{msg}\n\nOpen it in chrome://tracing or ui.perfetto.dev.")
+        else:
+            self._show_error_dialog("Export Failed", msg)
+
+    # --- Snapshots ---
+
+    def _show_snapshots_dialog(self):
+        """List instance snapshots with one-click restore."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Snapshots")
+        dialog.geometry("460x380")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        # Center the dialog
+        dialog.geometry(f"+{self.root.winfo_x() + 20}+{self.root.winfo_y() + 80}")
+
+        ctk.CTkLabel(
+            dialog,
+            text="Instance Snapshots",
+            font=("DM Sans", 16, "bold")
+        ).pack(pady=(20, 5))
+
+        ctk.CTkLabel(
+            dialog,
+            text="A snapshot is taken automatically before every update.",
+            font=("DM Sans", 12),
+            text_color="#666666"
+        ).pack(pady=(0, 10))
+
+        lbl_loading = ctk.CTkLabel(dialog, text="Loading snapshots...", font=("DM Sans", 13))
+        lbl_loading.pack(pady=20)
+
+        def _load():
+            # Reads every manifest, and resolving the Docker host may run the CLI
+            data_notice = remote_data_notice()
+            snapshots = [] if data_notice else list_snapshots()
+            self.root.after(0, lambda: _show(data_notice, snapshots))
+
+        def _show(data_notice, snapshots):
+            if not dialog.winfo_exists():
+                return
+            lbl_loading.destroy()
+            if data_notice:
+                ctk.CTkLabel(
+                    dialog,
+                    text=data_notice,
+                    font=("DM Sans", 13),
+                    wraplength=380,
+                    justify="left"
+                ).pack(pady=20, padx=25)
+                return
+
+            rows = ctk.CTkScrollableFrame(dialog, width=400, height=220, fg_color="transparent")
+            rows.pack(fill=tk.BOTH, expand=True, padx=20)
+
+            if not snapshots:
+                ctk.CTkLabel(rows, text="No snapshots yet.", font=("DM Sans", 13)).pack(pady=20)
+
+            for snapshot in snapshots:
+                row = ctk.CTkFrame(rows, fg_color="transparent")
+                row.pack(fill=tk.X, pady=3)
+                created = time.strftime("%Y-%m-%d %H:%M", time.localtime(snapshot["created"]))
+                details = f"{created}  •  {format_bytes(snapshot['total_bytes'])}"
+                if snapshot["label"]:
+                    details += f"  •  {snapshot['label']}"
+                ctk.CTkLabel(row, text=details, font=("DM Sans", 12), anchor="w").pack(side=tk.LEFT)
+
+                def on_restore(snapshot_id=snapshot["id"]):
+                    dialog.destroy()
+                    self._restore_snapshot(snapshot_id)
+
+                self._create_ghost_button(row, "Restore", on_restore, width=80, height=28).pack(side=tk.RIGHT)
+
+            self._create_primary_button(dialog, "Snapshot Now", on_snapshot_now, width=140).pack(pady=15)
+
+        def on_snapshot_now():
+            dialog.destroy()
+            self.set_loading(True, "Creating snapshot...")
+
+            def _snapshot_thread():
+                success, msg = create_snapshot(label="manual")
+                self._append_log(f"[info] {msg}" if success else f"[warn] {msg}")
+                self.root.after(0, lambda: self.set_loading(False))
+                self.root.after(200, self._refresh_state)
+
+            threading.Thread(target=_snapshot_thread, daemon=True).start()
+
+        threading.Thread(target=_load, daemon=True).start()
+
+    # --- Fleet ---
+
+    def _show_fleet_dialog(self):
+        """Status of every host in the "fleet_hosts" pref, with bulk actions."""
+        fleet = Fleet(load_launcher_prefs().get("fleet_hosts") or [])
+
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Fleet")
+        dialog.geometry("620x440")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+
+        # Center the dialog
+        dialog.geometry(f"+{self.root.winfo_x() + 20}+{self.root.winfo_y() + 60}")
+
+        ctk.CTkLabel(
+            dialog,
+            text="Fleet",
+            font=("DM Sans", 16, "bold")
+        ).pack(pady=(20, 5))
+
+        lbl_summary = ctk.CTkLabel(
+            dialog,
+            text=f"{len(fleet.hosts)} hosts",
+            font=("DM Sans", 12),
+            text_color="#666666"
+        )
+        lbl_summary.pack(pady=(0, 10))
+
+        rows = ctk.CTkScrollableFrame(dialog, width=560, height=250, fg_color="transparent")
+        rows.pack(fill=tk.BOTH, expand=True, padx=20)
+
+        for col, heading in enumerate(("Host", "State", "Image", "Dashboard")):
+            ctk.CTkLabel(rows, text=heading, font=("DM Sans", 12, "bold"), anchor="w").grid(
+                row=0, column=col, sticky="w", padx=(0, 24))
+
+        cells = {}
+        for i, host in enumerate(fleet.hosts, start=1):
+            cells[host] = []
+            for col, text in enumerate((host_label(host), "Checking...", "", "")):
+                label = ctk.CTkLabel(rows, text=text, font=("DM Sans", 12), anchor="w")
+                label.grid(row=i, column=col, sticky="w", padx=(0, 24), pady=1)
+                cells[host].append(label)
+
+        if not fleet.hosts:
+            ctk.CTkLabel(
+                rows,
+                text='No hosts yet. Add "ssh://user@host" or "tcp://host:2376" entries\n'
+                     'to "fleet_hosts" in ~/nova/.launcher_prefs.json.',
+                font=("DM Sans", 12),
+                justify="left"
+            ).grid(row=1, column=0, columnspan=4, sticky="w", pady=20)
+
+        state_colors = {"running": "#2E7D32", "initializing": "#FF9500", "unhealthy": "#D35454",
+                        "unreachable": "#D35454"}
+        busy = threading.Event()
+        closed = threading.Event()
+        results = {}
+
+        def render(result):
+            if not dialog.winfo_exists():
+                return
+            results[result["host"]] = result
+            _, state_cell, image_cell, latency_cell = cells[result["host"]]
+            state_cell.configure(text=result["state"].capitalize(),
+                                 text_color=state_colors.get(result["state"], "#666666"))
+            image_text = {True: "Update available", False: "Up to date"}.get(result["update"], "")
+            if result["update"] is None and result["digest"]:
+                image_text = result["digest"][7:19]
+            image_cell.configure(text=image_text)
+            latency = result["latency_ms"]
+            latency_cell.configure(text=f"{latency:.0f} ms" if latency is not None else "")
+
+        def summarize():
+            counts = {}
+            for result in results.values():
+                counts[result["state"]] = counts.get(result["state"], 0) + 1
+            parts = [f"{count} {state}" for state, count in sorted(counts.items())]
+            updates = sum(1 for r in results.values() if r["update"])
+            if updates:
+                parts.append(f"{updates} with updates")
+            return ", ".join(parts) or f"{len(fleet.hosts)} hosts"
+
+        def set_busy(is_busy, text=None):
+            if not dialog.winfo_exists():
+                return
+            for button in buttons:
+                button.configure(state="disabled" if is_busy else "normal")
+            lbl_summary.configure(text=text or summarize())
+
+        def run(coro_factory, text):
+            if busy.is_set() or not fleet.hosts:
+                return
+            busy.set()
+            set_busy(True, text)
+
+            def worker():
+                try:
+                    # One event loop drives every host; no thread per host
+                    asyncio.run(coro_factory())
+                except Exception as e:
+                    self._append_log(f"[error] Fleet: {e}")
+                finally:
+                    busy.clear()
+                    if closed.is_set():
+                        fleet.close()
+                    else:
+                        self.root.after(0, set_busy, False)
+
+            threading.Thread(target=worker, daemon=True).start()
+
+        def on_result(result):
+            if result["error"]:
+                self._append_log(f"[warn] Fleet {host_label(result['host'])}: {result['error']}")
+            self.root.after(0, render, result)
+
+        def refresh():
+            run(lambda: fleet.poll_all(on_result=on_result), "Checking hosts...")
+
+        def bulk(action):
+            def on_done(host, success, message):
+                level = "info" if success else "warn"
+                self._append_log(f"[{level}] Fleet {host_label(host)}: {message}")
+
+            async def bulk_then_poll():
+                await fleet.bulk(action, on_result=on_done)
+                await fleet.poll_all(check_updates=action == "update", on_result=on_result)
+
+            run(bulk_then_poll, f"{action.capitalize()} on {len(fleet.hosts)} hosts...")
+
+        def on_dialog_close():
+            closed.set()
+            if not busy.is_set():
+                threading.Thread(target=fleet.close, daemon=True).start()
+            dialog.destroy()
+
+        dialog.protocol("WM_DELETE_WINDOW", on_dialog_close)
+
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(pady=15)
+        buttons = [
+            self._create_primary_button(btn_frame, "Refresh", refresh, width=100),
+            self._create_ghost_button(btn_frame, "Start All", lambda: bulk("start"), width=100),
+            self._create_ghost_button(btn_frame, "Stop All", lambda: bulk("stop"), width=100),
+            self._create_ghost_button(btn_frame, "Update All", lambda: bulk("update"), width=100),
+        ]
+        for button in buttons:
+            button.pack(side=tk.LEFT, padx=5)
+
+        refresh()
+
+    # --- Offline Bundles ---
+
+    def _acquire_image(self, expected_digest=None):
+        """Import the image from an offline bundle if one is available, else pull it.
+
+        Args:
+            expected_digest: Registry digest the caller is after (e.g., a pending
+                update). A bundle is only used if it matches, or if None.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        found = find_bundle()
+        if found:
+            bundle_dir, manifest = found
+            bundle_digest = manifest.get("repo_digest")
+            wanted = expected_digest is None or bundle_digest == expected_digest
+            if wanted and (bundle_digest is None or bundle_digest != get_local_image_digest()):
+                self._append_log(f"Found offline bundle in {bundle_dir}, importing...")
+                success, msg = import_bundle(bundle_dir, progress=self._report_bundle_progress)
+                if success:
+                    self._append_log(f"[info] {msg}")
+                    return True, msg
+                self._append_log(f"[warn] Bundle import failed: {msg}. Falling back to network pull.")
+
+        return pull_image(callback=self._append_log, cancel_event=self.cancel_event)
+
+    def _report_bundle_progress(self, done, total, elapsed):
+        """Show bundle transfer throughput in the center label."""
+        text = format_throughput(done, elapsed)
+        if total:
+            text += f"  ({done * 100 // total}%)"
+        self.root.after(0, lambda: self.lbl_center_info.configure(text=f"Transferring bundle... {text}"))
+
+    def _show_bundles_dialog(self):
+        """Export or import an offline image bundle."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Offline Bundles")
+        dialog.geometry("420x220")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+
+        # Center the dialog
+        dialog.geometry(f"+{self.root.winfo_x() + 40}+{self.root.winfo_y() + 100}")
+
+        ctk.CTkLabel(
+            dialog,
+            text="Offline Image Bundles",
+            font=("DM Sans", 16, "bold")
+        ).pack(pady=(25, 5))
+
+        lbl_detected = ctk.CTkLabel(
+            dialog,
+            text="Looking for bundles...",
+            font=("DM Sans", 12),
+            text_color="#666666",
+            wraplength=360
+        )
+        lbl_detected.pack(pady=(0, 20))
+
+        def show_detected(found):
+            if not dialog.winfo_exists():
+                return
+            if found:
+                lbl_detected.configure(text=f"Bundle found: {found[0]}\nIt will be used instead of downloading.")
+            else:
+                lbl_detected.configure(text="No bundle found in ~/nova/bundles or on removable drives.")
+
+        def _detect_thread():
+            found = find_bundle()
+            self.root.after(0, lambda: show_detected(found))
+
+        threading.Thread(target=_detect_thread, daemon=True).start()
+
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(pady=10)
+
+        def on_export():
+            folder = filedialog.askdirectory(parent=dialog, title="Export bundle to folder")
+            if not folder:
+                return
+            dialog.destroy()
+            self.set_loading(True, "Exporting bundle...")
+
+            def _export_thread():
+                success, msg = export_bundle(folder, progress=self._report_bundle_progress)
+                self._append_log(f"[info] {msg}" if success else f"[error] Bundle export failed: {msg}")
+                if not success:
+                    self.root.after(0, lambda: self._show_error_dialog("Export Failed", msg))
+                self.root.after(0, lambda: self.set_loading(False))
+                self.root.after(200, self._refresh_state)
+
+            threading.Thread(target=_export_thread, daemon=True).start()
+
+        def on_import():
+            folder = filedialog.askdirectory(parent=dialog, title="Import bundle from folder")
+            if not folder:
+                return
+            dialog.destroy()
+            self.set_loading(True, "Importing bundle...")
+
+            def _import_thread():
+                success, msg = import_bundle(folder, progress=self._report_bundle_progress)
+                if success:
+                    self._append_log(f"[info] {msg}")
+                    success, msg = start_container()
+                if not success:
+                    self._append_log(f"[error] Bundle import failed: {msg}")
+                    self.root.after(0, lambda: self._show_error_dialog("Import Failed", msg))
+                self.root.after(0, lambda: self.set_loading(False))
+                self.root.after(200, self._refresh_state)
+
+            threading.Thread(target=_import_thread, daemon=True).start()
+
+        self._create_primary_button(btn_frame, "Export...", on_export, width=120).pack(side=tk.LEFT, padx=5)
+        self._create_ghost_button(btn_frame, "Import...", on_import, width=120).pack(side=tk.LEFT, padx=5)
+
+    # --- Disk Usage ---
+
+    def _show_disk_usage_dialog(self):
+        """Show instance directory and Docker disk usage."""
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Disk Usage")
+        dialog.geometry("460x400")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+
+        # Center the dialog
+        dialog.geometry(f"+{self.root.winfo_x() + 20}+{self.root.winfo_y() + 80}")
+
+        ctk.CTkLabel(
+            dialog,
+            text="Disk Usage",
+            font=("DM Sans", 16, "bold")
+        ).pack(pady=(20, 10))
+
+        lbl_report = ctk.CTkLabel(
+            dialog,
+            text="Scanning...",
+            font=("Courier New", 12),
+            justify="left",
+            anchor="nw"
+        )
+        lbl_report.pack(fill=tk.BOTH, expand=True, padx=25)
+
+        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        btn_frame.pack(pady=15)
+
+        def render(report):
+            if dialog.winfo_exists():
+                lbl_report.configure(text=report)
+
+        def start_scan(full_rescan=False):
+            lbl_report.configure(text="Scanning...")
+            threading.Thread(
+                target=lambda: self._build_disk_usage_report(
+                    full_rescan, lambda r: self.root.after(0, lambda: render(r))),
+                daemon=True
+            ).start()
+
+        self._create_primary_button(btn_frame, "Rescan", start_scan, width=110).pack(side=tk.LEFT, padx=5)
+        self._create_ghost_button(
+            btn_frame, "Full Rescan", lambda: start_scan(full_rescan=True), width=110
+        ).pack(side=tk.LEFT, padx=5)
+
+        start_scan()
+
+    def _build_disk_usage_report(self, full_rescan, on_done):
+        """Scan the instance directory and Docker usage (background thread)."""
+        if is_remote():
+            # The local ~/nova/instance is not the tracker's data
+            lines = [f"Instance data is on {remote_hostname()}", "  (not scanned from here)"]
+        else:
+            result = scan_directory(INSTANCE_DIR, full_rescan=full_rescan)
+            lines = [
+                f"Instance data   {format_bytes(result['total_bytes']):>10}",
+                f"  {result['file_count']} files in {result['dir_count']} folders",
+            ]
+            for name, size in result["children"][:6]:
+                lines.append(f"  {name[:24]:<24}{format_bytes(size):>10}")
+            lines.append(f"  scanned in {result['elapsed'] * 1000:.0f} ms "
+                         f"({result['rescanned']} folders re-read)")
+            self._append_log(f"[info] Disk scan: {format_bytes(result['total_bytes'])} "
+                             f"in {result['elapsed'] * 1000:.0f} ms, "
+                             f"{result['reused']} folders from cache")
+
+        rows, image_bytes = get_docker_disk_usage()
+        lines.append("")
+        if image_bytes is not None:
+            lines.append(f"Nova image      {format_bytes(image_bytes):>10}")
+        if rows is None:
+            lines.append("Docker usage unavailable")
+        else:
+            for row in rows:
+                lines.append(f"{row.get('Type', '')[:14]:<14}  {row.get('Size', ''):>10}  "
+                             f"(reclaimable {row.get('Reclaimable', '')})")
+        on_done("\n".join(lines))
+
+    def _restore_snapshot(self, snapshot_id: str):
+        """Stop the tracker, restore the snapshot and restart if it was running."""
+        self.set_loading(True, "Restoring snapshot...")
+
+        def _restore_thread():
+            was_running, _ = is_container_running()
+            if was_running:
+                self._append_log("Stopping tracker for restore...")
+                stop_container()
+
+            success, msg = restore_snapshot(snapshot_id)
+            if success:
+                self._append_log(f"[info] {msg}")
+            else:
+                self._append_log(f"[error] {msg}")
+                self.root.after(0, lambda m=msg: self._show_error_dialog("Restore Failed", m))
+
+            if was_running:
+                start_container()
+
+            self.root.after(0, lambda: self.set_loading(False))
+            self.root.after(200, self._refresh_state)
+
+        threading.Thread(target=_restore_thread, daemon=True).start()
+
     def _refresh_ui_after_update(self):
         """Refresh UI state after manual update without auto-starting container."""
-        self.check_state()
+        self._refresh_state()
 
     def update_ui(self, state):
-        self.root.after(0, lambda: self._apply_ui_state(state))
+        # Called off the Tk thread. The host is looked up here: resolving it
+        # may run `docker context inspect`
+        remote = None
+        if state == "docker_stopped" and is_remote():
+            remote = {"host": remote_hostname(), "error": docker_host_error()}
+        self.root.after(0, lambda: self._apply_ui_state(state, remote=remote))
+
+    def _show_cached_state(self, snapshot):
+        """Paint the previous session's state, marked stale until the first check."""
+        self._last_state.update(
+            state=snapshot["state"],
+            digest=snapshot.get("digest"),
+            version_label=snapshot.get("version_label") or "",
+        )
+        self._apply_ui_state(snapshot["state"], stale=True)
+        saved_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(snapshot.get("saved_at", 0)))
+        self.lbl_dot.configure(text_color=STATUS_STOPPED)
+        self.lbl_center_info.configure(text=f"Last known state ({saved_at}).\nChecking Docker...")
+        for button in (self.btn_main, self.btn_stop, self.btn_suspend):
+            button.configure(state="disabled")
+
+    def _remember_state(self, **changes):
+        """Persist the shown state when any of its fields change."""
+        if all(self._last_state.get(key) == value for key, value in changes.items()):
+            return
+        self._last_state.update(changes)
+        save_last_state(self._last_state)
 
-    def _apply_ui_state(self, state):
+    def _apply_ui_state(self, state, stale=False, remote=None):
+        """Show a launcher state (Tk thread).
+
+        Args:
+            state: State from probe_state
+            stale: Painted from the previous session, until the first check
+            remote: For "docker_stopped" on a remote host, dict of host and
+                error (see update_ui)
+        """
         if self.is_processing:
             return
+        if self._state_stale and not stale:
+            cached = self._last_state["state"]
+            if state != cached:
+                self._append_log(f"[info] State is now {state} (last known: {cached})")
+        self._state_stale = stale
+        self._ui_state = state
+        if not stale:
+            self._remember_state(state=state)
 
         self.btn_main.configure(state="normal")
         self.btn_stop.configure(state="normal")
+        self.btn_suspend.configure(state="normal")
+        if state not in ("running", "initializing"):
+            self.btn_suspend.pack_forget()
 
         if state == "docker_missing":
             self.set_status("Docker Missing", STATUS_ERROR,
@@ -764,6 +1882,18 @@ class NovaManagerApp:
             self._style_button_primary(self.btn_main)
             self.btn_stop.pack_forget()
             self.lbl_version.configure(text="")
+            self.lbl_usage.configure(text="")
+
+        elif state == "docker_stopped" and remote:
+            reason = remote["error"]
+            self.set_status("Docker Host Unreachable", "#FF9500",
+                            f"Cannot reach Docker on {remote['host']}."
+                            + (f"\n{reason}" if reason else ""))
+            self.btn_main.configure(text="Retry", command=self._retry_docker_host)
+            self._style_button_primary(self.btn_main)
+            self.btn_stop.pack_forget()
+            self.lbl_version.configure(text="")
+            self.lbl_usage.configure(text="")
 
         elif state == "docker_stopped":
             self.set_status("Docker Not Running", "#FF9500",
@@ -772,6 +1902,7 @@ class NovaManagerApp:
             self._style_button_primary(self.btn_main)
             self.btn_stop.pack_forget()
             self.lbl_version.configure(text="")
+            self.lbl_usage.configure(text="")
 
         elif state == "not_installed":
             self.set_status("Not Installed", STATUS_STOPPED,
@@ -780,6 +1911,7 @@ class NovaManagerApp:
             self._style_button_primary(self.btn_main)
             self.btn_stop.pack_forget()
             self.lbl_version.configure(text="")
+            self.lbl_usage.configure(text="")
 
         elif state == "stopped":
             self.set_status("Service Stopped", "#FF9500",
@@ -791,14 +1923,15 @@ class NovaManagerApp:
 
         elif state == "initializing":
             if self.just_installed:
-                msg = "First-time setup: Web UI may take ~2 mins to initialize.\nSubsequent runs will be real-time."
-                self.set_status("Initializing...", "#FF9500", msg)
+                fallback = "First-time setup: Web UI may take ~2 mins to initialize.\nSubsequent runs will be real-time."
             else:
-                self.set_status("Initializing...", "#FF9500", "Starting up... (this may take a minute)")
+                fallback = "Starting up... (this may take a minute)"
+            self.set_status("Initializing...", "#FF9500", self._initializing_message(fallback))
             self.btn_main.configure(text="Open Dashboard", command=self.open_dashboard)
             self._style_button_primary(self.btn_main)
             self.btn_stop.pack(side=tk.LEFT, padx=10)
-            self._update_version_label()
+            self.btn_suspend.pack(side=tk.LEFT, padx=(0, 10))
+            self._update_version_label(show_usage=True)
 
         elif state == "running":
             self.just_installed = False
@@ -807,8 +1940,39 @@ class NovaManagerApp:
             self.btn_main.configure(text="Open Dashboard", command=self.open_dashboard)
             self._style_button_primary(self.btn_main)
             self.btn_stop.pack(side=tk.LEFT, padx=10)
+            self.btn_suspend.pack(side=tk.LEFT, padx=(0, 10))
+            self._update_version_label(show_usage=True)
+            if self._status_note:
+                self.lbl_center_info.configure(text=self._status_note)
+
+        elif state == "unhealthy":
+            self.set_status("Tracker Not Responding", STATUS_ERROR,
+                            self._container_issue or
+                            "The dashboard stopped answering inside the container.\n"
+                            "Stop and start the tracker, or check the log for errors.")
+            self.btn_main.configure(text="Open Dashboard", command=self.open_dashboard)
+            self._style_button_primary(self.btn_main)
+            self.btn_stop.pack(side=tk.LEFT, padx=10)
+            self._update_version_label(show_usage=True)
+
+        elif state == "paused":
+            self.set_status("Suspended", STATUS_STOPPED,
+                            "Tracker is suspended. Memory stays in use; resume is instant.")
+            self.btn_main.configure(text="Resume", command=self.resume_nova)
+            self._style_button_primary(self.btn_main)
+            self.btn_stop.pack(side=tk.LEFT, padx=10)
             self._update_version_label()
 
+    def _flash_note(self, text, seconds=8):
+        """Show a short note in the center label of the running view."""
+        self._status_note = text
+        self.lbl_center_info.configure(text=text)
+
+        def clear():
+            if self._status_note == text:
+                self._status_note = ""
+        self.root.after(seconds * 1000, clear)
+
     def _style_button_primary(self, btn):
         """Apply primary button styling."""
         btn.configure(
@@ -818,17 +1982,55 @@ class NovaManagerApp:
             border_width=0
         )
 
-    def _update_version_label(self):
-        """Show the running image digest in the version label."""
+    def _update_version_label(self, show_usage=False):
+        """Show the running image digest in the version label.
+
+        Args:
+            show_usage: Also sample CPU/memory usage against the container limits
+        """
+        if self._state_stale:
+            # Cached label until the first check; don't query Docker yet
+            self.lbl_version.configure(text=self._last_state["version_label"])
+            self.lbl_usage.configure(text="")
+            return
+
         def _fetch():
             digest = get_container_image_digest()
-            if digest:
-                self.root.after(0, lambda: self.lbl_version.configure(
-                    text=f"Image: {DOCKER_IMAGE}:{DOCKER_TAG}  •  {digest}"))
-            else:
-                self.root.after(0, lambda: self.lbl_version.configure(text=""))
+            text = f"Image: {DOCKER_IMAGE}:{DOCKER_TAG}  •  {digest}" if digest else ""
+            self.root.after(0, lambda: self._show_version_label(digest, text))
         threading.Thread(target=_fetch, daemon=True).start()
 
+        if not show_usage:
+            self.lbl_usage.configure(text="")
+            self._usage_sampled_at = 0.0
+        elif (not self._usage_fetch_running and self.root.winfo_viewable()
+              and time.monotonic() - self._usage_sampled_at >= USAGE_SAMPLE_INTERVAL):
+            # Each sample keeps `docker stats` busy for ~2s; skip it while minimized
+            self._usage_fetch_running = True
+            self._usage_sampled_at = time.monotonic()
+            threading.Thread(target=self._fetch_usage, daemon=True).start()
+
+    def _show_version_label(self, digest, text):
+        self.lbl_version.configure(text=text)
+        if not self._state_stale:
+            self._remember_state(digest=digest, version_label=text)
+
+    def _fetch_usage(self):
+        """Sample container usage (docker stats takes ~2s) and show it against the limits."""
+        try:
+            usage = get_container_usage()
+            if not usage:
+                self.root.after(0, lambda: self.lbl_usage.configure(text=""))
+                return
+            cpus = get_resource_limits().get("cpus")
+            cpu_text = f"CPU {usage.get('CPUPerc', '?')}"
+            if cpus:
+                cpu_text += f" (limit {cpus} cores)"
+            text = f"{cpu_text}  •  Mem {usage.get('MemUsage', '?')}  •  PIDs {usage.get('PIDs', '?')}"
+            self.root.after(0, lambda: self.lbl_usage.configure(text=text))
+        finally:
+            self._usage_fetch_running = False
+
     def set_status(self, header, dot_color, center):
         self.lbl_status_header.configure(text=header)
         self.lbl_dot.configure(text_color=dot_color)
@@ -841,70 +2043,99 @@ class NovaManagerApp:
 
     def install_nova(self):
         self.just_installed = True
-        self.set_loading(True, "Initializing installation...")
+        self.set_loading(True, "Initializing installation...", cancellable=True)
+        threading.Thread(target=self._perform_install_sequence).start()
+
+    def _perform_install_sequence(self):
+        trace = self._begin_trace("install")
 
         try:
             os.makedirs(NOVA_DIR, exist_ok=True)
         except Exception as e:
             self._append_log(f"[error] Cannot create directory {NOVA_DIR}: {e}")
-            self._show_error_dialog("Installation Error",
-                                    f"Cannot create install directory:\n{NOVA_DIR}\n\n{e}")
-            self.set_loading(False)
+            self.root.after(0, lambda err=e: self._show_error_dialog(
+                "Installation Error", f"Cannot create install directory:\n{NOVA_DIR}\n\n{err}"))
+            self._fail_trace(trace)
+            self.root.after(0, lambda: self.set_loading(False))
             return
 
-        # Create compose file
-        if not create_compose_file():
+        # Create compose file (queries docker info for the resource limits)
+        trace.begin("compose_write")
+        success, _ = sync_compose_file()
+        if not success:
             self._append_log(f"[error] Failed to create docker-compose.yml")
-            self._show_error_dialog("Installation Error",
-                                    f"Failed to create docker-compose.yml in:\n{NOVA_DIR}")
-            self.set_loading(False)
+            self.root.after(0, lambda: self._show_error_dialog(
+                "Installation Error", f"Failed to create docker-compose.yml in:\n{NOVA_DIR}"))
+            self._fail_trace(trace)
+            self.root.after(0, lambda: self.set_loading(False))
             return
 
         self._append_log(f"Created docker-compose.yml at {COMPOSE_FILE}")
 
-        threading.Thread(target=self._perform_install_sequence).start()
-
-    def _perform_install_sequence(self):
-        self.root.after(0, lambda: self.lbl_center_info.configure(text="Downloading images... (this may take 2-3 mins)"))
+        pull_hint = self._eta_text("install", "pull", "this may take 2-3 mins")
+        self.root.after(0, lambda: self.lbl_center_info.configure(text=f"Downloading images... ({pull_hint})"))
 
-        # Pull image
-        success, msg = pull_image()
+        # Pull image (or import it from an offline bundle)
+        trace.begin("pull")
+        success, msg = self._acquire_image()
         if not success:
-            self.root.after(0, lambda: self._show_error_dialog("Pull Failed", f"Failed to pull Docker image.\n\n{msg}"))
+            self._fail_trace(trace)
+            if self.cancel_event.is_set():
+                self._append_log("[info] Installation cancelled")
+            else:
+                self.root.after(0, lambda: self._show_error_dialog("Pull Failed", f"Failed to pull Docker image.\n\n{msg}"))
             self.root.after(0, lambda: self.set_loading(False))
+            self.root.after(200, self._refresh_state)
             return
 
-        msg = "First-time setup: Web UI may take ~2 mins to initialize.\nSubsequent runs will be real-time."
+        msg = (self._initializing_text()
+               or "First-time setup: Web UI may take ~2 mins to initialize.\nSubsequent runs will be real-time.")
         self.root.after(0, lambda: self.lbl_center_info.configure(text=msg))
 
         # Start container
-        success, msg = start_container()
+        success, msg = start_container(callback=trace.begin, cancel_event=self.cancel_event)
         if not success:
-            self.root.after(0, lambda: self._show_error_dialog("Start Failed", f"Failed to start container.\n\n{msg}"))
+            self._fail_trace(trace)
+            if self.cancel_event.is_set():
+                self._append_log("[info] Installation cancelled")
+            else:
+                self.root.after(0, lambda: self._show_error_dialog("Start Failed", f"Failed to start container.\n\n{msg}"))
             self.root.after(0, lambda: self.set_loading(False))
+            self.root.after(200, self._refresh_state)
             return
 
         self.root.after(0, lambda: self.set_loading(False))
-        self.root.after(200, self.check_state)
+        self.root.after(200, self._refresh_state)
+        self._finish_trace_when_ready(trace)
 
     def start_nova(self):
-        # Port conflict check
+        self.set_loading(True, "Starting service...", cancellable=True)
+        threading.Thread(target=self._run_docker_start).start()
+
+    def _run_docker_start(self):
+        # Port conflict check (may shell out to Docker, so not on the Tk thread)
         if not self.check_port_available():
-            self._show_error_dialog("Port Conflict",
-                                    f"Port {PORT} is already in use by another application.\n\n"
-                                    f"Please free port {PORT} and try again.")
             self._append_log(f"[warn] Port {PORT} is in use by another process")
+            self.root.after(0, lambda: self.set_loading(False))
+            self.root.after(0, lambda: self._show_error_dialog(
+                "Port Conflict",
+                f"Port {PORT} is already in use by another application.\n\n"
+                f"Please free port {PORT} and try again."))
             return
-        self.set_loading(True, "Starting service...")
-        threading.Thread(target=self._run_docker_start).start()
 
-    def _run_docker_start(self):
-        success, msg = start_container()
+        trace = self._begin_trace("start")
+        success, msg = start_container(callback=trace.begin, cancel_event=self.cancel_event)
         if not success:
-            self._append_log(f"[warn] Failed to start: {msg}")
+            if self.cancel_event.is_set():
+                self._append_log("[info] Start cancelled")
+            else:
+                self._append_log(f"[warn] Failed to start: {msg}")
+            self._fail_trace(trace)
         time.sleep(2)
         self.root.after(0, lambda: self.set_loading(False))
         self.check_state()
+        if success:
+            self._finish_trace_when_ready(trace)
 
     def stop_nova(self):
         self.set_loading(True, "Stopping service...")
@@ -918,8 +2149,45 @@ class NovaManagerApp:
         self.root.after(0, lambda: self.set_loading(False))
         self.check_state()
 
+    def suspend_nova(self):
+        self.set_loading(True, "Suspending...")
+        threading.Thread(target=self._run_docker_pause, daemon=True).start()
+
+    def _run_docker_pause(self):
+        success, msg = pause_container()
+        if success:
+            self._append_log("[info] Tracker suspended")
+        else:
+            self._append_log(f"[warn] Failed to suspend: {msg}")
+        self.root.after(0, lambda: self.set_loading(False))
+        self.check_state()
+
+    def resume_nova(self):
+        self.set_loading(True, "Resuming...")
+        threading.Thread(target=self._run_docker_unpause, daemon=True).start()
+
+    def _run_docker_unpause(self):
+        started = time.monotonic()
+        success, msg = unpause_container()
+        if success:
+            # Probe tightly here: the point is to measure resume-to-ready
+            ready = wait_for_web_ready(dashboard_url(), timeout=60, interval=0.05,
+                                       stop_event=self.stop_event)
+            elapsed_ms = (time.monotonic() - started) * 1000
+            if ready:
+                note = f"Resumed and ready in {elapsed_ms:.0f} ms"
+                self._append_log(f"[info] {note}")
+                self.root.after(0, lambda: self._flash_note(note))
+            else:
+                self._append_log("[warn] Resumed, but the dashboard is not answering yet")
+        else:
+            self._append_log(f"[warn] Failed to resume: {msg}")
+        self.root.after(0, lambda: self.set_loading(False))
+        self.check_state()
+
     def open_dashboard(self):
-        open_dashboard_url()
+        # Resolving the dashboard URL may wait on the Docker host lookup
+        threading.Thread(target=open_dashboard_url, daemon=True).start()
 
     def open_docker(self):
         webbrowser.open(DOCKER_DOWNLOAD_URL)
@@ -994,7 +2262,7 @@ class NovaManagerApp:
                 self.root.after(0, lambda: self._show_error_dialog("Timeout",
                     "Docker did not start within 60 seconds.\n\nPlease start Docker manually and try again."))
 
-            self.root.after(200, self.check_state)
+            self.root.after(200, self._refresh_state)
 
         threading.Thread(target=_launch_thread).start()
 
@@ -1022,6 +2290,7 @@ class NovaManagerApp:
                 # Update available - show update dialog
                 self._append_log(f"[info] Update available on Docker Hub")
                 self.pending_update_digest = remote_digest
+                staged = remote_digest in get_local_image_digests(DOCKER_IMAGE_STAGED)
                 # Reset loading state BEFORE showing dialog so is_processing=False
                 # when the dialog's guard check runs (fixes macOS bug where dialog
                 # silently returned due to is_processing=True)
@@ -1029,7 +2298,8 @@ class NovaManagerApp:
                 # Use default argument to capture value, not reference
                 self.root.after(0, lambda d=remote_digest: self._prompt_update_dialog(
                     d,
-                    on_update_callback=self._perform_manual_update
+                    on_update_callback=self._perform_manual_update,
+                    staged=staged
                 ))
 
             else:
@@ -1067,19 +2337,58 @@ class NovaManagerApp:
                 html_url = data.get("html_url", "")
 
                 if latest_tag and version_newer(latest_tag, APP_VERSION):
-                    self.root.after(0, lambda: self._show_update_banner(latest_tag, html_url))
+                    if self._download_launcher_update(data):
+                        self.root.after(0, lambda: self._show_update_banner(latest_tag, html_url, staged=True))
+                    else:
+                        self.root.after(0, lambda: self._show_update_banner(latest_tag, html_url))
         except Exception:
             pass  # Silently fail - this is a nice-to-have
 
-    def _show_update_banner(self, version, url):
+    def _download_launcher_update(self, release):
+        """Stage a newer launcher in the background.
+
+        Args:
+            release: Release JSON from the GitHub API
+
+        Returns:
+            True if the update is staged and will be installed on next start
+        """
+        prefs = load_launcher_prefs()
+        if not is_frozen() or not prefs.get("launcher_auto_update", True):
+            return False
+
+        version = release.get("tag_name", "").lstrip("v")
+        staged = get_staged_update()
+        if staged is None or staged.get("version") != version:
+            self._append_log(f"[info] Downloading launcher v{version} in the background")
+        kbps = prefs.get("launcher_download_kbps")
+        rate = LAUNCHER_DOWNLOAD_RATE if kbps is None else max(int(kbps), 0) * 1024
+        try:
+            success, msg = stage_update(release, rate=rate, cancel_event=self.stop_event)
+        except OSError as e:
+            success, msg = False, str(e)
+        if success:
+            self._append_log(f"[info] {msg}; it will be installed the next time the launcher starts")
+        elif not self.stop_event.is_set():
+            self._append_log(f"[warn] Launcher update not staged: {msg}")
+        return success
+
+    def _show_update_banner(self, version, url, staged=False):
         """Show a non-intrusive banner when a new launcher version is available."""
-        self.lbl_update_banner.configure(
-            text=f"Launcher v{version} available — click to download")
+        if staged:
+            text = f"Launcher v{version} installs on next start — click for release notes"
+        else:
+            text = f"Launcher v{version} available — click to download"
+        self.lbl_update_banner.configure(text=text)
         self.lbl_update_banner.bind("<Button-1>", lambda e: webbrowser.open(url))
         self.update_banner.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
 
 
 if __name__ == "__main__":
+    # A launcher update downloaded last session replaces this one and starts instead
+    if apply_staged_update():
+        sys.exit(0)
+
     root = ctk.CTk()
     app = NovaManagerApp(root)
     try:
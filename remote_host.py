@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""
+Remote Docker host support.
+
+The launcher can manage a tracker on another machine (e.g., a headless PC at
+the telescope) through the "docker_host" pref ("ssh://user@host" or
+"tcp://host:2376"), the "docker_context" pref, or the DOCKER_HOST /
+DOCKER_CONTEXT environment and current docker context.
+
+For ssh:// hosts, one long-lived `ssh -N` process forwards a local socket to
+the remote daemon socket, and every docker command talks to that socket.
+State checks reuse the single authenticated connection instead of each
+`docker` call paying for its own SSH handshake. tcp:// hosts are passed
+through to the CLI. The dashboard URL resolves to the remote host name.
+"""
+
+import atexit
+import collections
+import hashlib
+import os
+import shlex
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from typing import Dict, List, Optional
+
+from config import (
+    DOCKER_INFO_TIMEOUT,
+    NOVA_DIR,
+    PORT,
+    SSH_TUNNEL_RETRY_INTERVAL,
+    SSH_TUNNEL_START_TIMEOUT,
+)
+
+DEFAULT_REMOTE_SOCKET = "/var/run/docker.sock"
+
+_lock = threading.Lock()          # Guards the endpoint settings
+_tunnel_lock = threading.Lock()   # Guards swapping _tunnel; never held while connecting
+_settings: Dict[str, Optional[str]] = {"docker_host": None, "docker_context": None}
+_endpoint: Optional[Dict[str, Optional[str]]] = None
+_tunnel: Optional["SSHTunnel"] = None
+
+
+def _subprocess_flags() -> int:
+    """Return CREATE_NO_WINDOW flag on Windows to prevent console flashing."""
+    if sys.platform == "win32":
+        return subprocess.CREATE_NO_WINDOW
+    return 0
+
+
+class SSHTunnel:
+    """A persistent `ssh -N` process forwarding a local endpoint to a remote Docker socket."""
+
+    def __init__(self, url: str):
+        """
+        Args:
+            url: ssh://[user@]host[:port][/path/to/docker.sock]
+        """
+        parsed = urllib.parse.urlparse(url)
+        self.url = url
+        self.target = f"{parsed.username}@{parsed.hostname}" if parsed.username else parsed.hostname
+        self.ssh_port = parsed.port
+        self.remote_socket = parsed.path if parsed.path not in ("", "/") else DEFAULT_REMOTE_SOCKET
+        self.last_error: Optional[str] = None
+        self._proc: Optional[subprocess.Popen] = None
+        self._ready = False
+        self._closed = False
+        self._lock = threading.Lock()          # Guards _proc against stop() from another thread
+        self._connect_lock = threading.Lock()  # Held by the one thread waiting for ssh to connect
+        self._stderr_tail: collections.deque = collections.deque(maxlen=20)
+        self._stderr_reader: Optional[threading.Thread] = None
+        self._deadline = 0.0
+        self._failed_at = 0.0
+
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:10]
+        self._local_port = 0
+        if os.name == "nt":
+            # Windows OpenSSH has no connection sharing; forward to a loopback port
+            self._socket_path = None
+            self._control_path = None
+        else:
+            # Unix socket paths are limited to ~100 bytes; keep them short
+            self._socket_path = os.path.join(NOVA_DIR, f".docker-{key}.sock")
+            self._control_path = os.path.join(NOVA_DIR, f".ssh-{key}.ctl")
+
+    @property
+    def docker_host(self) -> str:
+        """DOCKER_HOST value for the local end of the tunnel."""
+        if self._socket_path:
+            return f"unix://{self._socket_path}"
+        return f"tcp://127.0.0.1:{self._local_port}"
+
+    def is_alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _listening(self) -> bool:
+        try:
+            if self._socket_path:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+                    s.settimeout(1)
+                    s.connect(self._socket_path)
+            else:
+                with socket.create_connection(("127.0.0.1", self._local_port), timeout=1):
+                    pass
+            return True
+        except OSError:
+            return False
+
+    def start(self) -> bool:
+        """
+        Launch ssh unless it is already running. Failed connections are
+        retried at most every SSH_TUNNEL_RETRY_INTERVAL seconds.
+
+        Returns:
+            False while backing off or if ssh cannot be run
+        """
+        if self.is_alive():
+            return True
+        if time.monotonic() - self._failed_at < SSH_TUNNEL_RETRY_INTERVAL:
+            return False
+
+        if self._socket_path:
+            try:
+                os.makedirs(NOVA_DIR, exist_ok=True)
+                for path in (self._socket_path, self._control_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+            except OSError:
+                pass
+            local = self._socket_path
+        else:
+            # Reserve a free loopback port for the forward
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.bind(("127.0.0.1", 0))
+                self._local_port = s.getsockname()[1]
+            local = f"127.0.0.1:{self._local_port}"
+
+        args = [
+            "ssh", "-N", "-T",
+            # Never prompt; keys or an agent are required for background use
+            "-o", "BatchMode=yes",
+            "-o", "ExitOnForwardFailure=yes",
+            "-o", "ServerAliveInterval=15",
+            "-o", "ServerAliveCountMax=3",
+            "-o", "StreamLocalBindUnlink=yes",
+            "-L", f"{local}:{self.remote_socket}",
+        ]
+        if self._control_path:
+            # Lets ssh_command() run remote commands over the same connection
+            args += ["-o", "ControlMaster=yes", "-o", f"ControlPath={self._control_path}"]
+        if self.ssh_port:
+            args += ["-p", str(self.ssh_port)]
+        args.append(self.target)
+
+        with self._lock:
+            if self._closed:
+                return False
+            try:
+                proc = subprocess.Popen(
+                    args,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    creationflags=_subprocess_flags(),
+                )
+            except (FileNotFoundError, OSError) as e:
+                self._fail(f"Cannot run ssh: {e}")
+                return False
+            self._proc = proc
+        # ssh keeps writing warnings for as long as it runs; an unread pipe
+        # would eventually fill up and stall it
+        self._stderr_tail = collections.deque(maxlen=20)
+        self._stderr_reader = threading.Thread(
+            target=self._read_stderr, args=(proc, self._stderr_tail), daemon=True)
+        self._stderr_reader.start()
+        self._ready = False
+        self._deadline = time.monotonic() + SSH_TUNNEL_START_TIMEOUT
+        return True
+
+    @staticmethod
+    def _read_stderr(proc: subprocess.Popen, tail: collections.deque) -> None:
+        """Drain ssh's stderr, keeping the last lines for error messages."""
+        try:
+            for line in proc.stderr:
+                line = line.strip()
+                if line:
+                    tail.append(line)
+        except (OSError, ValueError):
+            pass
+
+    def poll(self) -> Optional[bool]:
+        """
+        Check on a starting tunnel without blocking.
+
+        Returns:
+            True once the tunnel is up, False if it failed (see last_error),
+            None while ssh is still connecting
+        """
+        proc = self._proc
+        if proc is None:
+            return False
+        if proc.poll() is not None:
+            reader = self._stderr_reader
+            if reader is not None:
+                reader.join(timeout=1)
+            tail = self._stderr_tail
+            self._fail(tail[-1] if tail else f"ssh exited with code {proc.returncode}")
+            return False
+        if self._ready:
+            return True
+        # ssh only listens on the local end once it has authenticated
+        if self._listening():
+            self._ready = True
+            self.last_error = None
+            return True
+        if time.monotonic() > self._deadline:
+            proc.terminate()
+            self._fail(f"Timed out connecting to {self.target}")
+            return False
+        return None
+
+    def ensure(self) -> bool:
+        """
+        Start the tunnel if needed and wait until it is up.
+
+        Only one thread waits for ssh to connect; other callers get False
+        right away instead of queueing behind it.
+
+        Returns:
+            True if the tunnel is up
+        """
+        if self._ready and self.is_alive():
+            return True
+        if not self._connect_lock.acquire(blocking=False):
+            return False
+        try:
+            if not self.start():
+                return False
+            while True:
+                ready = self.poll()
+                if ready is not None:
+                    return ready
+                time.sleep(0.1)
+        finally:
+            self._connect_lock.release()
+
+    def _fail(self, error: str) -> None:
+        self.last_error = error
+        self._proc = None
+        self._ready = False
+        self._failed_at = time.monotonic()
+
+    def reset_backoff(self) -> None:
+        """Allow the next start() to reconnect immediately."""
+        self._failed_at = 0.0
+
+    def ssh_command(self, remote_args: List[str]) -> List[str]:
+        """
+        Build an ssh command line that runs a command on the remote host,
+        reusing the tunnel's connection where the platform supports it.
+
+        Args:
+            remote_args: Command and arguments to run remotely
+
+        Returns:
+            Argument list for subprocess
+        """
+        args = ["ssh", "-T", "-o", "BatchMode=yes"]
+        if self._control_path and self._ready and self.is_alive():
+            args += ["-o", f"ControlPath={self._control_path}"]
+        if self.ssh_port:
+            args += ["-p", str(self.ssh_port)]
+        return args + [self.target, " ".join(shlex.quote(a) for a in remote_args)]
+
+    def stop(self) -> None:
+        """Close the tunnel for good; a later start() does nothing."""
+        with self._lock:
+            self._closed = True
+            proc = self._proc
+            self._proc = None
+        self._ready = False
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        for path in (self._socket_path, self._control_path):
+            if path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+def configure(docker_host: Optional[str] = None, docker_context: Optional[str] = None) -> None:
+    """
+    Select the Docker host to manage (from the launcher prefs).
+
+    Args:
+        docker_host: "ssh://..." or "tcp://..." URL; takes precedence
+        docker_context: Name of a docker context
+    """
+    global _endpoint
+    settings = {"docker_host": docker_host or None, "docker_context": docker_context or None}
+    with _lock:
+        if _settings == settings:
+            return
+        _settings.update(settings)
+        _endpoint = None
+    _close_tunnel()
+
+
+def _context_host(name: Optional[str]) -> Optional[str]:
+    """Endpoint URL of a docker context (the current one if name is None)."""
+    args = ["docker", "context", "inspect"]
+    if name:
+        args.append(name)
+    args += ["--format", "{{.Endpoints.docker.Host}}"]
+    try:
+        result = subprocess.run(args, capture_output=True, text=True, timeout=DOCKER_INFO_TIMEOUT,
+                                creationflags=_subprocess_flags())
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _resolve() -> Dict[str, Optional[str]]:
+    """Work out which daemon to use. Called with _lock held."""
+    context = _settings["docker_context"]
+    url = _settings["docker_host"]
+    if not url and not context:
+        url = os.environ.get("DOCKER_HOST")
+        if not url:
+            context = os.environ.get("DOCKER_CONTEXT")
+            # The current context may point at a remote host as well
+            url = _context_host(context)
+    elif not url:
+        url = _context_host(context)
+
+    scheme = urllib.parse.urlparse(url).scheme if url else ""
+    if scheme not in ("ssh", "tcp"):
+        return {"scheme": "local", "url": None, "context": None, "host": None}
+    return {
+        "scheme": scheme,
+        "url": url,
+        # A tcp:// context may carry TLS settings, so keep selecting it by name
+        "context": context if scheme == "tcp" and not _settings["docker_host"] else None,
+        "host": urllib.parse.urlparse(url).hostname,
+    }
+
+
+def _get_endpoint() -> Dict[str, Optional[str]]:
+    global _endpoint
+    with _lock:
+        if _endpoint is None:
+            _endpoint = _resolve()
+        return _endpoint
+
+
+def _close_tunnel() -> None:
+    global _tunnel
+    with _tunnel_lock:
+        tunnel, _tunnel = _tunnel, None
+    if tunnel is not None:
+        tunnel.stop()
+
+
+def is_remote() -> bool:
+    """True if the managed daemon is on another machine."""
+    return _get_endpoint()["scheme"] != "local"
+
+
+def remote_hostname() -> Optional[str]:
+    """Host name of the remote daemon, or None when it is local."""
+    return _get_endpoint()["host"]
+
+
+def describe_host() -> str:
+    """Short label for the managed host (for the log and status text)."""
+    endpoint = _get_endpoint()
+    return endpoint["url"] if endpoint["scheme"] != "local" else "local Docker"
+
+
+def dashboard_url(port: int = PORT) -> str:
+    """
+    URL of a tracker port on the managed host.
+
+    Args:
+        port: Published container port
+
+    Returns:
+        http://localhost:<port> locally, else http://<remote host>:<port>
+    """
+    host = remote_hostname() or "localhost"
+    if ":" in host:
+        host = f"[{host}]"
+    return f"http://{host}:{port}"
+
+
+def remote_data_notice() -> Optional[str]:
+    """
+    Explain why local instance-data features don't apply, if they don't.
+
+    The compose file's ./instance bind mount is resolved by the daemon, so
+    with a remote host the tracker's data lives on that machine and the
+    local ~/nova/instance is not what it uses.
+
+    Returns:
+        A message for the user when the host is remote, else None
+    """
+    if not is_remote():
+        return None
+    return (f"The tracker's data is stored on {remote_hostname()}, not on this computer. "
+            "Snapshots, restore and the instance disk usage only work for a local Docker host.")
+
+
+def retry() -> None:
+    """Let the next docker command reopen a failed tunnel right away."""
+    tunnel = _tunnel
+    if tunnel is not None:
+        tunnel.reset_backoff()
+
+
+def last_error() -> Optional[str]:
+    """Why the SSH tunnel could not be opened, if it failed."""
+    tunnel = _tunnel
+    return tunnel.last_error if tunnel is not None else None
+
+
+def apply_to_env(env: dict) -> dict:
+    """
+    Point a docker subprocess environment at the managed host.
+
+    Opens the SSH tunnel on first use (blocking up to
+    SSH_TUNNEL_START_TIMEOUT); if it cannot be opened, or another thread is
+    still opening it, the ssh:// URL is used directly, which works but pays
+    for a handshake per command.
+
+    Args:
+        env: Environment to modify in place
+
+    Returns:
+        The same environment
+    """
+    global _tunnel
+    endpoint = _get_endpoint()
+    if endpoint["scheme"] == "local":
+        return env
+
+    if endpoint["scheme"] == "tcp":
+        if endpoint["context"]:
+            env.pop("DOCKER_HOST", None)
+            env["DOCKER_CONTEXT"] = endpoint["context"]
+        else:
+            env.pop("DOCKER_CONTEXT", None)
+            env["DOCKER_HOST"] = endpoint["url"]
+        return env
+
+    env.pop("DOCKER_CONTEXT", None)
+    stale = None
+    with _tunnel_lock:
+        if _tunnel is None or _tunnel.url != endpoint["url"]:
+            stale, _tunnel = _tunnel, SSHTunnel(endpoint["url"])
+        tunnel = _tunnel
+    if stale is not None:
+        stale.stop()
+    # Connect outside the lock so callers don't queue behind a reconnect
+    ready = tunnel.ensure()
+    if ready:
+        env["DOCKER_HOST"] = tunnel.docker_host
+    else:
+        # The CLI's own ssh transport takes no socket path
+        env["DOCKER_HOST"] = urllib.parse.urlparse(endpoint["url"])._replace(path="").geturl()
+    return env
+
+
+def shutdown() -> None:
+    """Close the SSH tunnel (called on exit)."""
+    _close_tunnel()
+
+
+atexit.register(shutdown)
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+"""
+Background self-update for the packaged launcher.
+
+When a newer GitHub release exists, the asset for this platform is downloaded
+into LAUNCHER_UPDATE_DIR with HTTP Range requests, so an interrupted transfer
+over a slow link resumes where it stopped. The download is rate-limited so it
+does not compete with tracker traffic. The finished file is checked against
+the SHA-256 published with the release (the SHA256SUMS asset, or the digest
+GitHub reports for the asset) before it is staged.
+
+The staged launcher replaces the running one on the next start:
+apply_staged_update() renames the current executable (or .app bundle on
+macOS) aside, moves the staged one into place and launches it. Only frozen
+(PyInstaller) builds update themselves.
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import shutil
+import ssl
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import certifi
+
+from config import (
+    APP_VERSION,
+    HASH_CHUNK_SIZE,
+    LAUNCHER_ASSETS,
+    LAUNCHER_CHECKSUMS_ASSET,
+    LAUNCHER_DOWNLOAD_CHUNK,
+    LAUNCHER_DOWNLOAD_RATE,
+    LAUNCHER_DOWNLOAD_RETRIES,
+    LAUNCHER_DOWNLOAD_TIMEOUT,
+    LAUNCHER_UPDATE_DIR,
+)
+from utils import version_newer
+
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+STAGED_MANIFEST = "staged.json"
+STAGED_DIR = "staged"
+OLD_SUFFIX = ".old"
+
+
+def is_frozen() -> bool:
+    """True when running as a PyInstaller build (the only kind that can replace itself)."""
+    return bool(getattr(sys, "frozen", False))
+
+
+def current_install_path() -> str:
+    """
+    Path replaced by an update.
+
+    Returns:
+        The .app bundle on macOS, otherwise the executable
+    """
+    path = os.path.abspath(sys.executable)
+    if sys.platform == "darwin":
+        # .../Nova DSO Tracker.app/Contents/MacOS/Nova DSO Tracker
+        bundle = os.path.dirname(os.path.dirname(os.path.dirname(path)))
+        if bundle.endswith(".app"):
+            return bundle
+    return path
+
+
+def _remove_path(path: str) -> None:
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def file_sha256(path: str) -> str:
+    """Hex SHA-256 of a file, read in HASH_CHUNK_SIZE blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _open(url: str, headers: Optional[Dict[str, str]] = None):
+    req = urllib.request.Request(url, headers={"User-Agent": "NovaLauncher", **(headers or {})})
+    return urllib.request.urlopen(req, timeout=LAUNCHER_DOWNLOAD_TIMEOUT, context=_SSL_CONTEXT)
+
+
+def release_asset_name(name: str) -> str:
+    """
+    Name GitHub gives an uploaded file.
+
+    GitHub replaces spaces and other unusual characters in asset names with
+    dots ("Nova DSO Tracker.exe" is published as "Nova.DSO.Tracker.exe"),
+    while SHA256SUMS lists the file under its original name.
+    """
+    return re.sub(r"[^A-Za-z0-9._+-]", ".", name)
+
+
+def find_release_asset(release: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Pick this platform's launcher from a GitHub release.
+
+    Args:
+        release: Release JSON from the GitHub API
+
+    Returns:
+        Dict with name, url, size and sha256 (None if the release publishes
+        no checksum for it), or None if the release has no asset for this platform
+    """
+    name = LAUNCHER_ASSETS.get(sys.platform)
+    if name is None:
+        return None
+    name = release_asset_name(name)
+    assets = {release_asset_name(a.get("name", "")): a for a in release.get("assets", [])}
+    asset = assets.get(name)
+    if asset is None:
+        return None
+
+    sha256 = None
+    sums = assets.get(LAUNCHER_CHECKSUMS_ASSET)
+    if sums is not None:
+        try:
+            with _open(sums["browser_download_url"]) as response:
+                for line in response.read().decode("utf-8", "replace").splitlines():
+                    # sha256sum format: "<hex>  <name>" ("*<name>" in binary mode)
+                    parts = line.strip().split(None, 1)
+                    if len(parts) == 2 and release_asset_name(parts[1].lstrip("*")) == name:
+                        sha256 = parts[0].lower()
+                        break
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
+    if sha256 is None and str(asset.get("digest", "")).startswith("sha256:"):
+        sha256 = asset["digest"].split(":", 1)[1].lower()
+
+    return {
+        "name": name,
+        "url": asset.get("browser_download_url"),
+        "size": asset.get("size"),
+        "sha256": sha256,
+    }
+
+
+def download_resumable(
+    url: str,
+    dest: str,
+    size: Optional[int] = None,
+    rate: float = LAUNCHER_DOWNLOAD_RATE,
+    cancel_event: Optional[threading.Event] = None,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    retries: int = LAUNCHER_DOWNLOAD_RETRIES,
+) -> Tuple[bool, str]:
+    """
+    Download url to dest, resuming from whatever dest already holds.
+
+    Args:
+        url: File URL (the server should support Range requests; if it
+            ignores them the download starts over)
+        dest: Partial download path; kept on failure so the next call resumes
+        size: Expected total size in bytes, if known
+        rate: Maximum bytes per second (0 for unlimited)
+        cancel_event: Optional event that aborts the download
+        progress: Optional callable receiving (bytes_done, total_bytes)
+        retries: Attempts after a dropped connection, with growing backoff
+
+    Returns:
+        Tuple of (success, message)
+    """
+    attempt = 0
+    while True:
+        done = os.path.getsize(dest) if os.path.exists(dest) else 0
+        if size is not None and done == size:
+            return True, "Download complete"
+        if size is not None and done > size:
+            os.remove(dest)
+            done = 0
+
+        try:
+            headers = {"Range": f"bytes={done}-"} if done else {}
+            with _open(url, headers) as response:
+                if done and response.status != 206:
+                    # Server ignored the range; start over
+                    done = 0
+                total = size
+                if total is None:
+                    length = response.headers.get("Content-Length")
+                    total = done + int(length) if length else None
+
+                started = time.monotonic()
+                received = 0
+                with open(dest, "ab" if done else "wb") as f:
+                    while True:
+                        if cancel_event is not None and cancel_event.is_set():
+                            return False, "Cancelled"
+                        block = response.read(LAUNCHER_DOWNLOAD_CHUNK)
+                        if not block:
+                            break
+                        f.write(block)
+                        received += len(block)
+                        if progress:
+                            progress(done + received, total)
+                        if rate:
+                            # Sleep off any lead over the allowed rate
+                            ahead = received / rate - (time.monotonic() - started)
+                            if ahead > 0:
+                                time.sleep(ahead)
+            done += received
+            if total is None or done >= total:
+                return True, "Download complete"
+            raise OSError("connection closed early")
+        except urllib.error.HTTPError as e:
+            error = f"HTTP {e.code}"
+            if e.code == 416 and done:
+                # Range starts at or past the end: the file is complete, or stale
+                if size is None:
+                    return True, "Download complete"
+                os.remove(dest)
+            elif e.code < 500:
+                return False, error
+        except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError) as e:
+            error = str(e) or type(e).__name__
+
+        attempt += 1
+        if attempt > retries:
+            return False, f"Download failed: {error}"
+        wait = min(2 ** attempt, 60)
+        if cancel_event is not None:
+            if cancel_event.wait(wait):
+                return False, "Cancelled"
+        else:
+            time.sleep(wait)
+
+
+def get_staged_update() -> Optional[Dict[str, Any]]:
+    """
+    Read the staged update manifest.
+
+    Returns:
+        Dict with version, asset, sha256 and path (plus error if installing it
+        failed), or None if nothing is staged
+    """
+    try:
+        with open(os.path.join(LAUNCHER_UPDATE_DIR, STAGED_MANIFEST), "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_manifest(manifest: Dict[str, Any]) -> None:
+    path = os.path.join(LAUNCHER_UPDATE_DIR, STAGED_MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def discard_staged_update() -> None:
+    """Remove the staged launcher and any partial downloads."""
+    _remove_path(LAUNCHER_UPDATE_DIR)
+
+
+def stage_update(
+    release: Dict[str, Any],
+    rate: float = LAUNCHER_DOWNLOAD_RATE,
+    cancel_event: Optional[threading.Event] = None,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+) -> Tuple[bool, str]:
+    """
+    Download, verify and stage the launcher from a release.
+
+    Args:
+        release: Release JSON from the GitHub API
+        rate: Maximum download rate in bytes per second (0 for unlimited)
+        cancel_event: Optional event that aborts the download
+        progress: Optional callable receiving (bytes_done, total_bytes)
+
+    Returns:
+        Tuple of (success, message)
+    """
+    version = release.get("tag_name", "").lstrip("v")
+    staged = get_staged_update()
+    if staged is not None and staged.get("version") == version:
+        if staged.get("error"):
+            return False, staged["error"]
+        return True, f"Launcher v{version} is already staged"
+
+    asset = find_release_asset(release)
+    if asset is None or not asset["url"]:
+        return False, "The release has no launcher for this platform"
+    if not asset["sha256"]:
+        return False, "The release publishes no checksum for this platform"
+
+    # A different version may be staged or half-downloaded; start clean
+    if staged is not None or os.path.isdir(os.path.join(LAUNCHER_UPDATE_DIR, STAGED_DIR)):
+        discard_staged_update()
+    os.makedirs(LAUNCHER_UPDATE_DIR, exist_ok=True)
+    for name in os.listdir(LAUNCHER_UPDATE_DIR):
+        if name.endswith(".part") and not name.startswith(f"{version}-"):
+            _remove_path(os.path.join(LAUNCHER_UPDATE_DIR, name))
+
+    part = os.path.join(LAUNCHER_UPDATE_DIR, f"{version}-{asset['name']}.part")
+    success, msg = download_resumable(asset["url"], part, size=asset["size"], rate=rate,
+                                      cancel_event=cancel_event, progress=progress)
+    if not success:
+        return False, msg
+
+    if file_sha256(part) != asset["sha256"]:
+        # Corrupt or tampered; never resume from it
+        os.remove(part)
+        return False, "Checksum mismatch; the download was discarded"
+
+    staged_dir = os.path.join(LAUNCHER_UPDATE_DIR, STAGED_DIR)
+    os.makedirs(staged_dir, exist_ok=True)
+    try:
+        if asset["name"].endswith(".zip"):
+            # ditto keeps the bundle's permissions, symlinks and signature intact
+            result = subprocess.run(["ditto", "-x", "-k", part, staged_dir], capture_output=True, text=True)
+            if result.returncode != 0:
+                return False, f"Could not unpack the update: {result.stderr.strip()}"
+            os.remove(part)
+            apps = [n for n in os.listdir(staged_dir) if n.endswith(".app")]
+            if not apps:
+                return False, "The update archive contains no app bundle"
+            path = os.path.join(staged_dir, apps[0])
+        else:
+            path = os.path.join(staged_dir, asset["name"])
+            os.replace(part, path)
+            if sys.platform != "win32":
+                os.chmod(path, 0o755)
+    except OSError as e:
+        return False, f"Could not stage the update: {e}"
+
+    _write_manifest({"version": version, "asset": asset["name"], "sha256": asset["sha256"], "path": path})
+    return True, f"Launcher v{version} is ready to install"
+
+
+def apply_staged_update() -> bool:
+    """
+    Swap in a staged launcher and start it. Call before the UI is created.
+
+    Returns:
+        True if the new launcher was started and this process should exit
+    """
+    staged = get_staged_update()
+    if staged is None or staged.get("error") or not is_frozen():
+        return False
+    if not version_newer(staged.get("version", ""), APP_VERSION):
+        # Installed by hand in the meantime
+        discard_staged_update()
+        return False
+
+    target = current_install_path()
+    old = target + OLD_SUFFIX
+    try:
+        _remove_path(old)
+        # Renaming works even for the running executable on Windows
+        os.replace(target, old)
+        try:
+            shutil.move(staged["path"], target)
+        except OSError:
+            _remove_path(target)
+            os.replace(old, target)
+            raise
+    except OSError as e:
+        # e.g., installed in a folder this user cannot write; don't retry every start
+        staged["error"] = f"Could not replace {target}: {e}"
+        try:
+            _write_manifest(staged)
+        except OSError:
+            pass
+        return False
+
+    discard_staged_update()
+    try:
+        if sys.platform == "darwin":
+            subprocess.Popen(["open", "-n", target])
+        else:
+            subprocess.Popen([target] + sys.argv[1:], close_fds=True)
+    except OSError:
+        return False
+    return True
+
+
+def cleanup_previous_launcher() -> bool:
+    """
+    Remove the launcher replaced by the last update.
+
+    Returns:
+        True if this start follows an update
+    """
+    if not is_frozen():
+        return False
+    old = current_install_path() + OLD_SUFFIX
+    if not os.path.lexists(old):
+        return False
+    try:
+        _remove_path(old)
+    except OSError:
+        # The previous process may still be exiting (Windows); retried next start
+        pass
+    return True
@@ -0,0 +1,522 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental snapshots of the Nova instance directory.
+
+Each snapshot is a full directory tree under SNAPSHOT_DIR plus a manifest of
+(size, mtime, sha256) per file. Files whose size and mtime match the previous
+snapshot are hardlinked without being read; the remaining files are copied
+and hashed in the same pass (in parallel), and the copy is replaced by a
+hardlink when its content turns out unchanged. SQLite databases are copied
+with the online backup API, since the tracker may be writing to them, and
+their -wal/-shm files are left out (the backup includes committed WAL
+content). Snapshot files are never modified in place (restore copies them
+back out), so sharing inodes between snapshots is safe.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.request import pathname2url
+
+from config import (
+    INSTANCE_DIR,
+    SNAPSHOT_DIR,
+    SNAPSHOT_KEEP,
+    SNAPSHOT_MAX_AGE_DAYS,
+    SNAPSHOT_HASH_WORKERS,
+    HASH_CHUNK_SIZE,
+)
+from docker_ops import load_launcher_prefs
+from remote_host import remote_data_notice
+from utils import format_bytes
+
+MANIFEST_NAME = "manifest.json"
+DATA_DIRNAME = "data"
+PARTIAL_SUFFIX = ".partial"
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+# Journal files next to a database; a backup already contains their contents
+_SQLITE_SIDE_FILES = ("-wal", "-shm", "-journal")
+
+
+def _hash_file(path: str) -> str:
+    """Return the hex sha256 of a file, reading in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_sqlite_file(path: str) -> bool:
+    """Check a file's header for an SQLite database."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def backup_sqlite(src: str, dst: str) -> None:
+    """
+    Copy an SQLite database consistently while another process may write to it.
+
+    Uses SQLite's online backup, which takes the database lock and includes
+    committed WAL content, so the copy is never torn between pages.
+
+    Args:
+        src: Live database file
+        dst: Destination file (replaced)
+    """
+    if os.path.exists(dst):
+        os.remove(dst)
+    source = sqlite3.connect(f"file:{pathname2url(os.path.abspath(src))}?mode=ro", uri=True, timeout=30)
+    try:
+        target = sqlite3.connect(dst)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def _sqlite_side_file(rel: str, databases: set) -> bool:
+    """True for the -wal/-shm/-journal file of a database in the set."""
+    for suffix in _SQLITE_SIDE_FILES:
+        if rel.endswith(suffix) and rel[:-len(suffix)] in databases:
+            return True
+    return False
+
+
+def seed_instance(snapshot_id: str, dest: str) -> Tuple[bool, str]:
+    """
+    Build a scratch instance directory from a snapshot.
+
+    Used to give the update candidate its own data, so it never writes to (or
+    migrates) the live tracker's database. Databases are restored with
+    SQLite's backup, as the candidate writes to them; every other file is
+    hardlinked from the snapshot, so seeding costs the size of the databases
+    rather than a second copy of the instance. The tracker keeps its state
+    in the databases; the scratch directory is deleted after the update.
+
+    Args:
+        snapshot_id: Snapshot identifier as returned by list_snapshots()
+        dest: Target directory (replaced)
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    notice = remote_data_notice()
+    if notice:
+        return False, notice
+    source = os.path.join(SNAPSHOT_DIR, snapshot_id)
+    manifest = _read_manifest(source)
+    if manifest is None:
+        return False, f"Snapshot not found: {snapshot_id}"
+    data_path = os.path.join(source, DATA_DIRNAME)
+    databases = set(manifest.get("databases", []))
+    try:
+        shutil.rmtree(dest, ignore_errors=True)
+        os.makedirs(dest)
+        for rel in manifest.get("dirs", []):
+            os.makedirs(os.path.join(dest, rel), exist_ok=True)
+        for rel in manifest.get("files", {}):
+            src = os.path.join(data_path, rel)
+            dst = os.path.join(dest, rel)
+            if rel in databases:
+                backup_sqlite(src, dst)
+                continue
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+    except (PermissionError, OSError, sqlite3.Error) as e:
+        shutil.rmtree(dest, ignore_errors=True)
+        return False, f"Could not prepare instance data: {e}"
+    return True, f"Prepared instance data from snapshot {snapshot_id}"
+
+
+def _database_stats(databases: List[str]) -> Dict[str, List[int]]:
+    """(size, mtime_ns) of the live databases and their -wal/-journal files that exist."""
+    stats = {}
+    for db in databases:
+        for rel in (db, db + "-wal", db + "-journal"):
+            try:
+                st = os.stat(os.path.join(INSTANCE_DIR, rel))
+            except OSError:
+                continue
+            stats[rel] = [st.st_size, st.st_mtime_ns]
+    return stats
+
+
+def databases_unchanged(snapshot_id: str) -> bool:
+    """
+    Check that no live database was written since a snapshot was taken.
+
+    Compares the size and mtime of each database and its -wal/-journal file
+    with those recorded before the snapshot's backup, so a write during the
+    snapshot also counts as a change. Reads leave these files alone.
+
+    Args:
+        snapshot_id: Snapshot identifier as returned by list_snapshots()
+
+    Returns:
+        True if the databases are as the snapshot saw them
+    """
+    manifest = _read_manifest(os.path.join(SNAPSHOT_DIR, snapshot_id))
+    if manifest is None or "database_stats" not in manifest:
+        return False
+    return _database_stats(manifest.get("databases", [])) == manifest["database_stats"]
+
+
+def promote_databases(source: str, snapshot_id: str) -> Tuple[bool, str]:
+    """
+    Move the databases of a scratch instance directory into INSTANCE_DIR.
+
+    The live copies and their journal files are replaced; the caller must
+    have stopped both trackers and checked databases_unchanged.
+
+    Args:
+        source: Scratch instance directory (see seed_instance)
+        snapshot_id: Snapshot the directory was seeded from
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    manifest = _read_manifest(os.path.join(SNAPSHOT_DIR, snapshot_id))
+    if manifest is None:
+        return False, f"Snapshot not found: {snapshot_id}"
+    databases = manifest.get("databases", [])
+    try:
+        for rel in databases:
+            for suffix in ("",) + _SQLITE_SIDE_FILES:
+                live = os.path.join(INSTANCE_DIR, rel + suffix)
+                if suffix and os.path.exists(live):
+                    os.remove(live)
+                src = os.path.join(source, rel + suffix)
+                # A candidate killed before its checkpoint leaves committed data in the -wal
+                if os.path.exists(src) and suffix != "-shm":
+                    os.replace(src, live)
+    except (PermissionError, OSError) as e:
+        return False, f"Could not move the updated databases: {e}"
+    return True, f"Moved {len(databases)} updated database(s) into the instance"
+
+
+def _copy_hashing(src: str, dst: str) -> str:
+    """Copy a file (with its timestamps) and return the hex sha256 of what was copied."""
+    digest = hashlib.sha256()
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        for chunk in iter(lambda: fin.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            fout.write(chunk)
+    shutil.copystat(src, dst)
+    return digest.hexdigest()
+
+
+def _walk_instance(root: str) -> Iterator[Tuple[str, bool, int, int]]:
+    """
+    Yield (relative_path, is_dir, size, mtime_ns) for everything under root.
+
+    Symlinks are skipped; the tracker does not create them.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    rel = os.path.relpath(entry.path, root)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        yield rel, True, 0, 0
+                    elif entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        yield rel, False, st.st_size, st.st_mtime_ns
+        except OSError:
+            continue
+
+
+def _bounded_run(fn: Callable, items: Iterator, workers: int) -> Iterator[Any]:
+    """
+    Run fn over items in a thread pool with a bounded number of in-flight tasks.
+
+    Keeps memory flat for instance directories with very many files.
+    """
+    max_pending = workers * 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for item in items:
+            pending.add(pool.submit(fn, item))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+
+def _read_manifest(snapshot_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(snapshot_path, MANIFEST_NAME), "r") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, PermissionError, OSError):
+        return None
+
+
+def list_snapshots() -> List[Dict[str, Any]]:
+    """
+    List completed snapshots, newest first.
+
+    Returns:
+        List of dicts with id, path, created, label, files, total_bytes, copied_bytes
+    """
+    snapshots = []
+    if not os.path.isdir(SNAPSHOT_DIR):
+        return snapshots
+
+    for name in os.listdir(SNAPSHOT_DIR):
+        if name.endswith(PARTIAL_SUFFIX):
+            continue
+        path = os.path.join(SNAPSHOT_DIR, name)
+        manifest = _read_manifest(path)
+        if manifest is None:
+            continue
+        snapshots.append({
+            "id": name,
+            "path": path,
+            "created": manifest.get("created", 0),
+            "label": manifest.get("label", ""),
+            "files": len(manifest.get("files", {})),
+            "total_bytes": manifest.get("total_bytes", 0),
+            "copied_bytes": manifest.get("copied_bytes", 0),
+        })
+
+    snapshots.sort(key=lambda s: s["created"], reverse=True)
+    return snapshots
+
+
+def create_snapshot(
+    label: str = "",
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[bool, str]:
+    """
+    Create an incremental snapshot of INSTANCE_DIR.
+
+    Args:
+        label: Short description stored in the manifest (e.g., "pre-update")
+        progress: Optional callback receiving (files_done, files_total)
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    notice = remote_data_notice()
+    if notice:
+        return False, notice
+    if not os.path.isdir(INSTANCE_DIR):
+        return False, f"Instance directory not found: {INSTANCE_DIR}"
+
+    started = time.monotonic()
+    base_id = snapshot_id = time.strftime("%Y%m%d-%H%M%S")
+    final_path = os.path.join(SNAPSHOT_DIR, snapshot_id)
+    suffix = 1
+    # e.g., the automatic snapshot a restore takes right after another one
+    while os.path.exists(final_path):
+        suffix += 1
+        snapshot_id = f"{base_id}-{suffix}"
+        final_path = os.path.join(SNAPSHOT_DIR, snapshot_id)
+
+    work_path = final_path + PARTIAL_SUFFIX
+    data_path = os.path.join(work_path, DATA_DIRNAME)
+
+    previous = list_snapshots()
+    prev_data = os.path.join(previous[0]["path"], DATA_DIRNAME) if previous else None
+    prev_files = {}
+    if previous:
+        prev_files = (_read_manifest(previous[0]["path"]) or {}).get("files", {})
+
+    try:
+        shutil.rmtree(work_path, ignore_errors=True)
+        os.makedirs(data_path)
+
+        dirs = []
+        files = []
+        for rel, is_dir, size, mtime_ns in _walk_instance(INSTANCE_DIR):
+            if is_dir:
+                dirs.append(rel)
+                os.makedirs(os.path.join(data_path, rel), exist_ok=True)
+            else:
+                files.append((rel, size, mtime_ns))
+        databases = {rel for rel, _, _ in files if is_sqlite_file(os.path.join(INSTANCE_DIR, rel))}
+        files = [item for item in files if not _sqlite_side_file(item[0], databases)]
+        # Before any backup, so a write during the snapshot shows as a change
+        database_stats = _database_stats(sorted(databases))
+
+        def _link_or_copy(src: str, dst: str) -> None:
+            try:
+                os.link(src, dst)
+            except OSError:
+                # Cross-device or filesystem without hardlinks
+                shutil.copy2(src, dst)
+
+        def _snapshot_file(item: Tuple[str, int, int]) -> Tuple[str, list, int]:
+            rel, size, mtime_ns = item
+            src = os.path.join(INSTANCE_DIR, rel)
+            dst = os.path.join(data_path, rel)
+            prev = prev_files.get(rel)
+            is_database = rel in databases
+
+            # Fast path: unchanged metadata, no read at all. Not for databases:
+            # writes that are still in the WAL leave the main file untouched
+            if prev and prev[0] == size and prev[1] == mtime_ns and prev_data and not is_database:
+                _link_or_copy(os.path.join(prev_data, rel), dst)
+                return rel, prev, 0
+
+            try:
+                if is_database:
+                    backup_sqlite(src, dst)
+                    size = os.path.getsize(dst)
+                    sha = _hash_file(dst)
+                else:
+                    sha = _copy_hashing(src, dst)
+            except FileNotFoundError:
+                # Deleted by the running tracker since the directory walk
+                return rel, None, 0
+            if prev and prev[2] == sha and prev_data:
+                os.remove(dst)
+                _link_or_copy(os.path.join(prev_data, rel), dst)
+                return rel, [size, mtime_ns, sha], 0
+            return rel, [size, mtime_ns, sha], size
+
+        manifest_files = {}
+        copied_bytes = 0
+        total_bytes = 0
+        done = 0
+        for rel, entry, copied in _bounded_run(_snapshot_file, iter(files), SNAPSHOT_HASH_WORKERS):
+            done += 1
+            if entry is None:
+                continue
+            manifest_files[rel] = entry
+            copied_bytes += copied
+            total_bytes += entry[0]
+            if progress:
+                progress(done, len(files))
+
+        manifest = {
+            "created": time.time(),
+            "label": label,
+            "dirs": dirs,
+            "files": manifest_files,
+            "databases": sorted(rel for rel in databases if rel in manifest_files),
+            "database_stats": database_stats,
+            "total_bytes": total_bytes,
+            "copied_bytes": copied_bytes,
+        }
+        with open(os.path.join(work_path, MANIFEST_NAME), "w") as f:
+            json.dump(manifest, f)
+
+        os.rename(work_path, final_path)
+    except (PermissionError, OSError, sqlite3.Error) as e:
+        shutil.rmtree(work_path, ignore_errors=True)
+        return False, f"Snapshot failed: {e}"
+
+    prune_snapshots()
+    elapsed = time.monotonic() - started
+    return True, (f"Snapshot {snapshot_id}: {len(manifest_files)} files, "
+                  f"{format_bytes(copied_bytes)} copied in {elapsed:.1f}s")
+
+
+def prune_snapshots(
+    keep: Optional[int] = None,
+    max_age_days: Optional[float] = None,
+) -> int:
+    """
+    Evict snapshots beyond the retention rules. The newest snapshot is always kept.
+
+    Args:
+        keep: Number of snapshots to retain (defaults to prefs or SNAPSHOT_KEEP)
+        max_age_days: Maximum snapshot age (defaults to prefs or SNAPSHOT_MAX_AGE_DAYS)
+
+    Returns:
+        Number of snapshots removed
+    """
+    prefs = load_launcher_prefs()
+    if keep is None:
+        keep = prefs.get("snapshot_keep", SNAPSHOT_KEEP)
+    if max_age_days is None:
+        max_age_days = prefs.get("snapshot_max_age_days", SNAPSHOT_MAX_AGE_DAYS)
+
+    # Leftovers from interrupted runs
+    if os.path.isdir(SNAPSHOT_DIR):
+        for name in os.listdir(SNAPSHOT_DIR):
+            if name.endswith(PARTIAL_SUFFIX):
+                shutil.rmtree(os.path.join(SNAPSHOT_DIR, name), ignore_errors=True)
+
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for index, snapshot in enumerate(list_snapshots()):
+        if index == 0:
+            continue
+        if index >= max(keep, 1) or snapshot["created"] < cutoff:
+            shutil.rmtree(snapshot["path"], ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def restore_snapshot(snapshot_id: str) -> Tuple[bool, str]:
+    """
+    Replace INSTANCE_DIR with the contents of a snapshot.
+
+    The current instance is snapshotted first, so a restore can itself be
+    undone. Files are copied (never hardlinked) back into the instance so the
+    tracker cannot modify snapshot data in place. The container must be
+    stopped by the caller.
+
+    Args:
+        snapshot_id: Snapshot identifier as returned by list_snapshots()
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    notice = remote_data_notice()
+    if notice:
+        return False, notice
+    source = os.path.join(SNAPSHOT_DIR, snapshot_id)
+    manifest = _read_manifest(source)
+    if manifest is None:
+        return False, f"Snapshot not found: {snapshot_id}"
+
+    staging = INSTANCE_DIR + ".restore"
+    retired = INSTANCE_DIR + ".old"
+    try:
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.rmtree(retired, ignore_errors=True)
+        shutil.copytree(os.path.join(source, DATA_DIRNAME), staging)
+    except (PermissionError, OSError) as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        return False, f"Restore failed: {e}"
+
+    # Taken after staging, since retention may evict the source snapshot
+    if os.path.isdir(INSTANCE_DIR):
+        success, msg = create_snapshot(label=f"before restore of {snapshot_id}")
+        if not success:
+            shutil.rmtree(staging, ignore_errors=True)
+            return False, f"Could not save current data before restoring: {msg}"
+
+    try:
+        if os.path.isdir(INSTANCE_DIR):
+            os.rename(INSTANCE_DIR, retired)
+        os.rename(staging, INSTANCE_DIR)
+        shutil.rmtree(retired, ignore_errors=True)
+    except (PermissionError, OSError) as e:
+        shutil.rmtree(staging, ignore_errors=True)
+        if not os.path.isdir(INSTANCE_DIR) and os.path.isdir(retired):
+            os.rename(retired, INSTANCE_DIR)
+        return False, f"Restore failed: {e}"
+
+    return True, f"Restored snapshot {snapshot_id}"
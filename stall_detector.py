@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Tk main-loop stall detection.
+
+A heartbeat scheduled with root.after() records when the event loop last got
+to run. A monitor thread watches the heartbeat; when it falls behind by more
+than the threshold, the main thread's stack is captured with
+sys._current_frames() while the stall is still in progress, so the report
+names the callback that is blocking rather than whatever runs afterwards.
+"""
+
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+from config import STALL_HEARTBEAT_INTERVAL, STALL_THRESHOLD
+
+
+class StallDetector:
+    """
+    Watchdog for the Tk event loop.
+
+    Must be created on the Tk (main) thread.
+    """
+
+    def __init__(
+        self,
+        root,
+        log: Callable[[str], None],
+        threshold: float = STALL_THRESHOLD,
+        interval: float = STALL_HEARTBEAT_INTERVAL,
+    ):
+        """
+        Args:
+            root: Tk root window
+            log: Thread-safe callback receiving report lines
+            threshold: Event-loop lag in seconds that counts as a stall
+            interval: Heartbeat period in seconds
+        """
+        self.root = root
+        self.log = log
+        self.threshold = threshold
+        self.interval = interval
+        self.max_stall = 0.0
+        self.stall_count = 0
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stall_stack: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the heartbeat and the monitor thread."""
+        self._last_beat = time.monotonic()
+        self.root.after(int(self.interval * 1000), self._beat)
+        threading.Thread(target=self._monitor, daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop the heartbeat and the monitor thread."""
+        self._stop_event.set()
+
+    def _beat(self) -> None:
+        if self._stop_event.is_set():
+            return
+        now = time.monotonic()
+        with self._lock:
+            # Lag beyond the scheduled interval is time the loop was blocked
+            lag = now - self._last_beat - self.interval
+            self._last_beat = now
+            stack = self._stall_stack
+            self._stall_stack = None
+
+        if lag > self.threshold:
+            self.stall_count += 1
+            self.max_stall = max(self.max_stall, lag)
+            self.log(f"[warn] UI thread blocked for {lag * 1000:.0f} ms "
+                     f"(worst this session: {self.max_stall * 1000:.0f} ms)")
+            if stack:
+                self.log(f"[warn] Blocking call:\n{stack}")
+
+        self.root.after(int(self.interval * 1000), self._beat)
+
+    def _monitor(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            with self._lock:
+                overdue = time.monotonic() - self._last_beat - self.interval
+                if overdue <= self.threshold or self._stall_stack is not None:
+                    continue
+                frame = sys._current_frames().get(self._main_ident)
+                if frame is not None:
+                    self._stall_stack = "".join(traceback.format_stack(frame)).rstrip()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Last-known launcher state, persisted across runs.
+
+The first state check can take seconds while Docker Desktop wakes up. The
+launcher saves the state it shows (plus the image digest and version label)
+whenever it changes, and paints that snapshot at startup, marked as stale,
+until fresh probes reconcile it.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from config import LAST_STATE_FILE, NOVA_DIR
+
+_write_lock = threading.Lock()
+_pending_lock = threading.Lock()
+_pending: Optional[Dict[str, Any]] = None
+
+
+def load_last_state(host: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the saved snapshot.
+
+    Args:
+        host: Key of the managed Docker host; a snapshot of another host is ignored
+
+    Returns:
+        Dict with state, digest, version_label, host and saved_at, or None
+    """
+    try:
+        with open(LAST_STATE_FILE, "r") as f:
+            snapshot = json.load(f)
+    except (json.JSONDecodeError, PermissionError, OSError):
+        return None
+    if not isinstance(snapshot, dict) or not snapshot.get("state") or snapshot.get("host") != host:
+        return None
+    return snapshot
+
+
+def save_last_state(snapshot: Dict[str, Any]) -> None:
+    """
+    Persist a snapshot in the background.
+
+    If writes overlap, the newest snapshot wins; files are replaced
+    atomically, so exiting mid-write never leaves a truncated file.
+
+    Args:
+        snapshot: Dict with state, digest, version_label and host
+    """
+    global _pending
+    with _pending_lock:
+        _pending = dict(snapshot, saved_at=time.time())
+    threading.Thread(target=_flush, daemon=True).start()
+
+
+def _flush() -> None:
+    global _pending
+    with _write_lock:
+        with _pending_lock:
+            data, _pending = _pending, None
+        if data is None:
+            return  # An earlier flush already wrote it
+        try:
+            os.makedirs(NOVA_DIR, exist_ok=True)
+            tmp_path = LAST_STATE_FILE + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, LAST_STATE_FILE)
+        except (PermissionError, OSError):
+            pass
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent launcher state probes.
+
+The state shown in the main window depends on five probes: the docker
+binary, the daemon (`docker info`), the compose file, the container
+(`docker ps`) and the dashboard HTTP check. Each may block for up to
+DOCKER_INFO_TIMEOUT or WEB_READY_TIMEOUT, but none needs another's result to
+run, so they are started together on a persistent pool and the state is
+decided from whichever results have arrived. A dashboard that already
+answers means "running" however long `docker info` takes, and the worst case
+is the slowest probe rather than the sum of all of them.
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+
+from docker_ops import (
+    get_container_health,
+    is_container_paused,
+    is_container_running,
+    is_docker_installed,
+    is_docker_running,
+    is_nova_installed,
+)
+from utils import check_web_ready
+
+PROBES: Dict[str, Callable[[], Any]] = {
+    "installed": is_docker_installed,
+    "daemon": is_docker_running,
+    "compose": is_nova_installed,
+    "container": is_container_running,
+    "web": check_web_ready,
+}
+
+_executor = ThreadPoolExecutor(max_workers=len(PROBES), thread_name_prefix="state-probe")
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def decide_state(results: Dict[str, Any]) -> Optional[str]:
+    """
+    Decide the launcher state from the probe results known so far.
+
+    Args:
+        results: Probe name -> result, for the probes that have finished
+
+    Returns:
+        One of "docker_missing", "docker_stopped", "not_installed",
+        "stopped", "paused", "initializing", "unhealthy" or "running", or
+        None if the known results do not settle it yet
+    """
+    if results.get("installed") is False:
+        return "docker_missing"
+    # A serving dashboard settles it, whatever the daemon checks are doing
+    if results.get("web") is True:
+        return "running"
+
+    if "daemon" not in results:
+        return None
+    is_running, status = results["daemon"]
+    if not is_running:
+        return "docker_missing" if status == "missing" else "docker_stopped"
+
+    if "compose" not in results:
+        return None
+    if not results["compose"]:
+        return "not_installed"
+
+    if "container" not in results:
+        return None
+    is_running, status_str = results["container"]
+    if not is_running:
+        return "stopped"
+    if is_container_paused(status_str):
+        return "paused"
+
+    # Readiness comes from the container healthcheck; only compose files
+    # without one fall back to the dashboard check
+    health = get_container_health(status_str)
+    if health == "healthy":
+        return "running"
+    if health == "unhealthy":
+        return "unhealthy"
+    if health == "starting":
+        return "initializing"
+    if "web" not in results:
+        return None
+    return "initializing"
+
+
+def _submit(name: str) -> Future:
+    """Start a probe, or join the run already in flight (e.g., a slow `docker info`)."""
+    with _inflight_lock:
+        future = _inflight.get(name)
+        if future is None or future.done():
+            future = _executor.submit(PROBES[name])
+            _inflight[name] = future
+        return future
+
+
+def _probe_result(name: str, future: Future) -> Any:
+    """A finished probe's result; a failed probe counts as a negative answer."""
+    try:
+        return future.result()
+    except Exception:
+        return (False, "error") if name in ("daemon", "container") else False
+
+
+def probe_state(on_result: Optional[Callable[[str, Any], None]] = None) -> str:
+    """
+    Run all probes concurrently and decide the state as soon as possible.
+
+    Probes still running once the state is decided are left to finish in
+    the background; the next call joins them instead of starting new ones.
+
+    Args:
+        on_result: Called with (name, result) for every probe of this call,
+            including those that finish after the state was decided (then
+            on the probe's pool thread), e.g. to react to the daemon coming up
+
+    Returns:
+        The launcher state (see decide_state)
+    """
+    pending = {_submit(name): name for name in PROBES}
+    if on_result:
+        for future, name in pending.items():
+            future.add_done_callback(lambda f, name=name: on_result(name, _probe_result(name, f)))
+
+    results: Dict[str, Any] = {}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = pending.pop(future)
+            results[name] = _probe_result(name, future)
+        state = decide_state(results)
+        if state is not None:
+            return state
+    return decide_state(results) or "stopped"
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests for offline bundle discovery (bundles.py)."""
+
+import gzip
+import hashlib
+import json
+import os
+import stat
+import sys
+
+import pytest
+
+import bundles
+from config import BUNDLE_MANIFEST_NAME, DOCKER_IMAGE_FULL
+
+AMD64 = {"os": "linux", "architecture": "amd64", "variant": ""}
+ARM64 = {"os": "linux", "architecture": "arm64", "variant": "v8"}
+
+
+def _write_bundle(directory, created, platform=None):
+    directory.mkdir(parents=True)
+    (directory / "image.tar.gz").write_bytes(b"not really a tarball")
+    manifest = {"image": DOCKER_IMAGE_FULL, "image_id": f"sha256:{created:064d}", "file": "image.tar.gz",
+                "compression": "gzip", "sha256": "0" * 64, "created": created}
+    if platform is not None:
+        manifest["platform"] = platform
+    (directory / BUNDLE_MANIFEST_NAME).write_text(json.dumps(manifest))
+    return str(directory)
+
+
+@pytest.fixture
+def media(tmp_path, monkeypatch):
+    monkeypatch.setattr(bundles, "BUNDLE_DIR", str(tmp_path / "bundles"))
+    monkeypatch.setattr(bundles, "_removable_roots", lambda: [str(tmp_path / "usb")])
+    monkeypatch.setattr(bundles, "get_host_platform", lambda: ARM64)
+    return tmp_path
+
+
+def test_find_bundle_skips_other_platforms(media):
+    _write_bundle(media / "usb", created=300, platform=AMD64)
+    arm = _write_bundle(media / "bundles", created=100, platform={"os": "linux", "architecture": "arm64"})
+    bundle_dir, manifest = bundles.find_bundle()
+    assert bundle_dir == arm
+    assert manifest["platform"]["architecture"] == "arm64"
+
+
+def test_find_bundle_ignores_bundles_without_platform(media):
+    _write_bundle(media / "usb", created=300)
+    assert bundles.find_bundle() is None
+
+
+def test_import_refuses_other_platform(media):
+    bundle_dir = _write_bundle(media / "usb", created=300, platform=AMD64)
+    ok, message = bundles.import_bundle(bundle_dir)
+    assert not ok
+    assert "linux/amd64" in message and "linux/arm64" in message
+
+
+@pytest.mark.parametrize("bundle_platform, host, expected", [
+    (AMD64, AMD64, True),
+    (AMD64, ARM64, False),
+    ({"os": "linux", "architecture": "arm64", "variant": ""}, ARM64, True),
+    ({"os": "linux", "architecture": "arm", "variant": "v6"}, {"os": "linux", "architecture": "arm", "variant": "v7"},
+     False),
+    (None, AMD64, False),
+])
+def test_bundle_matches_host(bundle_platform, host, expected):
+    manifest = {"image_id": "sha256:abc", "platform": bundle_platform}
+    assert bundles.bundle_matches_host(manifest, host) is expected
+
+
+# Consumes `docker load` input and logs every other call
+FAKE_DOCKER = """#!{python}
+import os, sys
+args = sys.argv[1:]
+if args[0] == "load":
+    sys.stdin.buffer.read()
+with open(os.environ["FAKE_DOCKER_LOG"], "a") as log:
+    log.write(" ".join(args) + "\\n")
+"""
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shell-less script on PATH")
+def test_import_tags_the_mirror_reference_the_compose_file_runs(media, monkeypatch):
+    bin_dir = media / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(FAKE_DOCKER.format(python=sys.executable))
+    docker.chmod(docker.stat().st_mode | stat.S_IEXEC)
+    log = media / "docker.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_DOCKER_LOG", str(log))
+    mirror_ref = f"mirror.lan:5000/{DOCKER_IMAGE_FULL}"
+    monkeypatch.setattr(bundles, "get_compose_image_ref", lambda: mirror_ref)
+    monkeypatch.setattr(bundles, "load_launcher_prefs", lambda: {})
+    monkeypatch.setattr(bundles, "save_launcher_prefs", lambda prefs: True)
+
+    bundle_dir = _write_bundle(media / "usb", created=300, platform=ARM64)
+    compressed = gzip.compress(b"image layers")
+    (media / "usb" / "image.tar.gz").write_bytes(compressed)
+    manifest_path = media / "usb" / BUNDLE_MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text())
+    manifest["sha256"] = hashlib.sha256(compressed).hexdigest()
+    manifest_path.write_text(json.dumps(manifest))
+
+    ok, message = bundles.import_bundle(bundle_dir)
+
+    assert ok, message
+    assert f"tag {DOCKER_IMAGE_FULL} {mirror_ref}" in log.read_text().splitlines()
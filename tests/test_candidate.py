@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Tests for the update candidate container (docker_ops.start_candidate_container)."""
+
+import docker_ops
+from config import CANDIDATE_CONTAINER_NAME
+
+
+def test_candidate_runs_with_the_compose_resource_limits(monkeypatch):
+    calls = []
+    monkeypatch.setattr(docker_ops, "run_command", lambda args, **kwargs: calls.append(args) or ("", "", 0))
+    monkeypatch.setattr(docker_ops, "get_resource_limits",
+                        lambda: {"cpus": 3.0, "cpu_shares": 512, "pids_limit": 512, "mem_limit": "4096m"})
+    monkeypatch.setattr(docker_ops, "get_registry_mirror", lambda: None)
+
+    success, msg = docker_ops.start_candidate_container("/tmp/candidate")
+
+    assert success, msg
+    assert calls[0] == ["docker", "rm", "-f", CANDIDATE_CONTAINER_NAME]
+    run = calls[1]
+    for flag, value in (("--cpus", "3.0"), ("--memory", "4096m"), ("--cpu-shares", "512"), ("--pids-limit", "512")):
+        assert run[run.index(flag) + 1] == value
+    assert run[-1] == docker_ops.DOCKER_IMAGE_FULL
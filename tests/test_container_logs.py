@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Tests for following the container output (docker_ops.follow_container_logs)."""
+
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+import docker_ops
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="shell-less script on PATH")
+
+# `inspect` reports FAKE_STARTED_AT; `logs` prints FAKE_LOGS ("<timestamp> <text>"
+# lines, kept across container runs as docker does) from --since on and exits
+FAKE_DOCKER = textwrap.dedent("""\
+    #!{python}
+    import os, sys
+    args = sys.argv[1:]
+
+    def key(timestamp):
+        seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+        return seconds, fraction.ljust(9, "0")
+
+    if args[0] == "inspect":
+        print(open(os.environ["FAKE_STARTED_AT"]).read().strip())
+    elif args[0] == "logs":
+        since = args[args.index("--since") + 1]
+        for line in open(os.environ["FAKE_LOGS"]).read().splitlines():
+            if key(line.split(" ", 1)[0]) >= key(since):
+                print(line)
+""")
+
+
+class _Connections:
+    """Stop event that ends the follow loop after a number of connections."""
+
+    def __init__(self, count):
+        self.count = count
+
+    def is_set(self):
+        self.count -= 1
+        return self.count < 0
+
+    def wait(self, timeout=None):
+        return False
+
+
+@pytest.fixture
+def fake_docker(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(FAKE_DOCKER.format(python=sys.executable))
+    docker.chmod(docker.stat().st_mode | stat.S_IEXEC)
+    started_at = tmp_path / "started_at"
+    logs = tmp_path / "logs"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_STARTED_AT", str(started_at))
+    monkeypatch.setenv("FAKE_LOGS", str(logs))
+    monkeypatch.setattr(docker_ops, "is_container_running", lambda: (True, "Up 1 minute"))
+    return started_at, logs
+
+
+def test_replays_only_the_current_run_and_resumes_after_the_last_line(fake_docker):
+    started_at, logs = fake_docker
+    started_at.write_text("2026-01-01T10:00:00.5Z\n")
+    logs.write_text(
+        "2026-01-01T09:00:00Z Traceback (most recent call last):\n"
+        "2026-01-01T10:00:01.25Z booting\n"
+        "2026-01-01T10:00:01.5Z serving\n"
+    )
+    received, connects = [], []
+
+    def on_output(chunk):
+        # Chunks hold complete lines, but how many depends on the pipe
+        received.append(chunk)
+        if chunk.endswith("serving\n"):
+            # More output from the same run, then a restart
+            with open(logs, "a") as f:
+                f.write("2026-01-01T10:05:00.123Z later\n")
+        elif chunk.endswith("later\n"):
+            started_at.write_text("2026-01-01T11:00:00Z\n")
+            with open(logs, "a") as f:
+                f.write("2026-01-01T11:00:02Z booting again\n")
+
+    docker_ops.follow_container_logs(on_output, _Connections(3), lambda: connects.append("".join(received)))
+
+    assert "".join(received) == "booting\nserving\nlater\nbooting again\n"
+    # The analyzer is reset for each container run, not for each reconnection
+    assert connects == ["", "booting\nserving\nlater\n"]
+
+
+def test_log_timestamp_key_orders_fractions_of_any_length():
+    assert docker_ops._log_timestamp_key("2026-01-01T10:00:01.5Z") > docker_ops._log_timestamp_key("2026-01-01T10:00:01.25Z")
+    assert docker_ops._log_timestamp_key("2026-01-01T10:00:01Z") < docker_ops._log_timestamp_key("2026-01-01T10:00:01.000000001Z")
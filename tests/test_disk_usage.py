@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Tests for the cached instance disk scan (disk_usage.scan_directory)."""
+
+import os
+
+import pytest
+
+import disk_usage
+
+
+@pytest.fixture
+def instance(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_usage, "DISK_USAGE_CACHE_FILE", str(tmp_path / "cache.json"))
+    monkeypatch.setattr(disk_usage, "NOVA_DIR", str(tmp_path))
+    root = tmp_path / "instance"
+    (root / "logs").mkdir(parents=True)
+    (root / "app.db").write_bytes(b"x" * 1000)
+    (root / "logs" / "tracker.log").write_bytes(b"y" * 100)
+    return root
+
+
+def test_rescan_picks_up_files_growing_in_place(instance):
+    first = disk_usage.scan_directory(str(instance))
+    assert first["total_bytes"] == 1100
+    assert first["rescanned"] == 2
+
+    mtimes = {d: os.stat(d).st_mtime_ns for d in (instance, instance / "logs")}
+    with open(instance / "app.db", "ab") as f:
+        f.write(b"x" * 4000)
+    with open(instance / "logs" / "tracker.log", "ab") as f:
+        f.write(b"y" * 400)
+    # Growing a file leaves its directory's mtime alone
+    assert mtimes == {d: os.stat(d).st_mtime_ns for d in mtimes}
+
+    second = disk_usage.scan_directory(str(instance))
+    assert second["total_bytes"] == 5500
+    assert second["file_count"] == 2
+    assert second["children"] == [("logs", 500)]
+    # Both listings came from the cache
+    assert (second["rescanned"], second["reused"]) == (0, 2)
+
+
+def test_rescan_lists_directories_whose_entries_changed(instance):
+    disk_usage.scan_directory(str(instance))
+    (instance / "logs" / "tracker.log.1").write_bytes(b"z" * 50)
+    os.utime(instance / "logs", ns=(0, 0))
+
+    result = disk_usage.scan_directory(str(instance))
+    assert result["total_bytes"] == 1150
+    assert result["file_count"] == 3
+    assert result["rescanned"] == 1
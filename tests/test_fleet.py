@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Tests for fleet bulk actions (fleet.py), against a docker CLI stand-in."""
+
+import asyncio
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+import docker_ops
+import fleet
+from config import DOCKER_IMAGE_FULL
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="shell-less script on PATH")
+
+MIRROR_REF = f"mirror.lan:5000/{DOCKER_IMAGE_FULL}"
+
+# Logs every call; the container runs whatever FAKE_IMAGE says, and pulls of
+# the mirror reference fail while FAKE_MIRROR_DOWN is set
+FAKE_DOCKER = textwrap.dedent("""\
+    #!{python}
+    import os, sys
+    args = sys.argv[1:]
+    with open(os.environ["FAKE_DOCKER_LOG"], "a") as log:
+        log.write(" ".join(args) + "\\n")
+    if args[0] == "inspect" and "{{{{.Config.Image}}}}" in args:
+        print(os.environ["FAKE_IMAGE"])
+    elif args[0] == "inspect":
+        sys.exit(1)  # no compose labels: nothing to recreate
+    elif args[0] == "pull" and args[-1] != "{canonical}" and os.environ.get("FAKE_MIRROR_DOWN"):
+        sys.stderr.write("Get https://mirror.lan:5000/v2/: connection refused\\n")
+        sys.exit(1)
+""")
+
+
+@pytest.fixture
+def fake_docker(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(FAKE_DOCKER.format(python=sys.executable, canonical=DOCKER_IMAGE_FULL))
+    docker.chmod(docker.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "docker.log"
+    log.write_text("")
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_DOCKER_LOG", str(log))
+    monkeypatch.setenv("FAKE_IMAGE", MIRROR_REF)
+    monkeypatch.delenv("FAKE_MIRROR_DOWN", raising=False)
+    return log
+
+
+def _update(log):
+    results = asyncio.run(fleet.Fleet([fleet.LOCAL_HOST]).bulk("update"))
+    return results[0], [line for line in log.read_text().splitlines() if line.split()[0] in ("pull", "tag")]
+
+
+def test_update_pulls_from_the_mirror_the_compose_file_runs(fake_docker):
+    (_, success, _), calls = _update(fake_docker)
+    assert success
+    assert calls == [f"pull -q {MIRROR_REF}", f"tag {MIRROR_REF} {DOCKER_IMAGE_FULL}"]
+
+
+def test_update_falls_back_to_docker_hub_and_retags_mirror_ref(fake_docker, monkeypatch):
+    monkeypatch.setenv("FAKE_MIRROR_DOWN", "1")
+    (_, success, _), calls = _update(fake_docker)
+    assert success
+    assert calls == [f"pull -q {MIRROR_REF}", f"pull -q {DOCKER_IMAGE_FULL}",
+                     f"tag {DOCKER_IMAGE_FULL} {MIRROR_REF}"]
+
+
+def test_update_without_mirror_pulls_canonical_image(fake_docker, monkeypatch):
+    monkeypatch.setenv("FAKE_IMAGE", DOCKER_IMAGE_FULL)
+    (_, success, _), calls = _update(fake_docker)
+    assert success
+    assert calls == [f"pull -q {DOCKER_IMAGE_FULL}"]
+
+
+def test_image_pull_plan():
+    assert docker_ops.image_pull_plan(None) == [(DOCKER_IMAGE_FULL, [])]
+    assert docker_ops.image_pull_plan(DOCKER_IMAGE_FULL) == [(DOCKER_IMAGE_FULL, [])]
+    assert docker_ops.image_pull_plan(MIRROR_REF) == [
+        (MIRROR_REF, [DOCKER_IMAGE_FULL]),
+        (DOCKER_IMAGE_FULL, [MIRROR_REF]),
+    ]
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Tests for the Docker host profile behind the resource limits (docker_ops.get_host_profile)."""
+
+import pytest
+
+import docker_ops
+
+GIB = 1024 ** 3
+
+
+@pytest.fixture
+def prefs(monkeypatch):
+    stored = {}
+    monkeypatch.setattr(docker_ops, "load_launcher_prefs", lambda: dict(stored))
+    monkeypatch.setattr(docker_ops, "save_launcher_prefs", lambda new: stored.update(new) or True)
+    monkeypatch.setattr(docker_ops, "_host_profiles", {})
+    monkeypatch.setattr(docker_ops, "remote_hostname", lambda: "observatory-pc")
+    return stored
+
+
+def test_keeps_the_last_profile_while_docker_info_fails(prefs, monkeypatch):
+    monkeypatch.setattr(docker_ops, "run_command", lambda *args, **kwargs: (f"6 {8 * GIB}\n", "", 0))
+    assert docker_ops.get_host_profile() == (6, 8 * GIB)
+    assert prefs["host_profiles"] == {"observatory-pc": [6, 8 * GIB]}
+
+    # Next session, with the daemon not answering
+    monkeypatch.setattr(docker_ops, "_host_profiles", {})
+    monkeypatch.setattr(docker_ops, "run_command", lambda *args, **kwargs: ("", "Cannot connect", 1))
+    assert docker_ops.get_host_profile() == (6, 8 * GIB)
+
+
+def test_profiles_are_kept_per_host(prefs, monkeypatch):
+    prefs["host_profiles"] = {"observatory-pc": [6, 8 * GIB]}
+    monkeypatch.setattr(docker_ops, "remote_hostname", lambda: "pier-nuc")
+    monkeypatch.setattr(docker_ops, "run_command", lambda *args, **kwargs: ("", "Cannot connect", 1))
+    assert docker_ops.get_host_profile() != (6, 8 * GIB)
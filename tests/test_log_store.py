@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Tests for the log viewer's backing store (log_store.py)."""
+
+import os
+
+import pytest
+
+from log_store import LogStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LogStore(spill_path=str(tmp_path / "spill"), memory_lines=10, max_lines=100)
+    yield store
+    store.close()
+
+
+def _fill(store, count):
+    for i in range(count):
+        level = "warn" if i % 10 == 0 else "info"
+        store.append(f"line {i} token{i % 7} unique{i}", level=level)
+
+
+def test_reads_lines_from_spill_and_ring(store):
+    _fill(store, 50)
+    assert store.get(0) == ("line 0 token0 unique0", "warn", "launcher")
+    assert store.get(49)[0] == "line 49 token0 unique49"
+    assert list(store.filter(query="token4 unique10")) == []
+    assert list(store.filter(query="token3")) == [i for i in range(50) if i % 7 == 3]
+
+
+def test_oldest_lines_are_dropped_in_batches(store, tmp_path):
+    _fill(store, 1000)
+    assert 100 <= len(store) <= 125
+    first = store.first_line
+    assert first + len(store) == 1000
+
+    # Everything still stored reads back, from the spill file and the ring
+    for line in range(first, 1000):
+        assert store.get(line)[0].startswith(f"line {line} ")
+    assert store.get(first - 1) == ("", "", "")
+
+    # The spill file only holds the stored lines
+    expected = sum(len(f"line {i} token{i % 7} unique{i}\n") for i in range(first, 1000))
+    assert os.path.getsize(tmp_path / "spill") == expected
+
+
+def test_indexes_only_hold_stored_lines(store):
+    _fill(store, 1000)
+    first = store.first_line
+    assert list(store.filter(levels=["warn"])) == [i for i in range(first, 1000) if i % 10 == 0]
+    assert list(store.filter(query="token5")) == [i for i in range(first, 1000) if i % 7 == 5]
+    assert list(store.filter(query="unique3")) == []
+    # Tokens of dropped lines leave the index entirely ("123" and "unique123"
+    # per line, plus the shared words)
+    assert len(store._tokens) <= 2 * len(store) + 8
+    assert all(postings[0] >= first for postings in store._tokens.values())
+
+
+def test_line_numbers_keep_counting(store):
+    _fill(store, 500)
+    line = store.append("after the drop", level="error")
+    assert line == 500
+    assert store.get(line) == ("after the drop", "error", "launcher")
+    assert list(store.filter(levels=["error"])) == [500]
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Tests for removing superseded Nova images (docker_ops.prune_images)."""
+
+import pytest
+
+import docker_ops
+from config import DOCKER_IMAGE, DOCKER_IMAGE_FULL
+
+MIRROR = "mirror.lan:5000"
+MIRRORED = f"{MIRROR}/{DOCKER_IMAGE}"
+
+
+class ImageStore:
+    """The part of the docker CLI prune_images uses, with Docker's reference rules."""
+
+    def __init__(self, images, container_image):
+        # id -> {"created", "size", "refs"}; refs are tags ("repo:tag") and digests ("repo@sha256:...")
+        self.images = images
+        self.container_image = container_image
+
+    def resolve(self, ref):
+        if ref in self.images:
+            return ref
+        return next((image_id for image_id, image in self.images.items() if ref in image["refs"]), None)
+
+    def remove(self, ref):
+        image_id = self.resolve(ref)
+        if image_id is None:
+            return f"Error: No such image: {ref}"
+        refs = self.images[image_id]["refs"]
+        if ref == image_id:
+            if len({self.repo(r) for r in refs}) > 1:
+                return f"Error: conflict: unable to delete {ref} (must be forced) - image is referenced in multiple repositories"
+            refs.clear()
+        else:
+            refs.remove(ref)
+            if "@" not in ref:
+                # Untagging drops digests of that repository once no tag of it is left
+                repo = self.repo(ref)
+                if not any("@" not in r and self.repo(r) == repo for r in refs):
+                    refs[:] = [r for r in refs if self.repo(r) != repo]
+        if not refs:
+            del self.images[image_id]
+        return None
+
+    def run(self, args, **kwargs):
+        args = args[1:]
+        if args[:2] == ["image", "ls"] and "dangling=true" in args:
+            return "\n".join(i for i, image in self.images.items() if not self.tags(image)), "", 0
+        if args[:2] == ["image", "ls"]:
+            lines = [f"{i}\t{tag}" for i, image in self.images.items() for tag in self.tags(image)]
+            lines += [f"{i}\t<none>:<none>" for i, image in self.images.items() if not self.tags(image)]
+            return "\n".join(lines), "", 0
+        if args[:2] == ["image", "inspect"] and args[2] == "--format":
+            lines = []
+            for image_id in args[4:]:
+                image = self.images[image_id]
+                digests = [r for r in image["refs"] if "@" in r]
+                lines.append("\t".join([image_id, image["created"], str(image["size"]),
+                                        ",".join(self.tags(image)), ",".join(digests)]))
+            return "\n".join(lines), "", 0
+        if args[:2] == ["image", "inspect"]:
+            image_id = self.resolve(args[2])
+            return (image_id, "", 0) if image_id else ("", f"Error: No such image: {args[2]}", 1)
+        if args[0] == "inspect":
+            return self.container_image, "", 0
+        if args[:2] == ["image", "rm"]:
+            errors = [e for e in (self.remove(ref) for ref in args[2:]) if e]
+            return "", "\n".join(errors), 1 if errors else 0
+        pytest.fail(f"unexpected docker call: {args}")
+
+    @staticmethod
+    def repo(ref):
+        return ref.partition("@")[0] if "@" in ref else ref.rpartition(":")[0]
+
+    @staticmethod
+    def tags(image):
+        return [r for r in image["refs"] if "@" not in r]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = ImageStore({
+        "sha256:current": {"created": "2026-03-01T00:00:00Z", "size": 500, "refs": [
+            DOCKER_IMAGE_FULL, f"{MIRRORED}:latest", f"{DOCKER_IMAGE}@sha256:c", f"{MIRRORED}@sha256:c"]},
+        # Superseded, left with digests from Docker Hub and the mirror
+        "sha256:previous": {"created": "2026-02-01T00:00:00Z", "size": 400, "refs": [
+            f"{DOCKER_IMAGE}@sha256:p", f"{MIRRORED}@sha256:p"]},
+        # Only ever pulled through the mirror
+        "sha256:mirror-only": {"created": "2026-01-01T00:00:00Z", "size": 300, "refs": [
+            f"{MIRRORED}:2026.1", f"{MIRRORED}@sha256:m"]},
+        # Retagged by the user under their own repository
+        "sha256:forked": {"created": "2025-12-01T00:00:00Z", "size": 200, "refs": [
+            f"{MIRRORED}:2025.12", "observatory/tracker:keep"]},
+        "sha256:postgres": {"created": "2025-11-01T00:00:00Z", "size": 100, "refs": ["postgres:16"]},
+    }, container_image="sha256:current")
+    monkeypatch.setattr(docker_ops, "run_command", store.run)
+    monkeypatch.setattr(docker_ops, "get_registry_mirror", lambda: MIRROR)
+    return store
+
+
+def test_removes_mirrored_and_multi_repository_images(store):
+    success, message, reclaimed = docker_ops.prune_images()
+
+    assert success, message
+    assert message == "Removed 2 old Nova image(s)"
+    assert reclaimed == 400 + 300
+    assert set(store.images) == {"sha256:current", "sha256:forked", "sha256:postgres"}
+    assert store.images["sha256:forked"]["refs"] == ["observatory/tracker:keep"]
+
+
+def test_keeps_the_newest_previous_images(store):
+    success, message, reclaimed = docker_ops.prune_images(keep_previous=1)
+
+    assert message == "Removed 1 old Nova image(s)"
+    assert "sha256:previous" in store.images
+    assert "sha256:mirror-only" not in store.images
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the registry mirror and update detection (docker_ops.py).
+
+A stub speaking the registry:2 manifest API serves image indexes in the
+shape Docker Hub publishes for the tracker (amd64 and arm64 images plus
+their attestation manifests), from tests/manifests.
+"""
+
+import hashlib
+import http.server
+import json
+import os
+import threading
+
+import pytest
+
+import docker_ops
+from config import DOCKER_IMAGE, DOCKER_IMAGE_FULL
+
+MANIFEST_DIR = os.path.join(os.path.dirname(__file__), "manifests")
+AMD64 = {"os": "linux", "architecture": "amd64", "variant": ""}
+ARM64 = {"os": "linux", "architecture": "arm64", "variant": "v8"}
+
+
+def _load(name):
+    with open(os.path.join(MANIFEST_DIR, name), "rb") as f:
+        body = f.read()
+    return body, "sha256:" + hashlib.sha256(body).hexdigest()
+
+
+RELEASE, RELEASE_DIGEST = _load("index_1.2.8.json")
+ARM_REBUILD, ARM_REBUILD_DIGEST = _load("index_1.2.8_arm64_rebuild.json")
+NEXT, NEXT_DIGEST = _load("index_1.2.9.json")
+
+
+class RegistryStub:
+    """Serves /v2/ and /v2/<repo>/manifests/<tag or digest> like registry:2."""
+
+    def __init__(self, auth_required=False):
+        self.tags = {}
+        self.blobs = {}
+        self.requests = []
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def _manifest(self):
+                stub.requests.append((self.command, self.path))
+                if self.path == "/v2/":
+                    if auth_required:
+                        self.send_response(401)
+                        self.send_header("WWW-Authenticate", 'Bearer realm="https://auth.example/token"')
+                        self.end_headers()
+                        return None
+                    self.send_response(200)
+                    self.end_headers()
+                    return b"{}"
+                prefix = f"/v2/{DOCKER_IMAGE}/manifests/"
+                reference = self.path[len(prefix):] if self.path.startswith(prefix) else None
+                digest = stub.tags.get(reference, reference)
+                body = stub.blobs.get(digest)
+                if body is None:
+                    self.send_error(404)
+                    return None
+                self.send_response(200)
+                self.send_header("Content-Type", "application/vnd.oci.image.index.v1+json")
+                self.send_header("Docker-Content-Digest", digest)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                return body
+
+            def do_HEAD(self):
+                self._manifest()
+
+            def do_GET(self):
+                body = self._manifest()
+                if body is not None:
+                    self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.address = f"127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def publish(self, body, digest):
+        self.blobs[digest] = body
+        self.tags["latest"] = digest
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def mirror(monkeypatch):
+    stub = RegistryStub()
+    for body, digest in ((RELEASE, RELEASE_DIGEST), (ARM_REBUILD, ARM_REBUILD_DIGEST), (NEXT, NEXT_DIGEST)):
+        stub.blobs[digest] = body
+    stub.tags["latest"] = RELEASE_DIGEST
+    monkeypatch.setattr(docker_ops, "load_launcher_prefs",
+                        lambda: {"registry_mirror": f"http://{stub.address}/"})
+    monkeypatch.setattr(docker_ops, "_mirror_probe_cache", {})
+    monkeypatch.setattr(docker_ops, "get_local_image_digests", lambda *args: [RELEASE_DIGEST])
+    monkeypatch.setattr(docker_ops, "get_host_platform", lambda: AMD64)
+    # Docker Hub must not be consulted while the mirror answers
+    monkeypatch.setattr(docker_ops, "_docker_hub_token", lambda: pytest.fail("asked Docker Hub"))
+    yield stub
+    stub.close()
+
+
+def test_mirror_settings(mirror):
+    assert docker_ops.get_registry_mirror() == mirror.address
+    assert docker_ops.get_mirror_image_ref(mirror.address) == f"{mirror.address}/{DOCKER_IMAGE_FULL}"
+    assert docker_ops.get_compose_image_ref() == f"{mirror.address}/{DOCKER_IMAGE_FULL}"
+    assert docker_ops.is_mirror_reachable(mirror.address)
+
+
+def test_mirror_requiring_auth_counts_as_reachable(monkeypatch):
+    stub = RegistryStub(auth_required=True)
+    try:
+        monkeypatch.setattr(docker_ops, "load_launcher_prefs",
+                            lambda: {"registry_mirror": f"http://{stub.address}"})
+        monkeypatch.setattr(docker_ops, "_mirror_probe_cache", {})
+        assert docker_ops.is_mirror_reachable(stub.address)
+    finally:
+        stub.close()
+
+
+def test_unreachable_mirror_is_cached(monkeypatch):
+    stub = RegistryStub()
+    address = stub.address
+    stub.close()
+    monkeypatch.setattr(docker_ops, "load_launcher_prefs", lambda: {"registry_mirror": f"http://{address}"})
+    monkeypatch.setattr(docker_ops, "_mirror_probe_cache", {})
+    assert not docker_ops.is_mirror_reachable(address)
+    assert docker_ops._mirror_probe_cache[address][1] is False
+
+
+def test_no_update_uses_head_only(mirror):
+    assert docker_ops.check_dockerhub_version() == (False, RELEASE_DIGEST, None)
+    assert [m for m, path in mirror.requests if "/manifests/" in path] == ["HEAD"]
+
+
+def test_new_release_is_an_update(mirror):
+    mirror.tags["latest"] = NEXT_DIGEST
+    assert docker_ops.check_dockerhub_version() == (True, NEXT_DIGEST, None)
+
+
+def test_rebuild_of_another_platform_is_not_an_update(mirror):
+    mirror.tags["latest"] = ARM_REBUILD_DIGEST
+    update_available, remote_digest, error = docker_ops.check_dockerhub_version()
+    assert (update_available, error) == (False, None)
+    assert remote_digest == ARM_REBUILD_DIGEST
+
+
+def test_rebuild_of_own_platform_is_an_update(mirror, monkeypatch):
+    monkeypatch.setattr(docker_ops, "get_host_platform", lambda: ARM64)
+    mirror.tags["latest"] = ARM_REBUILD_DIGEST
+    assert docker_ops.check_dockerhub_version() == (True, ARM_REBUILD_DIGEST, None)
+
+
+def test_compare_image_digests_for_fleet_host(mirror):
+    mirror.tags["latest"] = ARM_REBUILD_DIGEST
+    fetch = docker_ops.registry_manifest_source()
+    assert docker_ops.compare_image_digests([RELEASE_DIGEST], AMD64, fetch)[0] is False
+    assert docker_ops.compare_image_digests([RELEASE_DIGEST], ARM64, fetch)[0] is True
+    assert docker_ops.compare_image_digests([], ARM64, fetch) == (True, ARM_REBUILD_DIGEST, None)
+
+
+@pytest.mark.parametrize("host, expected", [
+    (AMD64, "amd64-1.2.8"),
+    (ARM64, "arm64-1.2.8"),
+    ({"os": "linux", "architecture": "arm64", "variant": ""}, "arm64-1.2.8"),
+    ({"os": "linux", "architecture": "arm", "variant": "v7"}, None),
+    ({"os": "windows", "architecture": "amd64", "variant": ""}, None),
+    ({"os": "unknown", "architecture": "unknown", "variant": ""}, None),
+])
+def test_select_platform_manifest_from_recorded_index(host, expected):
+    index = json.loads(RELEASE)
+    digest = docker_ops.select_platform_manifest(index, host)
+    assert digest == (None if expected is None else "sha256:" + hashlib.sha256(expected.encode()).hexdigest())
+
+
+def test_select_platform_manifest_variants():
+    index = {"manifests": [
+        {"digest": "sha256:v6", "platform": {"os": "linux", "architecture": "arm", "variant": "v6"}},
+        {"digest": "sha256:any", "platform": {"os": "linux", "architecture": "arm"}},
+        {"digest": "sha256:v7", "platform": {"os": "linux", "architecture": "arm", "variant": "v7"}},
+    ]}
+    # An entry without a variant means the default one (v7) for arm
+    assert docker_ops.select_platform_manifest(index, {"os": "linux", "architecture": "arm", "variant": "v7"}) \
+        == "sha256:any"
+    assert docker_ops.select_platform_manifest(index, {"os": "linux", "architecture": "arm", "variant": "v6"}) \
+        == "sha256:v6"
+    assert docker_ops.select_platform_manifest(index, {"os": "linux", "architecture": "arm", "variant": "v5"}) \
+        == "sha256:any"
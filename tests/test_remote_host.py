@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Tests for the remote Docker host tunnel (remote_host.py), using an ssh stand-in."""
+
+import os
+import socket
+import stat
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+import remote_host
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="unix socket forwarding")
+
+# Stands in for OpenSSH: forwards the -L local socket to the remote socket
+# path (here a socket on this machine playing the remote Docker daemon),
+# fails for hosts named "unreachable", warns at length for hosts named
+# "chatty", takes a while for hosts named "slow", and records its arguments
+FAKE_SSH = textwrap.dedent("""\
+    #!{python}
+    import os, socket, sys, threading, time
+    args = sys.argv[1:]
+    with open(os.environ["FAKE_SSH_LOG"], "a") as log:
+        log.write(" ".join(args) + "\\n")
+    if args[-1].endswith("unreachable"):
+        sys.stderr.write("ssh: connect to host unreachable port 22: Connection refused\\n")
+        sys.exit(255)
+    if args[-1].endswith("chatty"):
+        # Far more than a pipe buffer holds
+        for i in range(20000):
+            sys.stderr.write(f"Warning: keepalive {{i}} went unanswered\\n")
+        sys.stderr.flush()
+    if args[-1].endswith("slow"):
+        time.sleep(2)
+    local, remote = args[args.index("-L") + 1].split(":", 1)
+    server = socket.socket(socket.AF_UNIX)
+    server.bind(local)
+    server.listen()
+
+    def pipe(src, dst):
+        while True:
+            data = src.recv(65536)
+            if not data:
+                break
+            dst.sendall(data)
+        # close() would not send EOF while the other pipe thread is in recv()
+        dst.shutdown(socket.SHUT_WR)
+
+    while True:
+        client, _ = server.accept()
+        upstream = socket.socket(socket.AF_UNIX)
+        upstream.connect(remote)
+        threading.Thread(target=pipe, args=(client, upstream), daemon=True).start()
+        threading.Thread(target=pipe, args=(upstream, client), daemon=True).start()
+""")
+
+
+@pytest.fixture
+def fake_ssh(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    ssh = bin_dir / "ssh"
+    ssh.write_text(FAKE_SSH.format(python=sys.executable))
+    ssh.chmod(ssh.stat().st_mode | stat.S_IEXEC)
+    log = tmp_path / "ssh.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_SSH_LOG", str(log))
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+
+    # Socket paths are limited to ~100 bytes; keep the tunnel's short
+    nova_dir = tmp_path / "n"
+    nova_dir.mkdir()
+    monkeypatch.setattr(remote_host, "NOVA_DIR", str(nova_dir))
+
+    # The "remote" Docker socket answers every connection with a fixed reply
+    daemon_path = str(tmp_path / "docker.sock")
+    daemon = socket.socket(socket.AF_UNIX)
+    daemon.bind(daemon_path)
+    daemon.listen()
+
+    def answer(conn):
+        # The tunnel's readiness check connects and hangs up at once
+        with conn:
+            if conn.recv(1024):
+                conn.sendall(b"docker says hi")
+
+    def serve():
+        while True:
+            try:
+                conn, _ = daemon.accept()
+            except OSError:
+                return
+            threading.Thread(target=answer, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield {"log": log, "daemon_path": daemon_path}
+    remote_host.configure(None, None)
+    daemon.close()
+
+
+def test_tunnel_forwards_to_remote_socket(fake_ssh):
+    tunnel = remote_host.SSHTunnel(f"ssh://astro@pier1{fake_ssh['daemon_path']}")
+    try:
+        assert tunnel.ensure(), tunnel.last_error
+        path = tunnel.docker_host[len("unix://"):]
+        with socket.socket(socket.AF_UNIX) as s:
+            s.settimeout(5)
+            s.connect(path)
+            s.sendall(b"GET /_ping")
+            assert s.recv(1024) == b"docker says hi"
+
+        args = fake_ssh["log"].read_text().split()
+        assert "BatchMode=yes" in args
+        assert "ControlMaster=yes" in args
+        assert args[-1] == "astro@pier1"
+    finally:
+        tunnel.stop()
+    assert not os.path.exists(path)
+
+
+def test_tunnel_is_reused(fake_ssh):
+    tunnel = remote_host.SSHTunnel(f"ssh://pier1{fake_ssh['daemon_path']}")
+    try:
+        assert tunnel.ensure()
+        started = time.monotonic()
+        assert tunnel.ensure()
+        assert time.monotonic() - started < 0.1
+        assert len(fake_ssh["log"].read_text().splitlines()) == 1
+    finally:
+        tunnel.stop()
+
+
+def test_failure_reports_ssh_error_and_backs_off(fake_ssh):
+    tunnel = remote_host.SSHTunnel("ssh://unreachable")
+    assert not tunnel.ensure()
+    assert "Connection refused" in tunnel.last_error
+    # Within the retry interval, no new ssh process is started
+    assert not tunnel.start()
+    assert len(fake_ssh["log"].read_text().splitlines()) == 1
+    tunnel.reset_backoff()
+    assert tunnel.start()
+    tunnel.stop()
+
+
+def test_tunnel_survives_ssh_warnings(fake_ssh):
+    tunnel = remote_host.SSHTunnel(f"ssh://chatty{fake_ssh['daemon_path']}")
+    try:
+        assert tunnel.ensure(), tunnel.last_error
+    finally:
+        tunnel.stop()
+
+
+def test_apply_to_env_does_not_wait_for_another_threads_connect(fake_ssh):
+    remote_host.configure(f"ssh://slow{fake_ssh['daemon_path']}")
+    connecting = threading.Thread(target=remote_host.apply_to_env, args=({},))
+    connecting.start()
+    time.sleep(0.5)
+
+    started = time.monotonic()
+    env = remote_host.apply_to_env({})
+    assert time.monotonic() - started < 0.5
+    assert env["DOCKER_HOST"] == "ssh://slow"
+
+    connecting.join()
+    assert remote_host.apply_to_env({})["DOCKER_HOST"].startswith("unix://")
+
+
+def test_apply_to_env_uses_tunnel(fake_ssh):
+    remote_host.configure(f"ssh://pier1{fake_ssh['daemon_path']}")
+    env = remote_host.apply_to_env({"DOCKER_CONTEXT": "desktop-linux"})
+    assert env["DOCKER_HOST"].startswith("unix://")
+    assert "DOCKER_CONTEXT" not in env
+    assert remote_host.is_remote()
+    assert remote_host.remote_hostname() == "pier1"
+    assert remote_host.dashboard_url() == "http://pier1:5001"
+    assert remote_host.remote_data_notice()
+
+
+def test_apply_to_env_falls_back_to_ssh_url(fake_ssh):
+    remote_host.configure("ssh://unreachable/var/run/docker.sock")
+    env = remote_host.apply_to_env({})
+    assert env["DOCKER_HOST"] == "ssh://unreachable"
+    assert "Connection refused" in remote_host.last_error()
+
+
+def test_tcp_host_is_passed_through(fake_ssh):
+    remote_host.configure("tcp://dome:2376")
+    assert remote_host.apply_to_env({})["DOCKER_HOST"] == "tcp://dome:2376"
+    assert remote_host.dashboard_url(5002) == "http://dome:5002"
+
+
+def test_instance_data_actions_refuse_remote_host(fake_ssh, tmp_path, monkeypatch):
+    import snapshots
+
+    instance = tmp_path / "instance"
+    instance.mkdir()
+    (instance / "app.db").write_bytes(b"local copy, not the tracker's")
+    monkeypatch.setattr(snapshots, "INSTANCE_DIR", str(instance))
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+
+    remote_host.configure("tcp://dome:2376")
+    for ok, message in (snapshots.create_snapshot(),
+                        snapshots.restore_snapshot("20260101-000000"),
+                        snapshots.seed_instance("20260101-000000", str(tmp_path / "copy"))):
+        assert not ok
+        assert "dome" in message
+    assert not (tmp_path / "snapshots").exists()
+    assert not (tmp_path / "copy").exists()
+
+    remote_host.configure(None, None)
+    assert remote_host.remote_data_notice() is None
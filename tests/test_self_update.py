@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Tests for the launcher self-update download (self_update.py), against a local release server."""
+
+import hashlib
+import http.server
+import sys
+import threading
+
+import pytest
+
+import self_update
+
+# What GitHub publishes for the workflow's upload of "Nova DSO Tracker.exe"
+UPLOADED_NAME = "Nova DSO Tracker.exe"
+PUBLISHED_NAME = "Nova.DSO.Tracker.exe"
+PAYLOAD = b"MZ" + bytes(range(256)) * 64
+
+
+@pytest.fixture
+def release_server(tmp_path, monkeypatch):
+    files = {
+        f"/download/{PUBLISHED_NAME}": PAYLOAD,
+        # sha256sum runs before the upload, so it lists the original name
+        "/download/SHA256SUMS": f"{hashlib.sha256(PAYLOAD).hexdigest()}  {UPLOADED_NAME}\n".encode(),
+    }
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = files.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/download"
+
+    monkeypatch.setattr(self_update, "LAUNCHER_ASSETS", {sys.platform: UPLOADED_NAME})
+    monkeypatch.setattr(self_update, "LAUNCHER_UPDATE_DIR", str(tmp_path / "launcher_update"))
+    release = {
+        "tag_name": "v99.0.0",
+        "assets": [
+            {"name": name, "browser_download_url": f"{base}/{name}", "size": len(files[f"/download/{name}"])}
+            for name in (PUBLISHED_NAME, "SHA256SUMS")
+        ],
+    }
+    yield release
+    server.shutdown()
+
+
+def test_release_asset_name():
+    assert self_update.release_asset_name(UPLOADED_NAME) == PUBLISHED_NAME
+    assert self_update.release_asset_name("Nova-DSO-Tracker-macOS.zip") == "Nova-DSO-Tracker-macOS.zip"
+
+
+def test_finds_renamed_asset_and_its_checksum(release_server):
+    asset = self_update.find_release_asset(release_server)
+    assert asset is not None
+    assert asset["url"].endswith(PUBLISHED_NAME)
+    assert asset["sha256"] == hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def test_stages_verified_download(release_server):
+    ok, message = self_update.stage_update(release_server, rate=0)
+    assert ok, message
+    staged = self_update.get_staged_update()
+    assert staged["version"] == "99.0.0"
+    with open(staged["path"], "rb") as f:
+        assert f.read() == PAYLOAD
+
+
+def test_rejects_checksum_mismatch(release_server, monkeypatch):
+    monkeypatch.setattr(self_update, "file_sha256", lambda path: "0" * 64)
+    ok, message = self_update.stage_update(release_server, rate=0)
+    assert not ok
+    assert "Checksum mismatch" in message
+    assert self_update.get_staged_update() is None
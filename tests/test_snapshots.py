@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""Tests for instance snapshots (snapshots.py)."""
+
+import os
+import sqlite3
+import threading
+
+import pytest
+
+import snapshots
+
+
+@pytest.fixture
+def instance(tmp_path, monkeypatch):
+    instance_dir = tmp_path / "instance"
+    (instance_dir / "cache").mkdir(parents=True)
+    (instance_dir / "cache" / "catalog.json").write_text("{}")
+    monkeypatch.setattr(snapshots, "INSTANCE_DIR", str(instance_dir))
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    monkeypatch.setattr(snapshots, "load_launcher_prefs", lambda: {})
+    monkeypatch.setattr(snapshots, "remote_data_notice", lambda: None)
+    return instance_dir
+
+
+def _wal_database(path):
+    db = sqlite3.connect(path, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("CREATE TABLE t (x INTEGER)")
+    db.commit()
+    return db
+
+
+def test_database_snapshot_is_consistent_while_written(instance):
+    db = _wal_database(str(instance / "app.db"))
+    stop = threading.Event()
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            db.execute("INSERT INTO t VALUES (?)", (i,))
+            db.commit()
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        success, msg = snapshots.create_snapshot(label="test")
+    finally:
+        stop.set()
+        thread.join()
+    assert success, msg
+
+    snapshot = snapshots.list_snapshots()[0]
+    data = os.path.join(snapshot["path"], snapshots.DATA_DIRNAME)
+    assert not os.path.exists(os.path.join(data, "app.db-wal"))
+    copy = sqlite3.connect(os.path.join(data, "app.db"))
+    assert copy.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+    copy.close()
+
+
+def test_unchanged_files_are_hardlinked(instance):
+    assert snapshots.create_snapshot()[0]
+    first = snapshots.list_snapshots()[0]
+    assert snapshots.create_snapshot()[0]
+    second = [s for s in snapshots.list_snapshots() if s["id"] != first["id"]][0]
+
+    rel = os.path.join(snapshots.DATA_DIRNAME, "cache", "catalog.json")
+    assert os.path.samefile(os.path.join(first["path"], rel), os.path.join(second["path"], rel))
+    assert second["copied_bytes"] == 0
+
+
+def test_restore_round_trip(instance):
+    assert snapshots.create_snapshot()[0]
+    snapshot_id = snapshots.list_snapshots()[0]["id"]
+    (instance / "cache" / "catalog.json").write_text("changed")
+
+    success, msg = snapshots.restore_snapshot(snapshot_id)
+    assert success, msg
+    assert (instance / "cache" / "catalog.json").read_text() == "{}"
+
+
+def test_seed_instance_links_files_and_restores_databases(instance, tmp_path):
+    db = _wal_database(str(instance / "app.db"))
+    db.execute("INSERT INTO t VALUES (1)")
+    db.commit()
+    assert snapshots.create_snapshot()[0]
+    snapshot = snapshots.list_snapshots()[0]
+    dest = tmp_path / "candidate"
+
+    success, msg = snapshots.seed_instance(snapshot["id"], str(dest))
+    db.close()
+    assert success, msg
+    assert sorted(os.listdir(dest)) == ["app.db", "cache"]
+    data = os.path.join(snapshot["path"], snapshots.DATA_DIRNAME)
+    assert os.path.samefile(dest / "cache" / "catalog.json", os.path.join(data, "cache", "catalog.json"))
+    # The candidate writes to its databases, never to the snapshot's
+    assert not os.path.samefile(dest / "app.db", os.path.join(data, "app.db"))
+    copy = sqlite3.connect(str(dest / "app.db"))
+    assert copy.execute("SELECT COUNT(*) FROM t").fetchone() == (1,)
+    copy.close()
+
+
+def test_promote_databases_only_when_unchanged(instance, tmp_path):
+    db = _wal_database(str(instance / "app.db"))
+    assert snapshots.create_snapshot()[0]
+    snapshot_id = snapshots.list_snapshots()[0]["id"]
+    dest = tmp_path / "candidate"
+    assert snapshots.seed_instance(snapshot_id, str(dest))[0]
+    assert snapshots.databases_unchanged(snapshot_id)
+
+    # The new version migrates its copy
+    candidate = sqlite3.connect(str(dest / "app.db"))
+    candidate.execute("ALTER TABLE t ADD COLUMN y TEXT")
+    candidate.commit()
+    candidate.close()
+
+    db.close()
+    success, msg = snapshots.promote_databases(str(dest), snapshot_id)
+    assert success, msg
+    live = sqlite3.connect(str(instance / "app.db"))
+    assert [row[1] for row in live.execute("PRAGMA table_info(t)")] == ["x", "y"]
+    # A write after the snapshot makes the candidate's copy stale
+    live.execute("INSERT INTO t VALUES (1, 'a')")
+    live.commit()
+    live.close()
+    assert not snapshots.databases_unchanged(snapshot_id)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Tests for the concurrent state probes (state_probe.py)."""
+
+import threading
+import time
+
+import pytest
+
+import state_probe
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Replace the real probes with instant, healthy ones; tests override entries."""
+    fakes = {
+        "installed": lambda: True,
+        "daemon": lambda: (True, "running"),
+        "compose": lambda: True,
+        "container": lambda: (True, "Up 2 minutes (healthy)"),
+        "web": lambda: True,
+    }
+    monkeypatch.setattr(state_probe, "PROBES", fakes)
+    monkeypatch.setattr(state_probe, "_inflight", {})
+    return fakes
+
+
+def test_fast_dashboard_decides_before_slow_daemon(probes):
+    release = threading.Event()
+
+    def slow_daemon():
+        release.wait(5)
+        return True, "running"
+
+    probes["daemon"] = slow_daemon
+    results = {}
+    daemon_seen = threading.Event()
+
+    def on_result(name, result):
+        results[name] = result
+        if name == "daemon":
+            daemon_seen.set()
+
+    assert state_probe.probe_state(on_result=on_result) == "running"
+    assert "daemon" not in results
+
+    # The daemon result still reaches the callback after the decision
+    release.set()
+    assert daemon_seen.wait(5)
+    assert results["daemon"] == (True, "running")
+
+
+def test_slow_probe_is_joined_not_restarted(probes):
+    calls = []
+    release = threading.Event()
+
+    def slow_daemon():
+        calls.append(1)
+        release.wait(5)
+        return True, "running"
+
+    probes["daemon"] = slow_daemon
+    state_probe.probe_state()
+    state_probe.probe_state()
+    release.set()
+    assert len(calls) == 1
+
+
+def test_worst_case_is_slowest_probe(probes):
+    def slow(value, delay=0.3):
+        def probe():
+            time.sleep(delay)
+            return value
+        return probe
+
+    probes.update(
+        daemon=slow((True, "running")),
+        container=slow((True, "Up 1 minute")),
+        web=slow(False),
+    )
+    started = time.monotonic()
+    assert state_probe.probe_state() == "initializing"
+    assert time.monotonic() - started < 0.8
+
+
+@pytest.mark.parametrize("results, expected", [
+    ({"installed": False}, "docker_missing"),
+    ({"web": True}, "running"),
+    ({"installed": True, "daemon": (False, "stopped")}, "docker_stopped"),
+    ({"installed": True, "daemon": (True, "running"), "compose": False}, "not_installed"),
+    ({"daemon": (True, "running"), "compose": True, "container": (False, "")}, "stopped"),
+    ({"daemon": (True, "running"), "compose": True, "container": (True, "Up 1 minute (Paused)")}, "paused"),
+    ({"daemon": (True, "running"), "compose": True, "container": (True, "Up 1 minute")}, None),
+    ({"daemon": (True, "running"), "compose": True, "container": (True, "Up 1 minute (health: starting)")},
+     "initializing"),
+    ({"daemon": (True, "running"), "compose": True, "container": (True, "Up 1 minute (healthy)")}, "running"),
+    ({"daemon": (True, "running"), "compose": True, "container": (True, "Up 9 minutes (unhealthy)")},
+     "unhealthy"),
+    ({"daemon": (True, "running")}, None),
+])
+def test_decide_state(results, expected):
+    assert state_probe.decide_state(results) == expected
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+UI stall budget: the launcher's usual UI paths must not block the Tk loop.
+
+Runs the real launcher window in a subprocess (so config paths follow a
+temporary HOME) against a docker CLI stand-in that takes seconds to answer
+and names a remote context, with the stall detector on. Any Docker or disk
+work left on the Tk thread shows up as a stall.
+"""
+
+import json
+import os
+import stat
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+pytestmark = pytest.mark.skipif(
+    sys.platform.startswith("linux") and not os.environ.get("DISPLAY"),
+    reason="needs a display",
+)
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Longest the Tk loop may be blocked during the exercised paths
+STALL_BUDGET = 0.5
+
+SLOW_DOCKER = textwrap.dedent("""\
+    #!{python}
+    import sys, time
+    time.sleep(2)
+    if sys.argv[1:3] == ["context", "inspect"]:
+        print("tcp://dome.invalid:2376")
+    else:
+        sys.exit(1)
+""")
+
+# Drives the window: a state refresh resolving the remote host, the
+# snapshots dialog, the log viewer and bursts of launcher and tracker output
+DRIVER = textwrap.dedent("""\
+    import json, os, sys, threading
+    sys.path.insert(0, {repo!r})
+    import customtkinter as ctk
+    from nova_manager import NovaManagerApp
+
+    root = ctk.CTk()
+    app = NovaManagerApp(root)
+
+    def log_burst():
+        for i in range(3000):
+            app._append_log(f"[info] burst line {{i}}")
+        app._on_container_output("".join(f"tracker line {{i}}\\n" for i in range(3000)))
+
+    def finish():
+        app.stall_detector.stop()
+        print(json.dumps({{"max_stall": app.stall_detector.max_stall,
+                          "stall_count": app.stall_detector.stall_count}}), flush=True)
+        os._exit(0)
+
+    root.after(500, lambda: threading.Thread(target=app.update_ui, args=("docker_stopped",), daemon=True).start())
+    root.after(1000, app._show_snapshots_dialog)
+    root.after(1500, app._toggle_logs)
+    root.after(2000, lambda: threading.Thread(target=log_burst, daemon=True).start())
+    root.after(9000, finish)
+    root.mainloop()
+""")
+
+
+def test_usual_ui_paths_stay_within_the_stall_budget(tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text(SLOW_DOCKER.format(python=sys.executable))
+    docker.chmod(docker.stat().st_mode | stat.S_IEXEC)
+    home = tmp_path / "home"
+    (home / "nova").mkdir(parents=True)
+    (home / "nova" / ".launcher_prefs.json").write_text(json.dumps({"docker_context": "dome"}))
+
+    env = dict(os.environ, HOME=str(home), PATH=f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    env.pop("DOCKER_HOST", None)
+    result = subprocess.run(
+        [sys.executable, "-c", DRIVER.format(repo=REPO_DIR)],
+        env=env, capture_output=True, text=True, timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    stalls = json.loads(result.stdout.strip().splitlines()[-1])
+    assert stalls["max_stall"] < STALL_BUDGET, stalls
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+Phase timeline tracing for install, start and update operations.
+
+Each operation records timed phases (compose write, pull, container up,
+health ready, first dashboard 200, ...). Completed traces feed a per-host
+history of phase durations used for ETAs, and the most recent traces can be
+exported in Chrome trace format (chrome://tracing, Perfetto) to profile slow
+hosts.
+"""
+
+import json
+import os
+import socket
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import (
+    NOVA_DIR,
+    PHASE_HISTORY_FILE,
+    PHASE_HISTORY_SAMPLES,
+    PHASE_TRACES_KEPT,
+)
+from remote_host import remote_hostname
+
+_history_lock = threading.Lock()
+
+
+def _load_history() -> Dict[str, Any]:
+    try:
+        if os.path.exists(PHASE_HISTORY_FILE):
+            with open(PHASE_HISTORY_FILE, "r") as f:
+                return json.load(f)
+    except (json.JSONDecodeError, PermissionError, OSError):
+        pass
+    return {"hosts": {}, "traces": []}
+
+
+def _save_history(history: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(NOVA_DIR, exist_ok=True)
+        tmp_path = PHASE_HISTORY_FILE + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(history, f)
+        os.replace(tmp_path, PHASE_HISTORY_FILE)
+    except (PermissionError, OSError):
+        pass
+
+
+def default_host() -> str:
+    """History key for the Docker host the launcher is managing."""
+    return remote_hostname() or socket.gethostname()
+
+
+class PhaseTrace:
+    """
+    Timeline of one operation.
+
+    Phases are normally sequential: begin() closes the previous phase.
+    Phases that overlap (e.g., a snapshot running during the pull) are
+    recorded with add().
+    """
+
+    def __init__(self, operation: str, host: Optional[str] = None):
+        self.operation = operation
+        self.host = host or default_host()
+        self.started_wall = time.time()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._current: Optional[Tuple[str, float]] = None
+        self.phases: List[Dict[str, Any]] = []
+        self.finished = False
+
+    def elapsed(self) -> float:
+        """Seconds since the operation started."""
+        return time.perf_counter() - self._t0
+
+    def begin(self, name: str) -> None:
+        """Start a phase, ending the current one."""
+        with self._lock:
+            self._close_current()
+            self._current = (name, self.elapsed())
+
+    def end(self) -> None:
+        """End the current phase."""
+        with self._lock:
+            self._close_current()
+
+    def add(self, name: str, start: float, duration: float, lane: int = 2) -> None:
+        """
+        Record a phase measured elsewhere.
+
+        Args:
+            name: Phase name
+            start: Start offset in seconds from the beginning of the trace
+            duration: Duration in seconds
+            lane: Chrome-trace thread id to draw it on (1 is the main timeline)
+        """
+        with self._lock:
+            self.phases.append({"name": name, "start": start, "duration": duration, "lane": lane})
+
+    def _close_current(self) -> None:
+        if self._current is not None:
+            name, start = self._current
+            self.phases.append({"name": name, "start": start,
+                                "duration": self.elapsed() - start, "lane": 1})
+            self._current = None
+
+    def finish(self, success: bool = True) -> None:
+        """
+        End the trace and store it. Only successful runs feed the ETA history.
+
+        Args:
+            success: Whether the operation completed successfully
+        """
+        with self._lock:
+            if self.finished:
+                return
+            self._close_current()
+            self.finished = True
+            total = self.elapsed()
+
+        record = {
+            "operation": self.operation,
+            "host": self.host,
+            "started": self.started_wall,
+            "total": total,
+            "success": success,
+            "phases": self.phases,
+        }
+        with _history_lock:
+            history = _load_history()
+            history["traces"] = (history.get("traces", []) + [record])[-PHASE_TRACES_KEPT:]
+            if success:
+                samples = (history.setdefault("hosts", {})
+                           .setdefault(self.host, {})
+                           .setdefault(self.operation, {}))
+                for phase in self.phases + [{"name": "_total", "start": 0, "duration": total}]:
+                    durations = samples.setdefault(phase["name"], [])
+                    durations.append(round(phase["duration"], 3))
+                    del durations[:-PHASE_HISTORY_SAMPLES]
+            _save_history(history)
+
+
+def estimate(operation: str, phase: str = "_total", host: Optional[str] = None) -> Optional[float]:
+    """
+    Median historical duration of an operation (or one of its phases).
+
+    Args:
+        operation: Operation name ("install", "start", "update")
+        phase: Phase name, or "_total" for the whole operation
+        host: History key (defaults to this machine)
+
+    Returns:
+        Duration in seconds, or None without history
+    """
+    with _history_lock:
+        history = _load_history()
+    samples = (history.get("hosts", {}).get(host or default_host(), {})
+               .get(operation, {}).get(phase))
+    if not samples:
+        return None
+    return statistics.median(samples)
+
+
+def estimate_until(operation: str, phase: str, host: Optional[str] = None) -> Optional[float]:
+    """
+    Median historical time from the start of an operation to the end of a phase.
+
+    Args:
+        operation: Operation name
+        phase: Phase whose completion is of interest (e.g., "health_ready")
+        host: History key (defaults to this machine)
+
+    Returns:
+        Offset in seconds, or None without history
+    """
+    with _history_lock:
+        history = _load_history()
+    offsets = []
+    for trace in history.get("traces", []):
+        if (trace.get("operation") != operation or not trace.get("success")
+                or trace.get("host") != (host or default_host())):
+            continue
+        for p in trace.get("phases", []):
+            if p["name"] == phase:
+                offsets.append(p["start"] + p["duration"])
+    return statistics.median(offsets) if offsets else None
+
+
+def format_eta(seconds: float) -> str:
+    """Format an ETA for display (e.g., "about 40s", "about 2 min")."""
+    if seconds < 60:
+        return f"about {max(int(round(seconds / 5.0)) * 5, 5)}s"
+    return f"about {int(round(seconds / 60.0))} min"
+
+
+def export_chrome_trace(path: str) -> Tuple[bool, str]:
+    """
+    Write the recent traces as Chrome trace JSON.
+
+    Each operation is a process row; lane 1 holds the sequential phases and
+    lane 2 overlapping work such as snapshots.
+
+    Args:
+        path: Output file path
+
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    with _history_lock:
+        traces = _load_history().get("traces", [])
+    if not traces:
+        return False, "No traces recorded yet"
+
+    events = []
+    for pid, trace in enumerate(traces, start=1):
+        label = f"{trace['operation']} @ {trace['host']} " \
+                f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(trace['started']))}"
+        if not trace.get("success"):
+            label += " (failed)"
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}})
+        base_us = trace["started"] * 1e6
+        for phase in trace["phases"]:
+            events.append({
+                "name": phase["name"],
+                "cat": trace["operation"],
+                "ph": "X",
+                "pid": pid,
+                "tid": phase.get("lane", 1),
+                "ts": base_us + phase["start"] * 1e6,
+                "dur": phase["duration"] * 1e6,
+            })
+
+    try:
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    except (PermissionError, OSError) as e:
+        return False, f"Could not write trace: {e}"
+    return True, f"Exported {len(traces)} traces to {path}"
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Scheduling for background image update checks and pre-pulls.
+
+Checks repeat every UPDATE_CHECK_INTERVAL with random jitter, so launchers
+started at the same time do not hit Docker Hub together. New images are
+downloaded only inside the "prepull_window" pref (e.g., "09:00-17:00", local
+time; windows may wrap past midnight). Without a window, any time is fine.
+"""
+
+import random
+import time
+from typing import Optional, Tuple
+
+from config import UPDATE_CHECK_INTERVAL, UPDATE_CHECK_JITTER
+
+
+def parse_window(spec: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Parse a daily time window.
+
+    Args:
+        spec: Window as "HH:MM-HH:MM"
+
+    Returns:
+        Tuple of (start_minute, end_minute) since midnight, or None if the
+        spec is empty or malformed (meaning no restriction)
+    """
+    if not spec:
+        return None
+    try:
+        start_text, end_text = spec.split("-", 1)
+        bounds = []
+        for text in (start_text, end_text):
+            hours, minutes = text.strip().split(":", 1)
+            hours, minutes = int(hours), int(minutes)
+            if not (0 <= hours <= 24 and 0 <= minutes < 60):
+                return None
+            bounds.append((hours * 60 + minutes) % (24 * 60))
+    except ValueError:
+        return None
+    if bounds[0] == bounds[1]:
+        return None
+    return bounds[0], bounds[1]
+
+
+def seconds_until_window(spec: Optional[str], now: Optional[float] = None) -> float:
+    """
+    Time until the window opens.
+
+    Args:
+        spec: Window as "HH:MM-HH:MM" (see parse_window)
+        now: Timestamp to evaluate (defaults to the current time)
+
+    Returns:
+        0 inside the window or without one, else seconds until it opens
+    """
+    window = parse_window(spec)
+    if window is None:
+        return 0.0
+
+    local = time.localtime(now if now is not None else time.time())
+    minute_now = local.tm_hour * 60 + local.tm_min + local.tm_sec / 60.0
+    start, end = window
+    if start < end:
+        inside = start <= minute_now < end
+    else:
+        inside = minute_now >= start or minute_now < end
+    if inside:
+        return 0.0
+    return ((start - minute_now) % (24 * 60)) * 60
+
+
+def next_check_delay(
+    interval: float = UPDATE_CHECK_INTERVAL,
+    jitter: float = UPDATE_CHECK_JITTER,
+) -> float:
+    """
+    Delay before the next update check.
+
+    Args:
+        interval: Base interval in seconds
+        jitter: Maximum deviation as a fraction of the interval
+
+    Returns:
+        Interval randomized by up to +/- jitter
+    """
+    return interval * (1 + random.uniform(-jitter, jitter))
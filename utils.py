@@ -9,11 +9,16 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
 import urllib.request
 import urllib.error
 import webbrowser
 
-from config import DASHBOARD_URL, WEB_READY_TIMEOUT
+from typing import Optional
+
+from config import WEB_READY_TIMEOUT
+from remote_host import dashboard_url
 
 
 def _subprocess_flags() -> int:
@@ -41,15 +46,18 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
-def check_web_ready() -> bool:
+def check_web_ready(url: Optional[str] = None) -> bool:
     """
     Check if the Nova dashboard is responsive.
 
+    Args:
+        url: Dashboard URL to probe (defaults to the published dashboard)
+
     Returns:
         True if the dashboard returns a valid HTTP 200 response with content
     """
     try:
-        with urllib.request.urlopen(DASHBOARD_URL, timeout=WEB_READY_TIMEOUT) as response:
+        with urllib.request.urlopen(url or dashboard_url(), timeout=WEB_READY_TIMEOUT) as response:
             if response.getcode() != 200:
                 return False
             content = response.read()
@@ -58,6 +66,34 @@ def check_web_ready() -> bool:
         return False
 
 
+def wait_for_web_ready(
+    url: Optional[str] = None,
+    timeout: float = 120,
+    interval: float = 1.0,
+    stop_event: Optional[threading.Event] = None,
+) -> bool:
+    """
+    Poll a dashboard URL until it responds or the timeout expires.
+
+    Args:
+        url: Dashboard URL to probe
+        timeout: Maximum time to wait in seconds
+        interval: Delay between probes in seconds
+        stop_event: Optional event that aborts the wait when set
+
+    Returns:
+        True if the dashboard became ready within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if stop_event is not None and stop_event.is_set():
+            return False
+        if check_web_ready(url):
+            return True
+        time.sleep(interval)
+    return False
+
+
 def version_newer(remote: str, local: str) -> bool:
     """
     Compare semver strings.
@@ -83,6 +119,23 @@ def version_newer(remote: str, local: str) -> bool:
         return False
 
 
+def format_bytes(num_bytes: float) -> str:
+    """
+    Format a byte count for display.
+
+    Args:
+        num_bytes: Size in bytes
+
+    Returns:
+        Human-readable size (e.g., "1.4 GB")
+    """
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
 def sanitize_for_shell(value: str) -> str:
     """
     Sanitize a string value to prevent shell injection.
@@ -118,11 +171,12 @@ def open_dashboard() -> None:
     If the focus operation fails, the URL will still have opened - focus is a
     best-effort enhancement.
     """
+    url = dashboard_url()
     try:
         if sys.platform == "darwin":
             # macOS: Use 'open' command - respects default browser and brings to front
             subprocess.Popen(
-                ["open", DASHBOARD_URL],
+                ["open", url],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 creationflags=_subprocess_flags()
@@ -130,7 +184,7 @@ def open_dashboard() -> None:
 
         elif sys.platform == "linux":
             # Linux: Open via webbrowser, then try to bring to front with wmctrl
-            webbrowser.open(DASHBOARD_URL)
+            webbrowser.open(url)
             if shutil.which("wmctrl"):
                 subprocess.Popen(
                     ["wmctrl", "-a", "browser"],
@@ -141,7 +195,7 @@ def open_dashboard() -> None:
 
         elif sys.platform == "win32":
             # Windows: Open via webbrowser, then try to activate with PowerShell
-            webbrowser.open(DASHBOARD_URL)
+            webbrowser.open(url)
             subprocess.Popen(
                 [
                     "powershell", "-command",
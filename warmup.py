@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Dashboard warm-up after start and update.
+
+The first request after a start pays for template compilation, catalog
+loads and a cold database page cache. Once the tracker is ready, the
+launcher requests a list of dashboard URLs (the "warmup_urls" pref, paths
+or absolute URLs) so the user's first "Open Dashboard" is served warm.
+
+Each URL is fetched twice and both latencies are kept per host in
+WARMUP_HISTORY_FILE. The first fetch is not a cold-start measurement: the
+readiness checks have already loaded the main page, and other pages share
+its caches. The history tracks latency right after the tracker became
+ready, which still shows a release that is slower after starting. The plan
+stays in the background: at most WARMUP_CONCURRENCY requests are in
+flight, so the tracker's workers are never all busy with warm-up, and
+whatever is left when WARMUP_BUDGET runs out is skipped.
+"""
+
+import json
+import os
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import (
+    NOVA_DIR,
+    WARMUP_BUDGET,
+    WARMUP_CONCURRENCY,
+    WARMUP_HISTORY_FILE,
+    WARMUP_PATHS,
+    WARMUP_REQUEST_TIMEOUT,
+    WARMUP_RUNS_KEPT,
+)
+from remote_host import dashboard_url
+
+_history_lock = threading.Lock()
+
+
+def warmup_urls(paths: Optional[List[str]] = None) -> List[str]:
+    """
+    Resolve the warm-up plan to absolute URLs on the managed host.
+
+    Args:
+        paths: Entries of the "warmup_urls" pref (None for the default plan)
+
+    Returns:
+        List of URLs, in plan order without duplicates
+    """
+    base = dashboard_url()
+    entries = WARMUP_PATHS if paths is None else paths
+    return list(dict.fromkeys(urllib.parse.urljoin(base + "/", entry) for entry in entries if entry))
+
+
+def _fetch(url: str, timeout: float) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Request a URL and read the whole response.
+
+    Returns:
+        Tuple of (latency_ms, error)
+    """
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+    except urllib.error.HTTPError as e:
+        return None, f"HTTP {e.code}"
+    except Exception as e:
+        return None, str(e)
+    return (time.perf_counter() - started) * 1000, None
+
+
+def run_warmup(
+    urls: List[str],
+    budget: float = WARMUP_BUDGET,
+    concurrency: int = WARMUP_CONCURRENCY,
+    stop_event: Optional[threading.Event] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch every URL twice, a few at a time.
+
+    Args:
+        urls: URLs to warm (see warmup_urls)
+        budget: Seconds the whole plan may take
+        concurrency: Maximum requests in flight
+        stop_event: Abandon the remaining requests when set
+
+    Returns:
+        One dict per URL with url, first_ms, repeat_ms and error
+    """
+    deadline = time.monotonic() + budget
+
+    def warm(url: str) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"url": url, "first_ms": None, "repeat_ms": None, "error": None}
+        for key in ("first_ms", "repeat_ms"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (stop_event is not None and stop_event.is_set()):
+                result["error"] = "Skipped (time budget used up)"
+                break
+            result[key], result["error"] = _fetch(url, min(remaining, WARMUP_REQUEST_TIMEOUT))
+            if result["error"]:
+                break
+        return result
+
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(urls)), thread_name_prefix="warmup") as pool:
+        return list(pool.map(warm, urls))
+
+
+def _load_history() -> Dict[str, Any]:
+    try:
+        if os.path.exists(WARMUP_HISTORY_FILE):
+            with open(WARMUP_HISTORY_FILE, "r") as f:
+                return json.load(f)
+    except (json.JSONDecodeError, PermissionError, OSError):
+        pass
+    return {"runs": []}
+
+
+def _save_history(history: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(NOVA_DIR, exist_ok=True)
+        tmp_path = WARMUP_HISTORY_FILE + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(history, f)
+        os.replace(tmp_path, WARMUP_HISTORY_FILE)
+    except (PermissionError, OSError):
+        pass
+
+
+def typical_first_ms(host: str, url: str) -> Optional[float]:
+    """
+    Median first-fetch latency of a URL over the recorded runs on a host.
+
+    Args:
+        host: History key of the Docker host
+        url: Warm-up URL
+
+    Returns:
+        Milliseconds, or None without history
+    """
+    with _history_lock:
+        runs = _load_history().get("runs", [])
+    samples = [
+        entry["first_ms"]
+        for run in runs if run.get("host") == host
+        for entry in run.get("results", []) if entry.get("url") == url and entry.get("first_ms") is not None
+    ]
+    return statistics.median(samples) if samples else None
+
+
+def record_warmup(host: str, operation: str, results: List[Dict[str, Any]]) -> None:
+    """
+    Append a warm-up run to the history, keeping the last WARMUP_RUNS_KEPT.
+
+    Args:
+        host: History key of the Docker host
+        operation: What the tracker was warmed after ("start", "update", ...)
+        results: Output of run_warmup
+    """
+    with _history_lock:
+        history = _load_history()
+        runs = history.setdefault("runs", [])
+        runs.append({"ts": time.time(), "host": host, "operation": operation, "results": results})
+        del runs[:-WARMUP_RUNS_KEPT]
+        _save_history(history)